@@ -0,0 +1,95 @@
+import pandas as pd
+import streamlit as st
+from datetime import date
+
+from profiling import timed
+from purchasing_data import BASE_DIR, INVOICE_FILE, COL_SUP, COL_QTY, COL_HRG, parse_rupiah
+
+# ---------- Accounts payable: per-invoice aggregate ----------
+# purchase_invoice_summary.csv menyimpan satu baris per invoice (total, terbayar,
+# sisa). Baris ditambah saat invoice di-generate dan di-update saat ada
+# pembayaran, jadi laporan aging tidak perlu menghitung ulang baris invoice.
+
+SUMMARY_FILE = BASE_DIR / "purchase_invoice_summary.csv"
+SUMMARY_COLS = ["No Invoice", "Nama Supplier", "Tanggal Invoice", "Total Tagihan", "Terbayar", "Sisa"]
+AGING_BUCKETS = ["Current", "31-60", "61-90", "90+"]
+
+
+def invoice_date_from_id(inv_id):
+    """'INV/20260113/002' -> 2026-01-13."""
+    parts = str(inv_id).split("/")
+    return pd.to_datetime(parts[1], format="%Y%m%d", errors="coerce") if len(parts) == 3 else pd.NaT
+
+
+@timed("transform")
+def summarize_invoice_lines(df_lines):
+    df = df_lines.copy()
+    if "Terbayar" not in df.columns:
+        df["Terbayar"] = 0
+    df[COL_QTY] = pd.to_numeric(df[COL_QTY], errors="coerce").fillna(0)
+    df[COL_HRG] = df[COL_HRG].apply(parse_rupiah)
+    df["Subtotal"] = df[COL_QTY] * df[COL_HRG]
+    summary = df.groupby("No Invoice", sort=False).agg(**{
+        "Nama Supplier": (COL_SUP, "first"),
+        "Total Tagihan": ("Subtotal", "sum"),
+        "Terbayar": ("Terbayar", "first"),
+    }).reset_index()
+    summary["Tanggal Invoice"] = summary["No Invoice"].map(invoice_date_from_id).dt.strftime("%Y-%m-%d")
+    summary["Sisa"] = summary["Total Tagihan"] - summary["Terbayar"]
+    return summary[SUMMARY_COLS]
+
+
+def rebuild_summary():
+    if INVOICE_FILE.exists():
+        df_lines = pd.read_csv(INVOICE_FILE)
+        summary = summarize_invoice_lines(df_lines) if not df_lines.empty else pd.DataFrame(columns=SUMMARY_COLS)
+    else:
+        summary = pd.DataFrame(columns=SUMMARY_COLS)
+    save_summary(summary)
+    return summary
+
+
+@st.cache_data
+def load_summary():
+    if not SUMMARY_FILE.exists():
+        return rebuild_summary()
+    return pd.read_csv(SUMMARY_FILE)
+
+
+def save_summary(df):
+    df[SUMMARY_COLS].to_csv(SUMMARY_FILE, index=False)
+    load_summary.clear()
+
+
+def add_invoices(df_lines):
+    """Dipanggil setelah Generate Invoice dengan baris-baris invoice baru."""
+    new_rows = summarize_invoice_lines(df_lines)
+    summary = load_summary()
+    summary = summary[~summary["No Invoice"].isin(new_rows["No Invoice"])]
+    save_summary(pd.concat([summary, new_rows], ignore_index=True))
+
+
+def apply_payment(inv_id, amount):
+    """Dipanggil setiap ada baris baru di payment_history.csv."""
+    summary = load_summary().copy()
+    mask = summary["No Invoice"] == inv_id
+    if not mask.any():
+        return
+    summary.loc[mask, "Terbayar"] = summary.loc[mask, "Terbayar"] + amount
+    summary.loc[mask, "Sisa"] = summary.loc[mask, "Total Tagihan"] - summary.loc[mask, "Terbayar"]
+    save_summary(summary)
+
+
+def aging_report(as_of=None):
+    """Sisa hutang per supplier dalam bucket umur invoice (hari sejak tanggal invoice)."""
+    as_of = pd.Timestamp(as_of or date.today())
+    open_inv = load_summary()
+    open_inv = open_inv[open_inv["Sisa"] > 0].copy()
+    if open_inv.empty:
+        return pd.DataFrame(columns=["Nama Supplier"] + AGING_BUCKETS + ["Total"])
+    age = (as_of - pd.to_datetime(open_inv["Tanggal Invoice"], errors="coerce")).dt.days.fillna(0)
+    open_inv["Bucket"] = pd.cut(age, bins=[-float("inf"), 30, 60, 90, float("inf")], labels=AGING_BUCKETS)
+    report = open_inv.pivot_table(index="Nama Supplier", columns="Bucket", values="Sisa", aggfunc="sum", fill_value=0, observed=False)
+    report = report.reindex(columns=AGING_BUCKETS, fill_value=0)
+    report["Total"] = report.sum(axis=1)
+    return report.sort_values("Total", ascending=False).reset_index()
@@ -2,12 +2,15 @@ import streamlit as st
 import os
 import base64
 
+from profiling import rerun as profile_rerun
+
 st.set_page_config(
     page_title="Cooperative Management",
     page_icon=":material/edit:",
     layout="wide"
 )
 
+@st.cache_resource
 def get_base64_of_bin_file(bin_file):
     with open(bin_file, 'rb') as f:
         data = f.read()
@@ -63,14 +66,15 @@ div[data-testid="stSidebarResizeHandle"] {
 
 home_page = st.Page("home.py", title="Home", icon=":material/home:")
 predict_page = st.Page("predict.py", title="Prediction", icon=":material/trending_up:")
-purchasing_page = st.Page("purchasing.py", title="Puchasing", icon=":material/shopping_cart:")
+purchasing_page = st.Page("purchasing.py", title="Purchasing", icon=":material/shopping_cart:")
 sales_page = st.Page("sales.py", title="Sales", icon=":material/sell:")
 finance_page = st.Page("finance.py", title="Finance", icon=":material/payments:")
 inventory_page = st.Page("inventory.py", title="Inventory", icon=":material/inventory:")
 manufacture_page = st.Page("manufacture.py", title="Manufacture", icon=":material/factory:")
 human_page = st.Page("human.py", title="Human Capital", icon=":material/groups:")
+diagnostics_page = st.Page("diagnostics.py", title="Diagnostics", icon=":material/monitoring:")
 
-pg = st.navigation([home_page, predict_page, purchasing_page, sales_page, finance_page, inventory_page, manufacture_page, human_page])
+pg = st.navigation([home_page, predict_page, purchasing_page, sales_page, finance_page, inventory_page, manufacture_page, human_page, diagnostics_page])
 
 st.sidebar.markdown(
     """
@@ -112,4 +116,5 @@ st.sidebar.markdown(
     unsafe_allow_html=True
 )
 
-pg.run()
\ No newline at end of file
+with profile_rerun(pg.title):
+    pg.run()
@@ -0,0 +1,162 @@
+import threading
+import pandas as pd
+import streamlit as st
+from collections import defaultdict
+from datetime import date
+
+from sales_data import DATA_DIR, FILES, load_data
+
+# ---------- Accounts receivable ----------
+# CustomerLedger.csv : buku besar per customer (append-only) dengan saldo berjalan.
+# AROpenInvoices.csv : hanya invoice yang belum lunas.
+# Setiap invoice / receipt baru langsung di-posting ke kedua tabel, sehingga
+# laporan aging cukup membaca invoice yang masih terbuka.
+# Objek ledger dipakai bersama semua sesi (cache_resource): posting dikunci,
+# dan refresh() memuat ulang bila file berubah di luar proses ini.
+
+LEDGER_FILE = DATA_DIR / "CustomerLedger.csv"
+OPEN_FILE = DATA_DIR / "AROpenInvoices.csv"
+LEDGER_COLS = ["Date", "Customer", "Doc_ID", "Type", "Debit", "Credit", "Balance"]
+OPEN_COLS = ["Invoice_ID", "Customer", "Date", "Total_Bill", "Paid_Amount", "Outstanding"]
+AGING_BUCKETS = ["Current", "31-60", "61-90", "90+"]
+
+
+SOURCE_FILES = [FILES["si"], FILES["sr"]]
+
+
+def _mtimes(paths):
+    return {p.name: p.stat().st_mtime for p in paths if p.exists()}
+
+
+class ARLedger:
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.mtimes = {}
+        self._reset()
+
+    def _reset(self):
+        self.entries = defaultdict(list)
+        self.balances = {}
+        self.open = {}
+
+    def build(self):
+        """Susun ulang kedua tabel dari SalesInvoice.csv dan SalesReceipt.csv."""
+        with self.lock:
+            return self._build()
+
+    def _build(self):
+        self._reset()
+        si = load_data("si", usecols=["Invoice_ID", "Date", "Customer", "Total_Bill"])
+        sr = load_data("sr", usecols=["Receipt_ID", "Invoice_ID", "Date", "Customer", "Amount_Paid"])
+        moves = pd.concat([
+            pd.DataFrame({"Date": si["Date"], "Customer": si["Customer"], "Doc_ID": si["Invoice_ID"], "Ref": si["Invoice_ID"],
+                          "Type": "Invoice", "Debit": si["Total_Bill"], "Credit": 0.0}),
+            pd.DataFrame({"Date": sr["Date"], "Customer": sr["Customer"], "Doc_ID": sr["Receipt_ID"], "Ref": sr["Invoice_ID"],
+                          "Type": "Receipt", "Debit": 0.0, "Credit": sr["Amount_Paid"]}),
+        ], ignore_index=True).sort_values(["Date", "Type"], kind="stable")
+        moves["Balance"] = (moves["Debit"] - moves["Credit"]).groupby(moves["Customer"]).cumsum()
+        moves[LEDGER_COLS].to_csv(LEDGER_FILE, index=False)
+
+        billed = moves[moves["Type"] == "Invoice"].set_index("Ref")
+        paid = moves[moves["Type"] == "Receipt"].groupby("Ref")["Credit"].sum()
+        open_inv = pd.DataFrame({
+            "Invoice_ID": billed.index, "Customer": billed["Customer"].to_numpy(), "Date": billed["Date"].to_numpy(),
+            "Total_Bill": billed["Debit"].to_numpy(), "Paid_Amount": billed.index.map(paid).fillna(0).to_numpy(),
+        })
+        open_inv["Outstanding"] = open_inv["Total_Bill"] - open_inv["Paid_Amount"]
+        open_inv[open_inv["Outstanding"] > 0][OPEN_COLS].to_csv(OPEN_FILE, index=False)
+        return self._load()
+
+    def load(self):
+        with self.lock:
+            return self._load()
+
+    def _load(self):
+        if not LEDGER_FILE.exists() or not OPEN_FILE.exists():
+            return self._build()
+        self._reset()
+        ledger = pd.read_csv(LEDGER_FILE)
+        for row in ledger[LEDGER_COLS].to_dict("records"):
+            self.entries[row["Customer"]].append(row)
+        self.balances = ledger.groupby("Customer")["Balance"].last().to_dict()
+        self.open = {r["Invoice_ID"]: r for r in pd.read_csv(OPEN_FILE)[OPEN_COLS].to_dict("records")}
+        self.mark_synced()
+        return self
+
+    def mark_synced(self):
+        self.mtimes = _mtimes(SOURCE_FILES + [LEDGER_FILE, OPEN_FILE])
+
+    def refresh(self):
+        """SI/SR berubah di luar proses -> build ulang; hanya file ledger berubah -> load ulang."""
+        with self.lock:
+            current = _mtimes(SOURCE_FILES + [LEDGER_FILE, OPEN_FILE])
+            if current == self.mtimes:
+                return self
+            if any(current.get(p.name) != self.mtimes.get(p.name) for p in SOURCE_FILES):
+                return self._build()
+            return self._load()
+
+    # ----- posting -----
+
+    def _append(self, row):
+        self.entries[row["Customer"]].append(row)
+        self.balances[row["Customer"]] = row["Balance"]
+        pd.DataFrame([row], columns=LEDGER_COLS).to_csv(LEDGER_FILE, mode="a", header=False, index=False)
+
+    def _save_open(self):
+        pd.DataFrame(list(self.open.values()), columns=OPEN_COLS).to_csv(OPEN_FILE, index=False)
+
+    def post_invoices(self, rows):
+        """rows: iterable dict dengan Invoice_ID, Customer, Date, Total_Bill (SI sudah tersimpan)."""
+        with self.lock:
+            self._post_invoices(rows)
+            self.mark_synced()
+
+    def _post_invoices(self, rows):
+        for r in rows:
+            balance = self.balances.get(r["Customer"], 0.0) + r["Total_Bill"]
+            self._append({"Date": str(r["Date"]), "Customer": r["Customer"], "Doc_ID": r["Invoice_ID"],
+                          "Type": "Invoice", "Debit": r["Total_Bill"], "Credit": 0.0, "Balance": balance})
+            if r["Total_Bill"] > 0:
+                self.open[r["Invoice_ID"]] = {"Invoice_ID": r["Invoice_ID"], "Customer": r["Customer"], "Date": str(r["Date"]),
+                                              "Total_Bill": r["Total_Bill"], "Paid_Amount": 0.0, "Outstanding": r["Total_Bill"]}
+        self._save_open()
+
+    def post_receipt(self, receipt_id, invoice_id, customer, pay_date, amount):
+        with self.lock:
+            self._post_receipt(receipt_id, invoice_id, customer, pay_date, amount)
+            self.mark_synced()
+
+    def _post_receipt(self, receipt_id, invoice_id, customer, pay_date, amount):
+        balance = self.balances.get(customer, 0.0) - amount
+        self._append({"Date": str(pay_date), "Customer": customer, "Doc_ID": receipt_id,
+                      "Type": "Receipt", "Debit": 0.0, "Credit": amount, "Balance": balance})
+        inv = self.open.get(invoice_id)
+        if inv is not None:
+            inv["Paid_Amount"] += amount
+            inv["Outstanding"] = inv["Total_Bill"] - inv["Paid_Amount"]
+            if inv["Outstanding"] <= 0:
+                del self.open[invoice_id]
+        self._save_open()
+
+    # ----- reports -----
+
+    def statement(self, customer):
+        return pd.DataFrame(self.entries.get(customer, []), columns=LEDGER_COLS)
+
+    def aging(self, as_of=None):
+        as_of = pd.Timestamp(as_of or date.today())
+        open_inv = pd.DataFrame(list(self.open.values()), columns=OPEN_COLS)
+        if open_inv.empty:
+            return pd.DataFrame(columns=["Customer"] + AGING_BUCKETS + ["Total"])
+        age = (as_of - pd.to_datetime(open_inv["Date"], errors="coerce")).dt.days.fillna(0)
+        open_inv["Bucket"] = pd.cut(age, bins=[-float("inf"), 30, 60, 90, float("inf")], labels=AGING_BUCKETS)
+        report = open_inv.pivot_table(index="Customer", columns="Bucket", values="Outstanding", aggfunc="sum", fill_value=0, observed=False)
+        report = report.reindex(columns=AGING_BUCKETS, fill_value=0)
+        report["Total"] = report.sum(axis=1)
+        return report.sort_values("Total", ascending=False).reset_index()
+
+
+@st.cache_resource
+def get_ar_ledger():
+    return ARLedger().load()
@@ -0,0 +1,68 @@
+"""Cold start per halaman: waktu import + render pertama di proses baru.
+
+Jalankan dari folder aplikasi:  python benchmarks/bench_cold_start.py [halaman.py ...]
+Setiap halaman dijalankan lewat streamlit AppTest di subprocess terpisah, pada
+salinan folder data di direktori sementara (data asli tidak ikut berubah).
+"""
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+ROOT_DIR = APP_DIR.parent
+PAGES = ["home.py", "predict.py", "purchasing.py", "sales.py", "finance.py", "inventory.py", "manufacture.py", "human.py"]
+HEAVY_MODULES = ["xgboost", "sklearn", "scipy", "matplotlib"]
+
+
+def child(page):
+    """Dijalankan di subprocess: ukur import streamlit, render pertama, dan rerun."""
+    t0 = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    t_streamlit = time.perf_counter() - t0
+
+    sys.path.insert(0, str(Path(page).parent))
+    at = AppTest.from_file(page, default_timeout=600)
+    t0 = time.perf_counter()
+    at.run()
+    t_first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    at.run()
+    t_rerun = time.perf_counter() - t0
+    print(json.dumps({
+        "streamlit": t_streamlit, "first": t_first, "rerun": t_rerun,
+        "errors": len(at.exception),
+        "heavy": [m for m in HEAVY_MODULES if m in sys.modules],
+    }))
+
+
+def main(pages=PAGES):
+    with tempfile.TemporaryDirectory() as d:
+        copy = Path(d) / ROOT_DIR.name
+        shutil.copytree(ROOT_DIR, copy, ignore=shutil.ignore_patterns("__pycache__", ".git"))
+        app_copy = copy / APP_DIR.name
+        print(f"{'halaman':<16}{'import st':>10}{'render 1':>10}{'rerun':>10}  modul berat")
+        for page in pages:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", str(app_copy / page)],
+                cwd=app_copy, capture_output=True, text=True
+            )
+            try:
+                r = json.loads(out.stdout.strip().splitlines()[-1])
+            except (IndexError, ValueError):
+                print(f"{page:<16} gagal: {out.stderr.strip().splitlines()[-1:]}")
+                continue
+            note = ", ".join(r["heavy"]) or "-"
+            if r["errors"]:
+                note += f"  ({r['errors']} exception)"
+            print(f"{page:<16}{r['streamlit'] * 1000:>8.0f}ms{r['first'] * 1000:>8.0f}ms{r['rerun'] * 1000:>8.0f}ms  {note}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2])
+    else:
+        main(sys.argv[1:] or PAGES)
@@ -0,0 +1,55 @@
+"""Netting MRP item x periode (array) vs loop per item, plus satu run_mrp penuh.
+
+Jalankan dari folder aplikasi:  python benchmarks/bench_mrp.py [jumlah_item]
+run_mrp dijalankan pada data proyek tanpa forecast (hanya membaca file).
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from mrp import net_requirements, run_mrp
+
+
+def per_item(gross, on_hand, receipts):
+    """Netting klasik: satu item, satu periode per iterasi."""
+    planned = np.zeros_like(gross)
+    for i in range(gross.shape[0]):
+        avail = on_hand[i]
+        for t in range(gross.shape[1]):
+            avail += receipts[i, t] - gross[i, t]
+            if avail < 0:
+                planned[i, t] = -avail
+                avail = 0
+    return planned
+
+
+def main(n_items=5000, horizon=12, seed=0):
+    rng = np.random.default_rng(seed)
+    gross = rng.integers(0, 200, (n_items, horizon)).astype(float)
+    receipts = np.where(rng.random((n_items, horizon)) < 0.2, rng.integers(50, 400, (n_items, horizon)), 0).astype(float)
+    on_hand = rng.integers(0, 500, n_items).astype(float)
+
+    t0 = time.perf_counter()
+    loop = per_item(gross, on_hand, receipts)
+    t_loop = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    planned, _ = net_requirements(gross, on_hand, receipts)
+    t_array = time.perf_counter() - t0
+
+    assert np.allclose(loop, planned)
+    print(f"{n_items} item x {horizon} bulan")
+    print(f"loop per item : {t_loop * 1000:8.1f} ms")
+    print(f"array         : {t_array * 1000:8.1f} ms  ({t_loop / t_array:.0f}x)")
+
+    t0 = time.perf_counter()
+    result = run_mrp(horizon=6, use_forecast=False, wo_lead_periods=1, po_lead_periods=1)
+    t_mrp = time.perf_counter() - t0
+    print(f"run_mrp       : {t_mrp * 1000:8.1f} ms  ({len(result['work_orders'])} saran WO, {len(result['purchases'])} saran PO)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
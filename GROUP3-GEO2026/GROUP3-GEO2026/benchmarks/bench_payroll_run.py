@@ -0,0 +1,52 @@
+"""Payroll run untuk ribuan karyawan.
+
+Jalankan dari folder aplikasi:  python benchmarks/bench_payroll_run.py [jumlah_karyawan]
+"""
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from payroll_store import GAJI_COLS
+from payroll_run import TEMPLATE_AMOUNTS, compute_run, diff_run, rows_to_commit
+
+
+def make_templates(n, seed=0):
+    rng = np.random.default_rng(seed)
+    tpl = pd.DataFrame({"Nama Karyawan": [f"Karyawan {i:05d}" for i in range(n)]})
+    for col, scale in zip(TEMPLATE_AMOUNTS, [3_000_000, 500_000, 200_000, 50_000, 100_000, 100_000]):
+        tpl[col] = (rng.random(n) * scale).astype("int64")
+    tpl["Aktif"] = rng.random(n) > 0.02
+    return tpl
+
+
+def main(n=5_000, months_history=12):
+    tpl = make_templates(n)
+    history = pd.concat(
+        [compute_run(tpl, f"Month{m} 2025", "Monthly", "2025-01-01", "2025-01-01") for m in range(months_history)],
+        ignore_index=True
+    )
+
+    t0 = time.perf_counter()
+    run = compute_run(tpl, "January 2026", "Monthly", "2026-01-31", "2026-01-31")
+    diff = diff_run(run, history)
+    rows = rows_to_commit(run, diff)
+    t1 = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "db_gaji.csv"
+        history.to_csv(path, index=False)
+        t2 = time.perf_counter()
+        rows[GAJI_COLS].to_csv(path, mode="a", header=False, index=False)
+        t3 = time.perf_counter()
+
+    print(f"employees={n:,} history_rows={len(history):,} committed={len(rows):,}")
+    print(f"compute+diff: {t1 - t0:.3f}s")
+    print(f"batch append: {t3 - t2:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
@@ -0,0 +1,68 @@
+"""Material Slip: satu batch transaksi vs posting per baris.
+
+Jalankan dari folder aplikasi:  python benchmarks/bench_production_slips.py [jumlah_baris]
+File data diarahkan ke folder sementara, data asli tidak disentuh.
+"""
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import stock_ledger
+import work_orders
+import production_slips
+
+
+def redirect(tmp):
+    stock_ledger.LEDGER_FILE = tmp / "StockLedger.csv"
+    stock_ledger.ON_HAND_FILE = tmp / "StockOnHand.csv"
+    stock_ledger.SNAPSHOT_FILE = tmp / "StockSnapshot.csv"
+    work_orders.WO_FILE = production_slips.WO_FILE = tmp / "WorkOrder.csv"
+    production_slips.MATERIAL_SLIP_FILE = tmp / "MaterialSlip.csv"
+    stock_ledger._load_on_hand.clear()
+
+
+def make_lines(n_lines, n_wo=200, n_items=300, seed=0):
+    rng = np.random.default_rng(seed)
+    wo_ids = [f"WO-{i:04d}" for i in range(1, n_wo + 1)]
+    pd.DataFrame({
+        "WO_ID": wo_ids, "Date": "2026-01-01", "Product": "Seragam SD", "Qty": 100,
+        "Due_Date": "2026-02-01", "Status": "Released",
+    }).to_csv(work_orders.WO_FILE, index=False)
+    return pd.DataFrame({
+        "WO_ID": rng.choice(wo_ids, n_lines),
+        "Component": [f"Item {i:04d}" for i in rng.integers(0, n_items, n_lines)],
+        "Qty": rng.integers(1, 20, n_lines).astype(float),
+    })
+
+
+def main(n_lines=2000):
+    with tempfile.TemporaryDirectory() as d:
+        redirect(Path(d))
+        lines = make_lines(n_lines)
+        t0 = time.perf_counter()
+        for i in range(len(lines)):
+            production_slips.post_material_issue(lines.iloc[i:i + 1], "2026-01-15")
+        t_row = time.perf_counter() - t0
+        on_hand_row = stock_ledger.load_on_hand().set_index("Item")["Qty"].sort_index()
+
+    with tempfile.TemporaryDirectory() as d:
+        redirect(Path(d))
+        lines = make_lines(n_lines)
+        t0 = time.perf_counter()
+        production_slips.post_material_issue(lines, "2026-01-15")
+        t_batch = time.perf_counter() - t0
+        on_hand_batch = stock_ledger.load_on_hand().set_index("Item")["Qty"].sort_index()
+
+    assert np.allclose(on_hand_row.to_numpy(), on_hand_batch.to_numpy())
+    print(f"{n_lines} baris material slip")
+    print(f"per baris : {t_row * 1000:9.1f} ms")
+    print(f"batch     : {t_batch * 1000:9.1f} ms  ({t_row / t_batch:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,74 @@
+"""Latency rerun per tab, untuk membandingkan sebelum/sesudah tab ber-fragment.
+
+Jalankan dari folder aplikasi:
+    python benchmarks/bench_reruns.py                     # kode sekarang
+    python benchmarks/bench_reruns.py --baseline <rev>    # halaman dari commit lain (mis. sebelum perubahan)
+Setiap halaman dijalankan lewat AppTest pada salinan data di direktori sementara.
+Tab aktif dipilih lewat session_state; pada baseline (st.tabs) semua tab selalu dirender.
+"""
+import ast
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+ROOT_DIR = APP_DIR.parent
+PAGES = {
+    "predict.py": "predict_tab", "purchasing.py": "purchasing_tab", "sales.py": "sales_tab",
+    "finance.py": "finance_tab", "inventory.py": "inventory_tab", "manufacture.py": "manufacture_tab",
+    "human.py": "human_tab",
+}
+RUNS = 3
+
+
+def tab_labels(path):
+    """Label tab dari TAB_LABELS = [...] atau tabs = st.tabs([...])."""
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", "") in ("TAB_LABELS", "tabs"):
+            value = node.value.args[0] if isinstance(node.value, ast.Call) else node.value
+            return [e.value for e in value.elts]
+    return []
+
+
+def checkout_baseline(app_copy, rev):
+    rel = APP_DIR.relative_to(Path(subprocess.check_output(["git", "rev-parse", "--show-toplevel"], cwd=APP_DIR, text=True).strip()))
+    for page in PAGES:
+        src = subprocess.check_output(["git", "show", f"{rev}:{(rel / page).as_posix()}"], cwd=APP_DIR)
+        (app_copy / page).write_bytes(src)
+
+
+def measure(page_path, key, label):
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(str(page_path), default_timeout=600)
+    at.session_state[key] = label
+    at.run()
+    times = []
+    for _ in range(RUNS):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    return min(times), len(at.exception)
+
+
+def main(baseline=None):
+    with tempfile.TemporaryDirectory() as d:
+        copy = Path(d) / ROOT_DIR.name
+        shutil.copytree(ROOT_DIR, copy, ignore=shutil.ignore_patterns("__pycache__", ".git"))
+        app_copy = copy / APP_DIR.name
+        if baseline:
+            checkout_baseline(app_copy, baseline)
+        sys.path.insert(0, str(app_copy))
+        print(f"{'halaman':<16}{'tab':<26}{'rerun':>10}")
+        for page, key in PAGES.items():
+            for label in tab_labels(app_copy / page):
+                t, errors = measure(app_copy / page, key, label)
+                note = f"  ({errors} exception)" if errors else ""
+                print(f"{page:<16}{label:<26}{t * 1000:>8.0f}ms{note}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(args[1] if args[:1] == ["--baseline"] and len(args) > 1 else None)
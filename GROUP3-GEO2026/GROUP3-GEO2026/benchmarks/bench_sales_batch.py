@@ -0,0 +1,88 @@
+"""Batch DO/SI vs jalur per-klik lama.
+
+Jalankan dari folder aplikasi:  python benchmarks/bench_sales_batch.py [jumlah_order]
+"""
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from sales_batch import batch_delivery_orders, batch_sales_invoices
+
+
+def make_orders(n_orders, lines_per_order=3, seed=0):
+    rng = np.random.default_rng(seed)
+    n = n_orders * lines_per_order
+    qty = rng.integers(1, 100, n)
+    price = rng.integers(20, 200, n) * 1000.0
+    return pd.DataFrame({
+        "Order_ID": np.repeat([f"SO-{i:03d}" for i in range(1, n_orders + 1)], lines_per_order),
+        "Date": "2026-01-31",
+        "Customer": np.repeat([f"Sekolah {i % 300:03d}" for i in range(n_orders)], lines_per_order),
+        "Item": rng.choice(["Seragam SD", "Seragam SMP", "Batik"], n),
+        "Qty": qty, "Price": price, "Total": qty * price, "Status": "Pending",
+    })
+
+
+def per_click(tmp, so_ids):
+    """Tiru alur lama: baca file, tambah satu dokumen, tulis ulang dua file, untuk setiap order."""
+    so_path, do_path, si_path = tmp / "so.csv", tmp / "do.csv", tmp / "si.csv"
+    for so_id in so_ids:
+        df_so = pd.read_csv(so_path)
+        items = df_so[df_so["Order_ID"] == so_id]
+        summary = ", ".join([f"{row['Item']} ({row['Qty']})" for _, row in items.iterrows()])
+        df_do = pd.read_csv(do_path)
+        row = pd.DataFrame([{"DO_ID": f"DO-{len(df_do) + 1:03d}", "Order_ID": so_id, "Date": "2026-01-31",
+                             "Customer": items["Customer"].iloc[0], "Items_Summary": summary, "Status": "Shipped"}])
+        pd.concat([df_do, row], ignore_index=True).to_csv(do_path, index=False)
+        df_so.loc[df_so["Order_ID"] == so_id, "Status"] = "Delivered"
+        df_so.to_csv(so_path, index=False)
+    for do_id in pd.read_csv(do_path)["DO_ID"]:
+        df_so, df_do, df_si = pd.read_csv(so_path), pd.read_csv(do_path), pd.read_csv(si_path)
+        do_row = df_do[df_do["DO_ID"] == do_id].iloc[0]
+        total = df_so[df_so["Order_ID"] == do_row["Order_ID"]]["Total"].sum()
+        row = pd.DataFrame([{"Invoice_ID": f"INV-{len(df_si) + 1:03d}", "DO_ID": do_id, "Date": "2026-01-31",
+                             "Customer": do_row["Customer"], "Total_Bill": total, "Paid_Amount": 0, "Status": "Unpaid"}])
+        pd.concat([df_si, row], ignore_index=True).to_csv(si_path, index=False)
+        df_do.loc[df_do["DO_ID"] == do_id, "Status"] = "Invoiced"
+        df_do.to_csv(do_path, index=False)
+
+
+def batch(tmp, so_ids):
+    so_path, do_path, si_path, dol_path = tmp / "so.csv", tmp / "do.csv", tmp / "si.csv", tmp / "dol.csv"
+    df_so, df_do, df_si, df_dol = pd.read_csv(so_path), pd.read_csv(do_path), pd.read_csv(si_path), pd.read_csv(dol_path)
+    df_do, df_so, df_dol, new_do = batch_delivery_orders(df_so, df_do, df_dol, so_ids, "2026-01-31")
+    df_si, df_do, _ = batch_sales_invoices(df_so, df_do, df_si, df_dol, new_do["DO_ID"], "2026-01-31")
+    df_dol.to_csv(dol_path, index=False)
+    df_so.to_csv(so_path, index=False)
+    df_do.to_csv(do_path, index=False)
+    df_si.to_csv(si_path, index=False)
+
+
+def run(fn, df_so):
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        df_so.to_csv(tmp / "so.csv", index=False)
+        pd.DataFrame(columns=["DO_ID", "Order_ID", "Date", "Customer", "Items_Summary", "Status"]).to_csv(tmp / "do.csv", index=False)
+        pd.DataFrame(columns=["Invoice_ID", "DO_ID", "Date", "Customer", "Total_Bill", "Paid_Amount", "Status"]).to_csv(tmp / "si.csv", index=False)
+        pd.DataFrame(columns=["DO_ID", "Order_ID", "Line_No", "Item", "Qty"]).to_csv(tmp / "dol.csv", index=False)
+        t0 = time.perf_counter()
+        fn(tmp, df_so["Order_ID"].unique())
+        return time.perf_counter() - t0
+
+
+def main(n_orders=300):
+    df_so = make_orders(n_orders)
+    t_click = run(per_click, df_so)
+    t_batch = run(batch, df_so)
+    print(f"orders={n_orders:,}")
+    print(f"per-click: {t_click:.3f}s  ({n_orders / t_click:,.0f} orders/s)")
+    print(f"batch:     {t_batch:.3f}s  ({n_orders / t_batch:,.0f} orders/s)  speedup x{t_click / t_batch:,.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,49 @@
+"""Throughput bulk import Sales Order.
+
+Jalankan dari folder aplikasi:  python benchmarks/bench_sales_import.py [jumlah_baris]
+"""
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from sales_import import prepare_import
+
+
+def make_lines(n, n_customers=500, error_rate=0.01, seed=0):
+    rng = np.random.default_rng(seed)
+    customers = [f"Sekolah {i:04d}" for i in range(n_customers)]
+    df = pd.DataFrame({
+        "Customer": rng.choice(customers, n),
+        "Date": pd.Timestamp("2026-01-01") + pd.to_timedelta(rng.integers(0, 30, n), unit="D"),
+        "Item": rng.choice(["Seragam SD", "Seragam SMP", "Seragam SMA", "Batik", "Topi"], n),
+        "Qty": rng.integers(1, 200, n),
+        "Price": rng.integers(20, 200, n) * 1000,
+    })
+    bad = rng.random(n) < error_rate
+    df.loc[bad, "Qty"] = 0
+    return df, customers
+
+
+def main(n=100_000):
+    df, customers = make_lines(n)
+    df_so = pd.DataFrame(columns=["Order_ID", "Date", "Customer", "Item", "Qty", "Price", "Total", "Status"])
+
+    t0 = time.perf_counter()
+    new_rows, errors = prepare_import(df, customers, df_so)
+    t1 = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        pd.concat([df_so, new_rows], ignore_index=True).to_csv(Path(tmp) / "SalesOrder.csv", index=False)
+    t2 = time.perf_counter()
+
+    print(f"lines={n:,} valid={len(new_rows):,} errors={len(errors):,} orders={new_rows['Order_ID'].nunique():,}")
+    print(f"validate+allocate: {t1 - t0:.3f}s  ({n / (t1 - t0):,.0f} lines/s)")
+    print(f"single write:      {t2 - t1:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,64 @@
+"""Scheduler Process Stages: jadwal penuh vs jadwal ulang incremental.
+
+Jalankan dari folder aplikasi:  python benchmarks/bench_scheduler.py [jumlah_wo]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scheduler import STAGES, StageScheduler
+
+
+def make_work_orders(n_wo, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "WO_ID": [f"WO-{i:05d}" for i in range(1, n_wo + 1)],
+        "Product": rng.choice(["Seragam SD", "Seragam SMP", "Batik", "Jaket"], n_wo),
+        "Qty": rng.integers(10, 300, n_wo).astype(float),
+        "Due_Date": (pd.Timestamp("2026-01-01") + pd.to_timedelta(rng.integers(0, 180, n_wo), unit="D")).astype(str),
+        "Status": "Released",
+    })
+
+
+def make_lanes(sizes=(8, 40, 6, 10)):
+    return {stage: [(f"{stage} {i + 1}", f"Operator {stage} {i + 1}") for i in range(n)] for stage, n in zip(STAGES, sizes)}
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main(n_wo=2000):
+    wo = make_work_orders(n_wo)
+    sched = StageScheduler({}, make_lanes(), "2026-01-01")
+    _, t_full = timed(sched.schedule, wo)
+    n_ops = sum(len(ops) for ops in sched.ops)
+
+    # ubah satu WO di tengah antrian prioritas
+    changed = wo.copy()
+    mid = changed.sort_values(["Due_Date", "WO_ID"]).index[n_wo // 2]
+    changed.loc[mid, "Qty"] += 50
+    n_mid, t_mid = timed(sched.update, changed)
+
+    # WO baru dengan due date paling akhir
+    added = pd.concat([changed, make_work_orders(1, seed=1).assign(WO_ID="WO-NEW", Due_Date="2026-12-31")], ignore_index=True)
+    n_tail, t_tail = timed(sched.update, added)
+
+    check = StageScheduler({}, make_lanes(), "2026-01-01")
+    check.schedule(added)
+    assert check.table().equals(sched.table())
+
+    print(f"{n_wo} WO, {n_ops} operasi")
+    print(f"jadwal penuh           : {t_full * 1000:8.1f} ms")
+    print(f"ubah 1 WO (tengah)     : {t_mid * 1000:8.1f} ms  ({n_mid} WO dijadwalkan ulang)")
+    print(f"tambah 1 WO (akhir)    : {t_tail * 1000:8.1f} ms  ({n_tail} WO dijadwalkan ulang)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,158 @@
+"""Suite benchmark end-to-end di atas data sintetis (benchmarks/synth_data.py).
+
+Jalankan dari folder aplikasi:  python benchmarks/bench_suite.py [n ...] [--core]
+Default n = 1000 10000 100000 (10^6 bisa, tapi generate + GEO_data.xlsx lama).
+Per skenario (n) proyek disalin ke folder sementara, datanya diganti data
+sintetis, lalu diukur latency & peak memory (tracemalloc) untuk:
+  - fungsi inti: load_data (purchasing & sales), run_forecast, predict_jumlah
+  - setiap halaman lewat AppTest (render pertama + rerun), --core untuk melewati
+Tiap kasus dijalankan di subprocess baru. Hasil ditambahkan ke
+benchmarks/results.csv (satu baris per kasus) dan dibandingkan dengan hasil
+terakhir untuk n & kasus yang sama.
+"""
+import sys
+import json
+import time
+import shutil
+import tempfile
+import tracemalloc
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+BENCH_DIR = Path(__file__).resolve().parent
+APP_DIR = BENCH_DIR.parent
+ROOT_DIR = APP_DIR.parent
+RESULTS_FILE = BENCH_DIR / "results.csv"
+RESULT_COLS = ["Timestamp", "Commit", "N", "Case", "Seconds", "Peak_MB", "Errors"]
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+sys.path.insert(0, str(BENCH_DIR))
+from bench_cold_start import PAGES
+
+
+def measure(fn):
+    """(detik, peak MB) satu panggilan fn."""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        fn()
+    finally:
+        seconds = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def emit(case, seconds, peak, errors=0):
+    print(json.dumps({"Case": case, "Seconds": seconds, "Peak_MB": peak, "Errors": errors}), flush=True)
+
+
+def child_core(app):
+    """Subprocess: fungsi inti pada salinan proyek di app."""
+    sys.path.insert(0, str(app))
+    import purchasing_data
+    import sales_data
+    import forecast
+    import model
+
+    emit("load_data purchasing", *measure(
+        lambda: [purchasing_data.load_data(purchasing_data.po_path(c)) for c in purchasing_data.po_files]))
+    emit("load_data sales", *measure(lambda: [sales_data.load_data(k) for k in sales_data.FILES]))
+
+    geo = pd.read_excel(model.FILE_PATH)
+    emit("run_forecast", *measure(lambda: forecast.run_forecast(geo, 4)))
+    emit("predict_jumlah (train)", *measure(lambda: model.predict_jumlah(100, 50000)))
+    emit("predict_jumlah", *measure(lambda: model.predict_jumlah(100, 50000)))
+
+
+def child_page(app, page):
+    """Subprocess: satu halaman lewat AppTest, render pertama lalu rerun."""
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, str(app))
+    at = AppTest.from_file(str(app / page), default_timeout=1800)
+    emit(f"page {page}", *measure(at.run), len(at.exception))
+    emit(f"page {page} rerun", *measure(at.run), len(at.exception))
+
+
+def run_child(label, args, cwd):
+    out = subprocess.run([sys.executable, __file__, *args], cwd=cwd, capture_output=True, text=True)
+    rows = []
+    for line in out.stdout.splitlines():
+        try:
+            rows.append(json.loads(line))
+        except ValueError:
+            continue
+    if out.returncode != 0:
+        err = out.stderr.strip().splitlines()[-1:] or ["?"]
+        rows.append({"Case": label, "Seconds": None, "Peak_MB": None, "Errors": err[0]})
+    return rows
+
+
+def git_commit():
+    out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR, capture_output=True, text=True)
+    return out.stdout.strip()
+
+
+def load_results():
+    if not RESULTS_FILE.exists():
+        return pd.DataFrame(columns=RESULT_COLS)
+    return pd.read_csv(RESULTS_FILE)
+
+
+def report(rows, previous):
+    """Cetak hasil + selisih terhadap run terakhir untuk N & Case yang sama."""
+    last = previous.dropna(subset=["Seconds"]).drop_duplicates(["N", "Case"], keep="last").set_index(["N", "Case"])
+    for r in rows:
+        if r["Seconds"] is None:
+            print(f"  {r['Case']:<34} gagal: {r['Errors']}")
+            continue
+        note = ""
+        if (r["N"], r["Case"]) in last.index:
+            before = float(last.loc[(r["N"], r["Case"]), "Seconds"])
+            note = f"  ({(r['Seconds'] / before - 1) * 100:+.0f}% vs {last.loc[(r['N'], r['Case']), 'Commit']})" if before else ""
+        if r["Errors"]:
+            note += f"  ({r['Errors']} exception)"
+        print(f"  {r['Case']:<34}{r['Seconds'] * 1000:>10.0f} ms{r['Peak_MB']:>9.1f} MB{note}")
+
+
+def main(sizes=DEFAULT_SIZES, pages=True):
+    # Di-import di sini saja: synth_data memasang folder aplikasi asli di
+    # sys.path, subprocess child harus mengimpor modul dari salinannya.
+    from synth_data import generate
+
+    previous = load_results()
+    commit, stamp = git_commit(), datetime.now().isoformat(timespec="seconds")
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as d:
+            copy = Path(d) / ROOT_DIR.name
+            shutil.copytree(ROOT_DIR, copy, ignore=shutil.ignore_patterns("__pycache__", ".git"))
+            app_copy = copy / APP_DIR.name
+            t0 = time.perf_counter()
+            generate(copy, n)
+            print(f"n = {n}  (generate {time.perf_counter() - t0:.1f} s)")
+
+            rows = run_child("core", ["--child-core", str(app_copy)], app_copy)
+            if pages:
+                for page in PAGES:
+                    rows += run_child(f"page {page}", ["--child-page", str(app_copy), page], app_copy)
+
+        rows = [{"Timestamp": stamp, "Commit": commit, "N": n, **r} for r in rows]
+        report(rows, previous)
+        pd.DataFrame(rows, columns=RESULT_COLS).to_csv(
+            RESULTS_FILE, mode="a", header=not RESULTS_FILE.exists(), index=False
+        )
+    print(f"hasil ditambahkan ke {RESULTS_FILE}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child-core"]:
+        child_core(Path(sys.argv[2]))
+    elif sys.argv[1:2] == ["--child-page"]:
+        child_page(Path(sys.argv[2]), sys.argv[3])
+    else:
+        args = [a for a in sys.argv[1:] if a != "--core"]
+        main([int(a) for a in args] or DEFAULT_SIZES, pages="--core" not in sys.argv[1:])
@@ -0,0 +1,376 @@
+"""Generator data sintetis yang saling terhubung untuk benchmark.
+
+Jalankan dari folder aplikasi:  python benchmarks/synth_data.py <folder_tujuan> [n]
+<folder_tujuan> adalah salinan folder root proyek (berisi folder aplikasi);
+file data di dalamnya ditimpa. n = jumlah baris Sales Order, tabel lain
+diskalakan dari n (10^3 s/d 10^6):
+
+  Customer -> SO -> DO (+ DeliveryOrderLine) -> SI -> SR
+  Item + Supplier -> PO (8 kategori) -> purchase_invoice -> payment_history
+  db_karyawan -> db_gaji, OtherPayment / OtherDeposit, BOM + WorkOrder,
+  StockLedger + StockOnHand, GEO_data.xlsx
+
+File turunan (ledger AR, ringkasan AP, KPI, Supplier Master, snapshot stok)
+dihapus supaya dibangun ulang oleh aplikasi dari data baru.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+from sales_data import COLUMNS as SALES_COLS
+from purchasing_data import po_files, sup_files, STANDARD_COLS, COL_SUP, COL_ALM
+from payroll_store import KARYAWAN_COLS, GAJI_COLS
+from item_master import ITEM_COLS
+from stock_ledger import LEDGER_COLS, DEFAULT_WAREHOUSE
+from bom import BOM_COLS
+from work_orders import WO_COLS
+from finance_data import ACCOUNTS
+
+START = pd.Timestamp("2024-01-01")
+DAYS = 1000
+EXCEL_MAX_ROWS = 1_048_575
+
+PRODUCTS = {
+    "Seragam SD": 85000, "Seragam SMP": 95000, "Seragam SMA": 110000,
+    "Kaos Olahraga": 60000, "Kemeja Batik": 150000, "Jaket Almamater": 175000,
+}
+MATERIAL_CATEGORIES = ["Bahan Baku Utama (Kain)", "Bahan Pendukung", "ATK"]
+MATERIAL_BASE = {
+    "Bahan Baku Utama (Kain)": ("Kain", "meter", 45000),
+    "Bahan Pendukung": ("Kancing", "pcs", 1500),
+    "ATK": ("Kertas", "rim", 50000),
+}
+SERVICE_BASE = {
+    "Jasa Bordir": ("Bordir Logo", "pcs", 7500),
+    "Jasa Printing": ("Printing", "pcs", 5000),
+    "Jasa DTF Sablon": ("Sablon DTF", "pcs", 9000),
+    "Jasa Sublim": ("Sublim", "meter", 20000),
+    "Jasa Distribusi": ("Pengiriman", "trip", 250000),
+}
+POSITIONS = ["Penjahit", "Pemotong", "Bordir", "Finishing", "Admin", "Gudang"]
+PAYMENT_METHODS = ["Transfer Bank", "Cash", "Giro"]
+
+
+def _dates(rng, size, lo=0, hi=DAYS):
+    return START + pd.to_timedelta(rng.integers(lo, hi, size), unit="D")
+
+
+def _ids(prefix, n, width=6):
+    return [f"{prefix}-{i:0{width}d}" for i in range(1, n + 1)]
+
+
+def _sizes(n):
+    return {
+        "customers": max(10, n // 50),
+        "orders": max(1, n // 3),
+        "items": max(20, n // 100),
+        "suppliers": max(3, n // 2000),
+        "po_lines": max(8, n // 8),
+        "invoice_lines": max(8, n // 4),
+        "employees": max(5, n // 200),
+        "cash": max(10, n // 4),
+        "work_orders": max(5, n // 100),
+        "geo": min(max(100, n), EXCEL_MAX_ROWS),
+    }
+
+
+def sales_chain(rng, n, size):
+    customers = pd.DataFrame({
+        "Nama Customer": [f"Customer {i:05d}" for i in range(1, size["customers"] + 1)],
+        "Contact Info": [f"08{i:010d}" for i in rng.integers(1, 10**10, size["customers"])],
+    })
+
+    n_orders = size["orders"]
+    order_no = np.sort(rng.integers(0, n_orders, n))
+    order_ids = np.array(_ids("SO", n_orders))
+    order_date = _dates(rng, n_orders, hi=DAYS - 30)
+    order_cust = customers["Nama Customer"].to_numpy()[rng.integers(0, len(customers), n_orders)]
+    delivered = rng.random(n_orders) < 0.7
+
+    product = np.array(list(PRODUCTS))[rng.integers(0, len(PRODUCTS), n)]
+    price = pd.Series(product).map(PRODUCTS).to_numpy() * rng.uniform(0.9, 1.2, n).round(2)
+    qty = rng.integers(1, 200, n)
+    so = pd.DataFrame({
+        "Order_ID": order_ids[order_no], "Date": order_date[order_no].strftime("%Y-%m-%d"),
+        "Customer": order_cust[order_no], "Item": product, "Qty": qty,
+        "Price": price.round(0), "Total": (qty * price.round(0)),
+        "Status": np.where(delivered[order_no], "Delivered", "Pending"),
+    })[SALES_COLS["so"]]
+
+    # Satu DO per SO yang sudah terkirim, berisi semua baris SO tsb.
+    do_orders = np.flatnonzero(delivered)
+    do_ids = np.array(_ids("DO", len(do_orders)))
+    do_of_order = np.full(n_orders, "", dtype=object)
+    do_of_order[do_orders] = do_ids
+    lines = so[delivered[order_no]].assign(DO_ID=do_of_order[order_no[delivered[order_no]]])
+    dol = lines.assign(Line_No=lines.groupby("DO_ID").cumcount() + 1)[SALES_COLS["dol"]]
+
+    do_date = order_date[do_orders] + pd.to_timedelta(rng.integers(0, 14, len(do_orders)), unit="D")
+    summary = (lines["Item"] + " (" + lines["Qty"].astype(str) + ")").groupby(lines["DO_ID"], sort=False).agg(", ".join)
+    invoiced = rng.random(len(do_orders)) < 0.8
+    do = pd.DataFrame({
+        "DO_ID": do_ids, "Order_ID": order_ids[do_orders], "Date": do_date.strftime("%Y-%m-%d"),
+        "Customer": order_cust[do_orders], "Items_Summary": summary.reindex(do_ids).to_numpy(),
+        "Status": np.where(invoiced, "Invoiced", "Shipped"),
+    })
+
+    bills = lines.groupby("DO_ID", sort=False)["Total"].sum().reindex(do_ids).to_numpy()[invoiced]
+    inv_ids = np.array(_ids("INV", len(bills)))
+    inv_date = do_date[invoiced] + pd.to_timedelta(rng.integers(0, 7, len(bills)), unit="D")
+    state = rng.choice(["Paid", "Partial", "Unpaid"], len(bills), p=[0.6, 0.2, 0.2])
+    paid = np.select([state == "Paid", state == "Partial"], [bills, (bills * rng.uniform(0.1, 0.9, len(bills))).round(0)], 0)
+    si = pd.DataFrame({
+        "Invoice_ID": inv_ids, "DO_ID": do_ids[invoiced], "Date": inv_date.strftime("%Y-%m-%d"),
+        "Customer": order_cust[do_orders][invoiced], "Total_Bill": bills, "Paid_Amount": paid, "Status": state,
+    })
+
+    has_receipt = paid > 0
+    sr = pd.DataFrame({
+        "Receipt_ID": _ids("RCP", int(has_receipt.sum())), "Invoice_ID": inv_ids[has_receipt],
+        "Date": (inv_date[has_receipt] + pd.to_timedelta(rng.integers(0, 30, int(has_receipt.sum())), unit="D")).strftime("%Y-%m-%d"),
+        "Customer": si["Customer"].to_numpy()[has_receipt],
+        "Payment_Method": rng.choice(PAYMENT_METHODS, int(has_receipt.sum())),
+        "Amount_Paid": paid[has_receipt], "Notes": np.where(state[has_receipt] == "Paid", "Lunas", "Sebagian"),
+    })
+    return {"customer": customers, "so": so, "do": do, "si": si, "sr": sr, "dol": dol}
+
+
+def item_master(rng, size):
+    cats = np.array(MATERIAL_CATEGORIES)[np.arange(size["items"]) % len(MATERIAL_CATEGORIES)]
+    base = [MATERIAL_BASE[c] for c in cats]
+    return pd.DataFrame({
+        "Item Name": [f"{b[0]} {i:05d}" for i, b in enumerate(base, 1)],
+        "Item Code": _ids("ITM", size["items"], 5),
+        "Item Type": np.where(cats == "ATK", "Non-Inventory", "Inventory"),
+        "Qty": 1, "Unit": [b[1] for b in base],
+        "_Kategori": cats, "_Harga": [b[2] for b in base],
+    })
+
+
+def purchasing(rng, size, items):
+    """Supplier + baris PO per kategori, dan baris invoice / pembayaran yang sudah diterima."""
+    suppliers, po, invoice_lines = {}, {}, []
+    for cat in po_files:
+        names = [f"{cat.split()[-1].strip('()')} Supplier {i:04d}" for i in range(1, size["suppliers"] + 1)]
+        suppliers[cat] = pd.DataFrame({COL_SUP: names, COL_ALM: [f"Jl. Industri No. {i}" for i in range(1, len(names) + 1)]})
+        if cat in MATERIAL_BASE:
+            pool = items[items["_Kategori"] == cat]
+            goods, units, prices = pool["Item Name"].to_numpy(), pool["Unit"].to_numpy(), pool["_Harga"].to_numpy()
+        else:
+            label, unit, price = SERVICE_BASE[cat]
+            goods = np.array([f"{label} {i:03d}" for i in range(1, 51)])
+            units, prices = np.full(len(goods), unit), np.full(len(goods), price)
+
+        for part, n_rows in (("po", size["po_lines"] // len(po_files)), ("inv", size["invoice_lines"] // len(po_files))):
+            n_rows = max(1, n_rows)
+            pick = rng.integers(0, len(goods), n_rows)
+            qty = rng.integers(1, 500, n_rows)
+            df = pd.DataFrame({
+                STANDARD_COLS[0]: _dates(rng, n_rows).strftime("%Y-%m-%d"),
+                STANDARD_COLS[1]: rng.choice(names, n_rows),
+                STANDARD_COLS[2]: goods[pick],
+                STANDARD_COLS[3]: pd.Series(qty).astype(str).to_numpy() + " " + units[pick],
+                STANDARD_COLS[4]: (prices[pick] * rng.uniform(0.8, 1.3, n_rows)).round(-2).astype("int64"),
+                STANDARD_COLS[5]: "",
+                STANDARD_COLS[6]: rng.choice(["Pending", "Diterima"], n_rows, p=[0.6, 0.4]) if part == "po" else "Diterima",
+            })
+            if part == "po":
+                po[cat] = df
+            else:
+                invoice_lines.append(df)
+
+    inv = pd.concat(invoice_lines, ignore_index=True).sort_values([STANDARD_COLS[0], COL_SUP], kind="stable")
+    # Satu invoice per tanggal & supplier, nomor urut per tanggal (format INV/YYYYMMDD/NNN)
+    day = inv[STANDARD_COLS[0]].str.replace("-", "")
+    group = inv.groupby([STANDARD_COLS[0], COL_SUP], sort=False).ngroup()
+    first = ~group.duplicated()
+    seq = first.groupby(day).cumsum()
+    inv["No Invoice"] = "INV/" + day + "/" + seq.astype(str).str.zfill(3)
+    subtotal = pd.to_numeric(inv[STANDARD_COLS[3]].str.split().str[0]) * inv[STANDARD_COLS[4]]
+    total = subtotal.groupby(inv["No Invoice"]).transform("sum")
+    share = pd.Series(rng.choice([1.0, 0.5, 0.0], inv["No Invoice"].nunique(), p=[0.5, 0.2, 0.3]),
+                      index=inv["No Invoice"].unique())
+    inv["Terbayar"] = (total * inv["No Invoice"].map(share)).round(0).astype("int64")
+
+    paid = inv[first.to_numpy() & (inv["Terbayar"] > 0).to_numpy()]
+    history = pd.DataFrame({
+        "Tanggal Bayar": paid[STANDARD_COLS[0]].to_numpy(), "Nama Supplier": paid[COL_SUP].to_numpy(),
+        "Jumlah Dibayar": paid["Terbayar"].to_numpy(), "Metode": rng.choice(["Cash", "Transfer"], len(paid)),
+        "No Invoice": paid["No Invoice"].to_numpy(),
+    })
+    last = inv.iloc[-1]
+    log = f"{last['No Invoice'].split('/')[1]}|{int(seq.iloc[-1])}"
+    return suppliers, po, inv.reset_index(drop=True), history, log
+
+
+def payroll(rng, size):
+    n_emp = size["employees"]
+    karyawan = pd.DataFrame({
+        "Nama Lengkap": [f"Karyawan {i:05d}" for i in range(1, n_emp + 1)],
+        "No KTP": [f"{k:016d}" for k in rng.integers(10**15, 10**16 - 1, n_emp)],
+        "Posisi": rng.choice(POSITIONS, n_emp),
+        "Kontak": [f"08{k:010d}" for k in rng.integers(1, 10**10, n_emp)],
+        "Tanggal Masuk": _dates(rng, n_emp, hi=365).strftime("%Y-%m-%d"),
+        "Alamat": "Bandung",
+    })[KARYAWAN_COLS]
+
+    months = pd.date_range(START, periods=12, freq="MS")
+    emp = np.tile(karyawan["Nama Lengkap"].to_numpy(), len(months))
+    month = months.repeat(n_emp)
+    n_rows = len(emp)
+    pokok = rng.integers(30, 60, n_rows) * 100000
+    tunj = rng.integers(0, 10, n_rows) * 50000
+    komisi = rng.integers(0, 5, n_rows) * 50000
+    potongan = rng.integers(0, 3, n_rows) * 25000
+    iuran = (pokok * 0.02).astype("int64")
+    tabungan = np.full(n_rows, 50000)
+    gross, deduction = pokok + tunj + komisi, potongan + iuran + tabungan
+    gaji = pd.DataFrame({
+        "Periode": month.strftime("%B %Y"), "Tipe": "Monthly",
+        "Tgl Input": (month + pd.Timedelta(days=24)).strftime("%Y-%m-%d"),
+        "Jatuh Tempo": (month + pd.Timedelta(days=27)).strftime("%Y-%m-%d"),
+        "Nama Karyawan": emp, "Gaji Pokok": pokok, "Tunjangan": tunj, "Komisi": komisi,
+        "Total Gross": gross, "Potongan": potongan, "Iuran": iuran, "Tabungan HR": tabungan,
+        "Total Deduction": deduction, "THP (Total)": gross - deduction,
+    })[GAJI_COLS]
+    return karyawan, gaji
+
+
+def cash(rng, size, label):
+    n_rows = size["cash"]
+    return pd.DataFrame({
+        "Date": _dates(rng, n_rows).strftime("%Y-%m-%d"), "Account": rng.choice(ACCOUNTS, n_rows),
+        "Description": [f"{label} {i:06d}" for i in range(1, n_rows + 1)],
+        "Amount": (rng.integers(1, 2000, n_rows) * 5000).astype(float),
+    })
+
+
+def manufacturing(rng, size, items, dol):
+    """BOM tiap produk (kain + pendukung + jasa bordir), Work Order, dan ledger stok."""
+    kain = items.loc[items["_Kategori"] == "Bahan Baku Utama (Kain)", ["Item Name", "Unit"]].to_numpy()
+    pendukung = items.loc[items["_Kategori"] == "Bahan Pendukung", ["Item Name", "Unit"]].to_numpy()
+    rows = []
+    for k, product in enumerate(PRODUCTS):
+        rows.append([product, kain[k % len(kain)][0], 1.5, kain[k % len(kain)][1], "Item", ""])
+        rows.append([product, pendukung[k % len(pendukung)][0], 6, pendukung[k % len(pendukung)][1], "Item", ""])
+        rows.append([product, "Jasa Bordir", 1, "pcs", "Jasa", "Jasa Bordir"])
+    bom = pd.DataFrame(rows, columns=BOM_COLS)
+
+    n_wo = size["work_orders"]
+    wo_date = _dates(rng, n_wo, lo=DAYS - 120)
+    wo = pd.DataFrame({
+        "WO_ID": _ids("WO", n_wo, 4), "Date": wo_date.strftime("%Y-%m-%d"),
+        "Product": rng.choice(list(PRODUCTS), n_wo), "Qty": rng.integers(50, 500, n_wo),
+        "Due_Date": (wo_date + pd.to_timedelta(rng.integers(14, 60, n_wo), unit="D")).strftime("%Y-%m-%d"),
+        "Status": rng.choice(["Released", "In Progress", "Completed"], n_wo, p=[0.4, 0.3, 0.3]),
+    })[WO_COLS]
+
+    # Stok: penerimaan bahan, hasil produksi, lalu pengiriman DO
+    materials = items[items["_Kategori"] != "ATK"]["Item Name"].to_numpy()
+    n_recv = len(dol)
+    shipped = dol.groupby("Item")["Qty"].sum()
+    produced = shipped * 1.1 + 100
+    ledger = pd.concat([
+        pd.DataFrame({"Date": _dates(rng, n_recv).strftime("%Y-%m-%d"), "Item": rng.choice(materials, n_recv),
+                      "Qty": rng.integers(10, 500, n_recv), "Source": "Penerimaan PO", "Ref": "PO"}),
+        pd.DataFrame({"Date": START.strftime("%Y-%m-%d"), "Item": produced.index, "Qty": produced.round(0).to_numpy(),
+                      "Source": "Finished Goods Slip", "Ref": "FG-0000"}),
+        pd.DataFrame({"Date": START.strftime("%Y-%m-%d"), "Item": dol["Item"].to_numpy(), "Qty": -dol["Qty"].to_numpy(),
+                      "Source": "Delivery Order", "Ref": dol["DO_ID"].to_numpy()}),
+    ], ignore_index=True).assign(Warehouse=DEFAULT_WAREHOUSE)[LEDGER_COLS]
+    on_hand = ledger.groupby(["Item", "Warehouse"])["Qty"].sum().rename("Qty").reset_index()
+    return bom, wo, ledger, on_hand[on_hand["Qty"] != 0]
+
+
+def geo_data(rng, size, customers):
+    n_rows = size["geo"]
+    product = np.array(list(PRODUCTS))[rng.integers(0, len(PRODUCTS), n_rows)]
+    qty = rng.integers(1, 300, n_rows)
+    harga = pd.Series(product).map(PRODUCTS).to_numpy() * rng.uniform(0.9, 1.2, n_rows).round(2)
+    return pd.DataFrame({
+        "NO": np.arange(1, n_rows + 1),
+        "TANGGAL PEMESANAN": _dates(rng, n_rows).strftime("%Y-%m-%d"),
+        "INSTANSI": rng.choice(customers["Nama Customer"].to_numpy(), n_rows),
+        "ITEM PROJECT": product, "QTY": qty, "HARGA": harga.round(0),
+        "JUMLAH": (qty * harga.round(0)), "SATUAN": rng.choice(["pcs", "set", "lusin"], n_rows, p=[0.7, 0.2, 0.1]),
+    })
+
+
+DERIVED_FILES = [
+    "purchase_invoice_summary.csv", "Supplier Master.csv", "StockSnapshot.csv", "MaterialSlip.csv",
+    "FinishedGoodsSlip.csv", "StockCount.csv", "Routing.csv", "Workstation.csv",
+]
+DERIVED_DATA_FILES = ["CustomerLedger.csv", "AROpenInvoices.csv", "KPISummary.csv", "ProjectEvents.csv"]
+
+
+def generate(root, n=1000, seed=0, geo=True):
+    """Tulis satu set data lengkap ke salinan proyek di root; kembalikan jumlah baris per file."""
+    root = Path(root)
+    app = root / APP_DIR.name
+    data = app / "data"
+    data.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    size = _sizes(n)
+    counts = {}
+
+    def write(path, df):
+        df.to_csv(path, index=False)
+        counts[str(path.relative_to(root))] = len(df)
+
+    for path in [root / f for f in DERIVED_FILES] + [data / f for f in DERIVED_DATA_FILES]:
+        path.unlink(missing_ok=True)
+
+    sales = sales_chain(rng, n, size)
+    files = dict(zip(SALES_COLS, ["Customer.csv", "SalesOrder.csv", "DeliveryOrder.csv", "SalesInvoice.csv",
+                                  "SalesReceipt.csv", "DeliveryOrderLine.csv"]))
+    for key, df in sales.items():
+        write(data / files[key], df[SALES_COLS[key]])
+
+    items = item_master(rng, size)
+    write(root / "Item.csv", items[ITEM_COLS])
+
+    suppliers, po, invoices, history, log = purchasing(rng, size, items)
+    for cat in po_files:
+        write(root / sup_files[cat], suppliers[cat])
+        write(root / po_files[cat], po[cat])
+    write(root / "purchase_invoice.csv", invoices)
+    write(root / "payment_history.csv", history)
+    (root / "invoice_log.txt").write_text(log)
+
+    karyawan, gaji = payroll(rng, size)
+    write(app / "db_karyawan.csv", karyawan)
+    write(app / "db_gaji.csv", gaji)
+
+    write(data / "OtherPayment.csv", cash(rng, size, "Biaya"))
+    write(data / "OtherDeposit.csv", cash(rng, size, "Setoran"))
+
+    bom, wo, ledger, on_hand = manufacturing(rng, size, items, sales["dol"])
+    write(root / "BOM.csv", bom)
+    write(root / "WorkOrder.csv", wo)
+    write(root / "StockLedger.csv", ledger)
+    write(root / "StockOnHand.csv", on_hand)
+
+    if geo:
+        df = geo_data(rng, size, sales["customer"])
+        df.to_excel(root / "GEO_data.xlsx", index=False)
+        counts["GEO_data.xlsx"] = len(df)
+    return counts
+
+
+def main(target, n=1000):
+    t0 = time.perf_counter()
+    counts = generate(target, n)
+    for name, rows in counts.items():
+        print(f"{name:<60}{rows:>10}")
+    print(f"selesai dalam {time.perf_counter() - t0:.1f} s")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
@@ -0,0 +1,101 @@
+import pandas as pd
+import streamlit as st
+from pathlib import Path
+
+from purchasing_data import po_files
+
+# ---------- Bill of Materials ----------
+# BOM.csv: satu baris = satu komponen dari satu produk (Parent).
+# Komponen bisa berupa Item (Item.csv), Jasa (kategori purchasing, mis.
+# "Jasa Bordir") atau produk setengah jadi yang punya BOM sendiri.
+# Hasil explode per produk di-memo, jadi banyak Work Order cukup di-merge.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+BOM_FILE = BASE_DIR / "BOM.csv"
+BOM_COLS = ["Parent", "Component", "Qty_Per", "Unit", "Component_Type", "Category"]
+COMPONENT_TYPES = ["Item", "Jasa", "Sub-assembly"]
+SERVICE_CATEGORIES = [c for c in po_files if c.startswith("Jasa")]
+
+
+def _bom_signature():
+    return BOM_FILE.stat().st_mtime if BOM_FILE.exists() else None
+
+
+@st.cache_data
+def _load_bom(signature):
+    if not BOM_FILE.exists():
+        return pd.DataFrame(columns=BOM_COLS)
+    df = pd.read_csv(BOM_FILE).reindex(columns=BOM_COLS)
+    df["Qty_Per"] = pd.to_numeric(df["Qty_Per"], errors="coerce").fillna(0)
+    df = df.dropna(subset=["Parent", "Component"])
+    df[["Unit", "Component_Type", "Category"]] = df[["Unit", "Component_Type", "Category"]].fillna("")
+    for col in ["Parent", "Component"]:
+        df[col] = df[col].astype(str).str.strip()
+    return df
+
+
+def load_bom():
+    return _load_bom(_bom_signature())
+
+
+def save_bom(df):
+    df = df.reindex(columns=BOM_COLS)
+    df = df[df["Parent"].notna() & df["Component"].notna()]
+    df.to_csv(BOM_FILE, index=False)
+
+
+class BOMExplosion:
+    """Explode BOM multi-level menjadi kebutuhan komponen paling bawah per 1 unit produk."""
+
+    def __init__(self, bom):
+        self.bom = bom
+        self.children = {p: grp[["Component", "Qty_Per", "Unit", "Component_Type", "Category"]].to_dict("records")
+                         for p, grp in bom.groupby("Parent")}
+        self.memo = {}
+
+    def flat(self, product, _path=()):
+        if product in self.memo:
+            return self.memo[product]
+        if product in _path:
+            raise ValueError(f"BOM berputar: {' -> '.join(_path + (product,))}")
+        result = {}
+        for comp in self.children.get(product, []):
+            if comp["Component"] in self.children:
+                for key, qty in self.flat(comp["Component"], _path + (product,)).items():
+                    result[key] = result.get(key, 0) + qty * comp["Qty_Per"]
+            else:
+                key = (comp["Component"], comp["Unit"], comp["Component_Type"], comp["Category"])
+                result[key] = result.get(key, 0) + comp["Qty_Per"]
+        self.memo[product] = result
+        return result
+
+    def flat_table(self, products):
+        rows = [
+            (p, comp, unit, ctype, cat, qty)
+            for p in pd.unique(pd.Series(products))
+            for (comp, unit, ctype, cat), qty in self.flat(p).items()
+        ]
+        return pd.DataFrame(rows, columns=["Product", "Component", "Unit", "Component_Type", "Category", "Qty_Per"])
+
+    def explode(self, work_orders):
+        """
+        work_orders: DataFrame dengan WO_ID, Product, Qty.
+        Kembalikan kebutuhan per WO per komponen (satu merge + perkalian kolom).
+        """
+        flat = self.flat_table(work_orders["Product"])
+        req = work_orders[["WO_ID", "Product", "Qty"]].merge(flat, on="Product", how="inner")
+        req["Required_Qty"] = req["Qty"] * req["Qty_Per"]
+        return req[["WO_ID", "Product", "Component", "Unit", "Component_Type", "Category", "Required_Qty"]]
+
+
+@st.cache_resource(max_entries=1)
+def _get_explosion(signature):
+    return BOMExplosion(_load_bom(signature))
+
+
+def get_bom_explosion():
+    return _get_explosion(_bom_signature())
+
+
+def total_requirements(req):
+    return req.groupby(["Component", "Unit", "Component_Type", "Category"], dropna=False, as_index=False)["Required_Qty"].sum()
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from pathlib import Path
+
+from sales_data import FILES as SALES_FILES, load_data as load_sales
+from purchasing_data import BASE_DIR as PURCHASING_DIR, COL_TGL, COL_SUP, po_files, load_data as load_po
+
+# ---------- Home calendar events ----------
+# Project disimpan di data/ProjectEvents.csv (append-only). Event project,
+# Sales Order dan PO digabung ke satu index yang terurut per tanggal mulai;
+# kalender hanya menerima event yang overlap dengan rentang yang sedang terlihat.
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+EVENTS_FILE = DATA_DIR / "ProjectEvents.csv"
+EVENT_COLS = ["Event_ID", "Title", "Start", "End", "Source"]
+SOURCE_COLORS = {"Project": "#3788d8", "Sales Order": "#2e7d32", "Purchase Order": "#ef6c00"}
+
+
+def load_project_events():
+    if not EVENTS_FILE.exists():
+        return pd.DataFrame(columns=EVENT_COLS)
+    return pd.read_csv(EVENTS_FILE).reindex(columns=EVENT_COLS)
+
+
+def add_project_event(title, start, end):
+    df = load_project_events()
+    row = pd.DataFrame([{
+        "Event_ID": f"EVT-{len(df) + 1:04d}", "Title": title,
+        "Start": str(start), "End": str(max(start, end)), "Source": "Project",
+    }])
+    row.to_csv(EVENTS_FILE, mode="a", header=not EVENTS_FILE.exists(), index=False)
+
+
+def so_events():
+    df = load_sales("so", usecols=["Order_ID", "Date", "Customer"]).drop_duplicates("Order_ID")
+    return pd.DataFrame({
+        "Event_ID": df["Order_ID"], "Title": df["Order_ID"].astype(str) + " - " + df["Customer"].astype(str),
+        "Start": df["Date"], "End": df["Date"], "Source": "Sales Order",
+    })
+
+
+def po_events():
+    """Satu event per tanggal & supplier PO (baris katalog tanpa tanggal diabaikan)."""
+    frames = [load_po(PURCHASING_DIR / f)[[COL_TGL, COL_SUP]].assign(Kategori=c) for c, f in po_files.items()]
+    df = pd.concat(frames, ignore_index=True)
+    df[COL_TGL] = pd.to_datetime(df[COL_TGL], errors="coerce").dt.strftime("%Y-%m-%d")
+    df = df.dropna(subset=[COL_TGL])
+    grp = df.groupby([COL_TGL, COL_SUP, "Kategori"]).size().reset_index(name="n")
+    return pd.DataFrame({
+        "Event_ID": "PO " + grp[COL_TGL] + " " + grp[COL_SUP].astype(str),
+        "Title": "PO " + grp[COL_SUP].astype(str) + " (" + grp["Kategori"] + ", " + grp["n"].astype(str) + " item)",
+        "Start": grp[COL_TGL], "End": grp[COL_TGL], "Source": "Purchase Order",
+    })
+
+
+class EventIndex:
+    """Event terurut per Start; query rentang memakai searchsorted + durasi terpanjang."""
+
+    def __init__(self, events):
+        events = events.assign(
+            _start=pd.to_datetime(events["Start"], errors="coerce"),
+            _end=pd.to_datetime(events["End"], errors="coerce"),
+        ).dropna(subset=["_start"])
+        events["_end"] = events[["_start", "_end"]].max(axis=1)
+        self.events = events.sort_values("_start").reset_index(drop=True)
+        self.starts = self.events["_start"].to_numpy()
+        self.ends = self.events["_end"].to_numpy()
+        self.max_len = (self.ends - self.starts).max() if len(self.events) else np.timedelta64(0, "ns")
+
+    def query(self, range_start, range_end):
+        """Event yang overlap dengan [range_start, range_end)."""
+        a = np.datetime64(pd.Timestamp(range_start))
+        b = np.datetime64(pd.Timestamp(range_end))
+        lo = np.searchsorted(self.starts, a - self.max_len, side="left")
+        hi = np.searchsorted(self.starts, b, side="left")
+        window = self.events.iloc[lo:hi]
+        return window[self.ends[lo:hi] >= a][EVENT_COLS]
+
+    def __len__(self):
+        return len(self.events)
+
+
+def _signature(include_so, include_po):
+    paths = [EVENTS_FILE]
+    if include_so:
+        paths.append(SALES_FILES["so"])
+    if include_po:
+        paths += [PURCHASING_DIR / f for f in po_files.values()]
+    return tuple(p.stat().st_mtime if p.exists() else None for p in paths)
+
+
+@st.cache_resource(max_entries=4)
+def _build_index(signature, include_so, include_po):
+    frames = [load_project_events()]
+    if include_so and SALES_FILES["so"].exists():
+        frames.append(so_events())
+    if include_po:
+        frames.append(po_events())
+    return EventIndex(pd.concat(frames, ignore_index=True))
+
+
+def get_event_index(include_so=False, include_po=False):
+    return _build_index(_signature(include_so, include_po), include_so, include_po)
+
+
+def to_calendar(events):
+    """Baris event -> format streamlit_calendar."""
+    return [
+        {"id": str(i), "title": str(t), "start": str(s), "end": str(e), "color": SOURCE_COLORS.get(src, "#3788d8")}
+        for i, t, s, e, src in events[EVENT_COLS].itertuples(index=False)
+    ]
+
+
+def month_window(day):
+    """Rentang default tampilan dayGridMonth (6 minggu di sekitar bulan day)."""
+    first = pd.Timestamp(day).replace(day=1)
+    start = first - pd.Timedelta(days=(first.weekday() + 1) % 7)
+    return start.date(), (start + pd.Timedelta(weeks=6)).date()
@@ -0,0 +1,121 @@
+import os
+import shutil
+from pathlib import Path
+
+from profiling import timed, counted_write
+
+# ---------- Multi-file CSV transaction ----------
+# Semua teks CSV disiapkan dulu di memori. Saat commit: file yang ditulis ulang
+# ditulis ke .tmp, isi lamanya disimpan sebagai .bak (hardlink), lalu os.replace;
+# file append dicatat ukurannya sebelum ditulis. Bila ada yang gagal, append
+# dipotong kembali ke ukuran awal, file yang sudah diganti dikembalikan dari
+# .bak dan .tmp dihapus, jadi ledger, saldo dan dokumen tidak pernah
+# ter-update sebagian. Callback on_commit berjalan sesudah commit selesai,
+# di luar transaksi: kegagalannya tidak membatalkan data yang sudah tertulis.
+# Lock yang diambil lewat hold() dilepas setelah commit (termasuk callback),
+# saat commit gagal, atau saat blok `with` keluar karena exception.
+
+
+class CsvTransaction:
+    def __init__(self):
+        self.appends = []
+        self.replaces = []
+        self.callbacks = []
+        self.locks = []
+
+    def append(self, path, df):
+        path = Path(path)
+        header = not path.exists() or path.stat().st_size == 0
+        self.appends.append((path, df.to_csv(index=False, header=header)))
+
+    def replace(self, path, df):
+        self.replaces.append((Path(path), df.to_csv(index=False)))
+
+    def on_commit(self, fn):
+        """Dipanggil setelah semua file tertulis (mis. clear cache), di luar transaksi."""
+        self.callbacks.append(fn)
+
+    def hold(self, lock):
+        """Ambil lock sekarang dan pegang sampai transaksi selesai (mis. baca-ubah-tulis saldo)."""
+        lock.acquire()
+        self.locks.append(lock)
+
+    def release(self):
+        while self.locks:
+            self.locks.pop().release()
+
+    @timed("save")
+    def commit(self):
+        try:
+            self._commit()
+        finally:
+            self.release()
+
+    def _commit(self):
+        tmps, written, swapped = [], [], []
+        try:
+            for path, text in self.replaces:
+                tmp = path.with_name(path.name + ".tmp")
+                with counted_write(tmp):
+                    tmp.write_text(text, encoding="utf-8")
+                tmps.append((tmp, path))
+            for path, text in self.appends:
+                size = path.stat().st_size if path.exists() else None
+                written.append((path, size))
+                with counted_write(path, append=True), open(path, "a", encoding="utf-8") as f:
+                    if size and not _ends_with_newline(path):
+                        f.write("\n")
+                    f.write(text)
+            for tmp, path in tmps:
+                bak = _backup(path)
+                os.replace(tmp, path)
+                swapped.append((path, bak))
+        except Exception:
+            for path, bak in swapped:
+                if bak is None:
+                    path.unlink(missing_ok=True)
+                else:
+                    os.replace(bak, path)
+            for path, size in written:
+                if size is None:
+                    path.unlink(missing_ok=True)
+                else:
+                    with open(path, "r+b") as f:
+                        f.truncate(size)
+            for tmp, _ in tmps:
+                tmp.unlink(missing_ok=True)
+            raise
+        for _, bak in swapped:
+            if bak is not None:
+                bak.unlink(missing_ok=True)
+        for fn in self.callbacks:
+            fn()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.release()
+        return False
+
+
+def _backup(path):
+    """Simpan isi lama path sebagai path.bak (hardlink bila bisa); None bila path belum ada."""
+    if not path.exists():
+        return None
+    bak = path.with_name(path.name + ".bak")
+    bak.unlink(missing_ok=True)
+    try:
+        os.link(path, bak)
+    except OSError:
+        shutil.copy2(path, bak)
+    return bak
+
+
+def _ends_with_newline(path):
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from sales_data import FILES, COLUMNS, load_data, save_data
+
+# ---------- Delivery Order lines ----------
+# DeliveryOrderLine.csv menyimpan qty yang dikirim per baris SO
+# (Order_ID + Line_No). Sisa kirim = qty order - total qty terkirim,
+# jadi pengiriman sebagian cukup dicatat sebagai DO tambahan.
+
+LINE_KEY = ["Order_ID", "Line_No"]
+
+
+def with_line_no(df_so):
+    """Nomor baris per SO sesuai urutan di SalesOrder.csv."""
+    df = df_so.copy()
+    df["Line_No"] = df.groupby("Order_ID", sort=False).cumcount() + 1
+    return df
+
+
+def backfill_do_lines():
+    """Untuk DO lama (sebelum ada tabel baris), anggap seluruh SO terkirim."""
+    if FILES["dol"].exists():
+        return
+    df_so = with_line_no(load_data("so"))
+    df_do = load_data("do", usecols=["DO_ID", "Order_ID"]).drop_duplicates("Order_ID")
+    lines = df_do.merge(df_so[LINE_KEY + ["Item", "Qty"]], on="Order_ID", how="inner")
+    save_data("dol", lines[COLUMNS["dol"]])
+
+
+def _typed(df_dol):
+    return df_dol.astype({"Order_ID": str, "Line_No": int, "Qty": int})
+
+
+def delivered_qty(df_dol):
+    return _typed(df_dol).groupby(LINE_KEY)["Qty"].sum()
+
+
+def remaining_lines(df_so, df_dol, order_ids=None):
+    """Baris SO beserta Ordered / Delivered / Remaining."""
+    df = with_line_no(df_so)
+    if order_ids is not None:
+        df = df[df["Order_ID"].isin(order_ids)]
+    df = df.rename(columns={"Qty": "Ordered"})
+    df = df.join(delivered_qty(df_dol).rename("Delivered"), on=LINE_KEY)
+    df["Delivered"] = df["Delivered"].fillna(0).astype(int)
+    df["Remaining"] = (df["Ordered"] - df["Delivered"]).clip(lower=0)
+    return df
+
+
+def create_delivery_orders(df_so, df_do, df_dol, so_ids, do_date, ship_qty=None):
+    """
+    Buat satu DO per SO. ship_qty (Series ber-index Order_ID, Line_No) untuk
+    pengiriman sebagian; default seluruh sisa dikirim.
+    Kembalikan (df_do, df_so, df_dol, baris DO baru, baris DO-line baru).
+    """
+    lines = remaining_lines(df_so, df_dol, so_ids)
+    qty = lines["Remaining"] if ship_qty is None else lines.join(ship_qty.rename("Ship"), on=LINE_KEY)["Ship"].fillna(0)
+    lines = lines.assign(Qty=qty.clip(upper=lines["Remaining"]).astype(int))
+    lines = lines[lines["Qty"] > 0]
+
+    heads = lines.groupby("Order_ID", sort=False).agg(Customer=("Customer", "first")).reset_index()
+    start = len(df_do) + 1
+    heads["DO_ID"] = [f"DO-{i:03d}" for i in range(start, start + len(heads))]
+    lines = lines.merge(heads[["Order_ID", "DO_ID"]], on="Order_ID")
+
+    summary = (lines["Item"].astype(str) + " (" + lines["Qty"].astype(str) + ")").groupby(lines["DO_ID"], sort=False).agg(", ".join)
+    new_do = pd.DataFrame({
+        "DO_ID": heads["DO_ID"],
+        "Order_ID": heads["Order_ID"],
+        "Date": do_date,
+        "Customer": heads["Customer"],
+        "Items_Summary": heads["DO_ID"].map(summary),
+        "Status": "Shipped",
+    })
+    new_lines = lines[COLUMNS["dol"]].reset_index(drop=True)
+    df_dol = pd.concat([df_dol, new_lines], ignore_index=True)
+
+    left = remaining_lines(df_so, df_dol, heads["Order_ID"]).groupby("Order_ID")["Remaining"].sum()
+    df_so = df_so.copy()
+    left_per_line = df_so["Order_ID"].map(left)
+    touched = left_per_line.notna()
+    df_so.loc[touched, "Status"] = np.where(left_per_line[touched] == 0, "Delivered", "Partial")
+    return pd.concat([df_do, new_do], ignore_index=True), df_so, df_dol, new_do, new_lines
+
+
+def do_values(df_so, df_dol):
+    """Nilai barang per DO = qty terkirim x harga baris SO."""
+    prices = with_line_no(df_so).set_index(LINE_KEY)["Price"]
+    df_dol = _typed(df_dol)
+    value = df_dol["Qty"] * df_dol.join(prices, on=LINE_KEY)["Price"].fillna(0)
+    return value.groupby(df_dol["DO_ID"]).sum()
+
+
+def delivered_vs_ordered(df_so, df_dol):
+    """Laporan per SO per item: dipesan, terkirim, sisa."""
+    lines = remaining_lines(df_so, df_dol)
+    return lines.groupby(["Order_ID", "Customer", "Item"], sort=False)[["Ordered", "Delivered", "Remaining"]].sum().reset_index()
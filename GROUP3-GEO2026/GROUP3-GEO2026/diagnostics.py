@@ -0,0 +1,58 @@
+import streamlit as st
+import pandas as pd
+from profiling import LOG_FILE, IO_KEYS, is_enabled, set_enabled, load_log, percentiles
+
+st.title("Diagnostics")
+st.caption(f"Profiling per rerun, dibaca dari {LOG_FILE.name} (rolling). Bisa juga diaktifkan dengan env APP_PROFILE=1.")
+
+enabled = st.toggle("Profiling aktif (semua sesi di proses ini)", value=is_enabled())
+if enabled != is_enabled():
+    set_enabled(enabled)
+    st.rerun()
+
+WINDOWS = {"1 jam": pd.Timedelta(hours=1), "24 jam": pd.Timedelta(days=1), "7 hari": pd.Timedelta(days=7), "Semua": None}
+c1, c2 = st.columns([1, 3])
+window = c1.selectbox("Rentang", list(WINDOWS), index=1)
+since = pd.Timestamp.now(tz="UTC") - WINDOWS[window] if WINDOWS[window] is not None else None
+
+df = load_log(since)
+if df.empty:
+    st.info("Belum ada data profiling pada rentang ini.")
+    st.stop()
+
+if "tab" in df:
+    # rerun fragment (satu tab saja) dikelompokkan sebagai "Halaman / Tab"
+    df["page"] = df["page"].where(df["tab"].isna(), df["page"] + " / " + df["tab"].astype(str))
+pages = sorted(df["page"].unique())
+selected = c2.multiselect("Halaman", pages, default=pages)
+df = df[df["page"].isin(selected)]
+if df.empty:
+    st.stop()
+
+m1, m2, m3, m4 = st.columns(4)
+m1.metric("Rerun", f"{len(df):,}")
+m2.metric("p95 rerun", f"{df['total_ms'].quantile(0.95):,.0f} ms")
+m3.metric("Rerun bersamaan (maks)", int(df["concurrent"].max()))
+m4.metric("Sesi aktif (maks, 5 menit)", int(df["sessions"].max()))
+
+st.subheader("Durasi rerun per halaman (ms)")
+st.dataframe(percentiles(df, "total_ms").style.format("{:,.0f}"), use_container_width=True)
+
+st.subheader("Section per halaman (ms)")
+section_cols = [c for c in df.columns if c.startswith("ms_")]
+sections = df.melt(id_vars=["page"], value_vars=section_cols, var_name="section", value_name="ms").dropna(subset=["ms"])
+sections["section"] = sections["section"].str.removeprefix("ms_")
+st.dataframe(percentiles(sections, "ms", ["page", "section"]).style.format("{:,.0f}"), use_container_width=True)
+
+st.subheader("File I/O per rerun")
+io = df[IO_KEYS].assign(read_bytes=df["read_bytes"] / 2**20, write_bytes=df["write_bytes"] / 2**20)
+io = io.groupby(df["page"]).agg(["mean", "max"])
+io.columns = [f"{k.replace('_bytes', ' MB')} ({agg})" for k, agg in io.columns]
+st.dataframe(io.style.format("{:,.1f}"), use_container_width=True)
+
+st.subheader("Konkurensi")
+st.line_chart(df.set_index("ts")[["concurrent", "sessions"]])
+
+with st.expander("Rerun terakhir"):
+    recent = df.sort_values("ts", ascending=False).head(100)
+    st.dataframe(recent[["ts", "page", "status", "total_ms", *section_cols, *IO_KEYS, "concurrent"]], hide_index=True, use_container_width=True)
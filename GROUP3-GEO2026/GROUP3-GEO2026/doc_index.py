@@ -0,0 +1,125 @@
+import pandas as pd
+import streamlit as st
+from collections import defaultdict
+
+from sales_data import FILES, load_data
+from delivery_lines import do_values
+
+# ---------- Document-chain index SO -> DO -> SI -> SR ----------
+# Menyimpan relasi parent/child antar dokumen sales di memori, plus set ID per
+# (tipe, status). sales.py meng-update index setiap kali menulis dokumen baru,
+# jadi halaman tidak perlu scan ulang keempat tabel di setiap rerun.
+
+DOC_TYPES = ["so", "do", "si", "sr", "dol"]
+
+
+class DocumentGraph:
+    def __init__(self):
+        self.nodes = {}
+        self.parent = {}
+        self.children = defaultdict(list)
+        self.by_status = defaultdict(set)
+        self.by_customer = defaultdict(list)
+        self.leaves = defaultdict(set)
+        self.mtimes = {}
+
+    # ----- maintenance -----
+
+    def build(self):
+        self.__init__()
+        so = load_data("so", usecols=["Order_ID", "Date", "Customer", "Price", "Total", "Status"])
+        so_head = so.groupby("Order_ID", sort=False).agg(
+            Date=("Date", "first"), Customer=("Customer", "first"), Total=("Total", "sum"), Status=("Status", "first")
+        )
+        for doc_id, row in so_head.iterrows():
+            self.add(doc_id, "so", None, row["Date"], row["Customer"], row["Status"], row["Total"])
+
+        do = load_data("do", usecols=["DO_ID", "Order_ID", "Date", "Customer", "Status"])
+        values = do_values(so, load_data("dol")) if FILES["dol"].exists() else {}
+        for doc_id, parent, dt, cust, status in do.itertuples(index=False):
+            self.add(doc_id, "do", parent, dt, cust, status, values.get(doc_id, self.amount(parent)))
+
+        si = load_data("si", usecols=["Invoice_ID", "DO_ID", "Date", "Customer", "Total_Bill", "Status"])
+        for doc_id, parent, dt, cust, amount, status in si.itertuples(index=False):
+            self.add(doc_id, "si", parent, dt, cust, status, amount)
+
+        sr = load_data("sr", usecols=["Receipt_ID", "Invoice_ID", "Date", "Customer", "Amount_Paid", "Notes"])
+        for doc_id, parent, dt, cust, amount, notes in sr.itertuples(index=False):
+            self.add(doc_id, "sr", parent, dt, cust, notes, amount)
+
+        self.mark_synced()
+        return self
+
+    def add(self, doc_id, doc_type, parent, doc_date, customer, status, amount=0):
+        if doc_id in self.nodes:
+            self.by_status[(doc_type, self.nodes[doc_id]["status"])].discard(doc_id)
+        self.nodes[doc_id] = {
+            "type": doc_type, "date": str(doc_date), "customer": customer,
+            "status": status, "amount": float(amount) if pd.notna(amount) else 0.0
+        }
+        self.by_status[(doc_type, status)].add(doc_id)
+        if not self.children.get(doc_id):
+            self.leaves[doc_type].add(doc_id)
+        if parent is not None and pd.notna(parent):
+            self.parent[doc_id] = parent
+            if parent in self.nodes:
+                self.leaves[self.nodes[parent]["type"]].discard(parent)
+            if doc_id not in self.children[parent]:
+                self.children[parent].append(doc_id)
+        elif doc_type == "so" and doc_id not in self.by_customer[customer]:
+            self.by_customer[customer].append(doc_id)
+
+    def set_status(self, doc_id, status):
+        node = self.nodes.get(doc_id)
+        if node is None:
+            return
+        self.by_status[(node["type"], node["status"])].discard(doc_id)
+        node["status"] = status
+        self.by_status[(node["type"], status)].add(doc_id)
+
+    def mark_synced(self):
+        self.mtimes = {k: FILES[k].stat().st_mtime for k in DOC_TYPES if FILES[k].exists()}
+
+    def refresh(self):
+        current = {k: FILES[k].stat().st_mtime for k in DOC_TYPES if FILES[k].exists()}
+        if current != self.mtimes:
+            self.build()
+
+    # ----- lookup -----
+
+    def parent_of(self, doc_id):
+        return self.parent.get(doc_id)
+
+    def children_of(self, doc_id):
+        return self.children.get(doc_id, [])
+
+    def amount(self, doc_id):
+        node = self.nodes.get(doc_id)
+        return node["amount"] if node else 0.0
+
+    def ids_with_status(self, doc_type, status):
+        return sorted(self.by_status.get((doc_type, status), ()))
+
+    def ids_without_children(self, doc_type):
+        return sorted(self.leaves.get(doc_type, ()))
+
+    def timeline(self, customer):
+        """Semua dokumen milik customer, dirunut dari SO sampai SR."""
+        rows = []
+        stack = [(so_id, 0) for so_id in reversed(self.by_customer.get(customer, []))]
+        while stack:
+            doc_id, depth = stack.pop()
+            node = self.nodes.get(doc_id)
+            if node is None:
+                continue
+            rows.append({
+                "Dokumen": ("    " * depth) + doc_id, "Tipe": node["type"].upper(), "Tanggal": node["date"],
+                "Status": node["status"], "Nilai": node["amount"], "Parent": self.parent.get(doc_id, "")
+            })
+            stack.extend((child, depth + 1) for child in reversed(self.children_of(doc_id)))
+        return pd.DataFrame(rows, columns=["Dokumen", "Tipe", "Tanggal", "Status", "Nilai", "Parent"])
+
+
+@st.cache_resource
+def get_doc_graph():
+    return DocumentGraph().build()
@@ -1,52 +1,25 @@
 import streamlit as st
-from pathlib import Path
+from page_tabs import tab_bar, run_tab
 import pandas as pd
 import datetime
+from finance_data import ACCOUNTS, init_csv, load_data, save_data, format_rp
 
 st.markdown("""
 <style>
-div[data-testid="stTabs"] { width: 100%; }
-div[data-testid="stTabs"] > div > div { display: flex; }
-button[data-testid="stTab"] { flex: 1; justify-content: center; font-size: 16px; font-weight: 600; }
 div.block-container { padding-top: 1rem; }
 </style>
 """, unsafe_allow_html=True)
 
-BASE_DIR = Path(__file__).resolve().parent
-DATA_DIR = BASE_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
-
-FILES = {
-    "payment": DATA_DIR / "OtherPayment.csv",
-    "deposit": DATA_DIR / "OtherDeposit.csv"
-}
-
-ACCOUNTS = ["Kas Besar", "Bank BCA", "Bank Mandiri", "Petty Cash"]
-
-def init_csv():
-    if not FILES["payment"].exists():
-        pd.DataFrame(columns=["Date", "Account", "Description", "Amount"]).to_csv(FILES["payment"], index=False)
-    if not FILES["deposit"].exists():
-        pd.DataFrame(columns=["Date", "Account", "Description", "Amount"]).to_csv(FILES["deposit"], index=False)
-
 init_csv()
 
-def load_data(key):
-    return pd.read_csv(FILES[key])
-
-def save_data(key, df):
-    df.to_csv(FILES[key], index=False)
-
-def format_rp(val):
-    return f"Rp {val:,.0f}".replace(',', '.')
-
-tabs = st.tabs([
+TAB_LABELS = [
     "Other Payment",
     "Other Deposit",
     "Bank Statement"
-])
+]
+active_tab = tab_bar(TAB_LABELS, "finance_tab")
 
-with tabs[0]:
+def other_payment_tab():
     st.subheader("Other Payment")
     
     with st.form("form_payment", clear_on_submit=True):
@@ -80,7 +53,7 @@ with tabs[0]:
     st.write("##### Riwayat Input Payment")
     st.dataframe(load_data("payment").sort_values(by="Date", ascending=False), use_container_width=True)
 
-with tabs[1]:
+def other_deposit_tab():
     st.subheader("Other Deposit")
     
     with st.form("form_deposit", clear_on_submit=True):
@@ -115,7 +88,7 @@ with tabs[1]:
     st.dataframe(load_data("deposit").sort_values(by="Date", ascending=False), use_container_width=True)
 
 
-with tabs[2]:
+def bank_statement_tab():
     st.subheader("Bank Statement")
     
     selected_account = st.selectbox("Lihat Mutasi Akun:", ["Semua"] + ACCOUNTS)
@@ -168,4 +141,12 @@ with tabs[2]:
         c3.metric("Saldo Akhir", format_rp(current_bal))
         
     else:
-        st.info("Belum ada transaksi pada akun ini.")
\ No newline at end of file
+        st.info("Belum ada transaksi pada akun ini.")
+
+
+TAB_VIEWS = dict(zip(TAB_LABELS, [
+    other_payment_tab,
+    other_deposit_tab,
+    bank_statement_tab,
+]))
+run_tab("Finance", TAB_VIEWS, active_tab)
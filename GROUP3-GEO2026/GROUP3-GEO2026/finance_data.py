@@ -0,0 +1,39 @@
+import pandas as pd
+from pathlib import Path
+
+from profiling import timed
+
+# ---------- Shared finance file helpers ----------
+# Dipakai oleh finance.py dan modul lain yang membaca kas/bank.
+
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+DATA_DIR.mkdir(exist_ok=True)
+
+FILES = {
+    "payment": DATA_DIR / "OtherPayment.csv",
+    "deposit": DATA_DIR / "OtherDeposit.csv"
+}
+
+ACCOUNTS = ["Kas Besar", "Bank BCA", "Bank Mandiri", "Petty Cash"]
+
+
+def init_csv():
+    if not FILES["payment"].exists():
+        pd.DataFrame(columns=["Date", "Account", "Description", "Amount"]).to_csv(FILES["payment"], index=False)
+    if not FILES["deposit"].exists():
+        pd.DataFrame(columns=["Date", "Account", "Description", "Amount"]).to_csv(FILES["deposit"], index=False)
+
+
+@timed("load")
+def load_data(key):
+    return pd.read_csv(FILES[key])
+
+
+@timed("save")
+def save_data(key, df):
+    df.to_csv(FILES[key], index=False)
+
+
+def format_rp(val):
+    return f"Rp {val:,.0f}".replace(',', '.')
@@ -0,0 +1,117 @@
+import pandas as pd
+import numpy as np
+
+from profiling import timed
+
+# ---------- Quarterly sales forecaster (XGBoost) ----------
+# Dipakai oleh halaman Prediction dan MRP. Semua fungsi di sini tanpa Streamlit.
+# scipy / xgboost / sklearn baru di-import saat forecast dijalankan.
+
+LAG = 4
+
+
+def create_lagged_features(data, lag=1):
+    """Membuat fitur lag untuk time series"""
+    lagged_data = data.copy()
+    for i in range(1, lag+1):
+        lagged_data[f'QTY_{i}'] = lagged_data['QTY'].shift(i)
+    return lagged_data
+
+
+def prepare_quarterly(df):
+    """Agregasi QTY per kuartal dari kolom TANGGAL PEMESANAN."""
+    df = df.copy()
+    try:
+        df['TANGGAL PEMESANAN'] = pd.to_datetime(df['TANGGAL PEMESANAN'], format='%Y-%m-%d', errors='coerce')
+    except:
+        df['TANGGAL PEMESANAN'] = pd.to_datetime(df['TANGGAL PEMESANAN'], errors='coerce')
+
+    df = df.dropna(subset=['TANGGAL PEMESANAN'])
+
+    df['QTY'] = pd.to_numeric(df['QTY'], errors='coerce')
+    df = df.dropna(subset=['QTY'])
+
+    df['QUARTER_START'] = df['TANGGAL PEMESANAN'].dt.to_period('Q').dt.to_timestamp()
+
+    qty_by_date = df.groupby('QUARTER_START')['QTY'].sum().reset_index()
+    qty_by_date.rename(columns={'QUARTER_START': 'TANGGAL PEMESANAN'}, inplace=True)
+
+    qty_by_date.replace('', np.nan, inplace=True)
+    return qty_by_date.dropna()
+
+
+@timed("forecast")
+def run_forecast(df, forecast_quarters):
+    """
+    Latih XGBoost pada data kuartalan lalu forecast ke depan.
+    Kembalikan dict: qty_by_date, combined_df, future_df, rmse.
+    """
+    from scipy import stats
+    import xgboost as xgb
+    from sklearn.model_selection import train_test_split
+    from sklearn.metrics import mean_squared_error
+
+    qty_by_date = prepare_quarterly(df)
+
+    qty_by_date_filtered = qty_by_date.copy()
+    if len(qty_by_date) > 5:
+        qty_by_date_filtered = qty_by_date[(np.abs(stats.zscore(qty_by_date['QTY'])) < 4)].copy()
+
+    qty_with_lags = create_lagged_features(qty_by_date_filtered, LAG)
+    qty_with_lags.dropna(inplace=True)
+
+    if qty_with_lags.empty:
+        raise ValueError("Data terlalu sedikit setelah pembersihan & lagging. Butuh minimal 2 tahun data historis.")
+
+    X = qty_with_lags.drop(columns=['QTY', 'TANGGAL PEMESANAN'])
+    y = qty_with_lags['QTY']
+
+    X_train, X_test, y_train_log, y_test_log = train_test_split(X, y, test_size=0.2, shuffle=False)
+
+    y_train_log = np.log1p(y_train_log)
+    y_test_log = np.log1p(y_test_log)
+
+    model_xgb = xgb.XGBRegressor(
+        objective='reg:squarederror',
+        n_estimators=100,
+        learning_rate=0.1,
+        max_depth=5
+    )
+    model_xgb.fit(X_train, y_train_log)
+
+    predictions_xgb = model_xgb.predict(X_test)
+    rmse_xgb = np.sqrt(mean_squared_error(y_test_log, predictions_xgb))
+
+    all_predictions_log = model_xgb.predict(X)
+    all_predictions = np.expm1(all_predictions_log)
+
+    results_df = qty_with_lags[['TANGGAL PEMESANAN', 'QTY']].copy()
+    results_df['Predicted QTY'] = all_predictions
+    results_df = results_df.rename(columns={'QTY': 'Actual QTY'})
+
+    last_date = results_df['TANGGAL PEMESANAN'].max()
+
+    future_dates = pd.date_range(start=last_date + pd.Timedelta(days=1), periods=forecast_quarters, freq='QS')
+
+    future_forecasts = []
+    current_lag_features = list(qty_with_lags.iloc[-1, 2:].values)
+
+    for _ in future_dates:
+        features_df = pd.DataFrame([current_lag_features], columns=[f'QTY_{i}' for i in range(1, LAG + 1)])
+        next_qty_pred = np.expm1(model_xgb.predict(features_df)[0])
+        if next_qty_pred < 0: next_qty_pred = 0
+        future_forecasts.append(next_qty_pred)
+        current_lag_features.pop(0)
+        current_lag_features.append(next_qty_pred)
+
+    future_df = pd.DataFrame({'TANGGAL PEMESANAN': future_dates, 'Forecasted QTY': future_forecasts})
+    combined_df = pd.merge(results_df, future_df, on='TANGGAL PEMESANAN', how='outer')
+    combined_df = combined_df.sort_values(by='TANGGAL PEMESANAN').reset_index(drop=True)
+    combined_df['Model Output'] = combined_df['Predicted QTY'].fillna(combined_df['Forecasted QTY'])
+
+    return {
+        "qty_by_date": qty_by_date,
+        "combined_df": combined_df,
+        "future_df": future_df,
+        "rmse": rmse_xgb,
+    }
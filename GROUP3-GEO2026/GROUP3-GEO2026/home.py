@@ -2,6 +2,9 @@ import streamlit as st
 from datetime import date
 from streamlit_calendar import calendar
 from pathlib import Path
+from kpi import load_kpis, kpi_value
+from finance_data import format_rp
+from calendar_events import add_project_event, get_event_index, to_calendar, month_window
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 LOGO_PATH = BASE_DIR / "img" / "logo_koperasi.png"
@@ -13,6 +16,22 @@ with col2:
 
 st.caption("")
 
+kpis = load_kpis()
+k1, k2, k3, k4 = st.columns(4)
+k1.metric("Penjualan Bulan Ini", format_rp(kpi_value(kpis, "Penjualan Bulan Ini", date.today().strftime("%Y-%m"))))
+k2.metric("Piutang (AR)", format_rp(kpi_value(kpis, "Piutang (AR)")))
+k3.metric("Hutang (AP)", format_rp(kpi_value(kpis, "Hutang (AP)")))
+k4.metric("Stok Menipis", f"{kpi_value(kpis, 'Stok Menipis'):.0f} item")
+
+cash = kpis[kpis["Metric"] == "Kas"]
+for col, (_, row) in zip(st.columns(max(len(cash), 1)), cash.iterrows()):
+    col.metric(row["Key"], format_rp(row["Value"]))
+
+low_stock = kpis[kpis["Metric"] == "Stok Menipis Item"]
+if not low_stock.empty:
+    with st.expander("Item Stok Menipis"):
+        st.dataframe(low_stock[["Key", "Value"]].rename(columns={"Key": "Item", "Value": "Qty"}), hide_index=True, use_container_width=True)
+
 with st.form("add_project"):
     st.markdown('<div class="form-card">', unsafe_allow_html=True)
 
@@ -25,33 +44,37 @@ with st.form("add_project"):
 
     st.markdown('</div>', unsafe_allow_html=True)
     
-if "events" not in st.session_state:
-    st.session_state.events = []
-
 if submitted:
-    st.session_state.events.append({
-        "title": f"{title}",
-        "start": start.isoformat(),
-        "end": end.isoformat(),
-    })
-
-calendar(
-    events=st.session_state.events,
+    if title.strip():
+        add_project_event(title.strip(), start, end)
+        st.success(f"Project '{title}' tersimpan.")
+    else:
+        st.error("Project Name wajib diisi.")
+
+col_s1, col_s2, _ = st.columns([1, 1, 4])
+show_so = col_s1.checkbox("Tampilkan Sales Order", value=False)
+show_po = col_s2.checkbox("Tampilkan Purchase Order", value=False)
+
+# hanya event yang overlap dengan rentang yang sedang terlihat di kalender
+if "calendar_range" not in st.session_state:
+    st.session_state.calendar_range = month_window(date.today())
+range_start, range_end = st.session_state.calendar_range
+visible = get_event_index(show_so, show_po).query(range_start, range_end)
+
+cal_state = calendar(
+    events=to_calendar(visible),
     options={
         "initialView": "dayGridMonth",
+        "initialDate": str(range_start + (range_end - range_start) / 2),
         "height": 650
-    }
+    },
+    callbacks=["datesSet"],
+    key="home_calendar"
 )
 
-
-
-
-
-
-
-
-
-
-
-
-
+if cal_state and cal_state.get("callback") == "datesSet":
+    shown = cal_state["datesSet"]
+    new_range = (date.fromisoformat(shown["start"][:10]), date.fromisoformat(shown["end"][:10]))
+    if new_range != st.session_state.calendar_range:
+        st.session_state.calendar_range = new_range
+        st.rerun()
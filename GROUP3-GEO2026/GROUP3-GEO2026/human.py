@@ -1,68 +1,22 @@
 import streamlit as st
-import pandas as pd
+from page_tabs import tab_bar, run_tab
 from datetime import date
-import os
+from payroll_store import get_payroll_store
+from payroll_run import load_templates, save_templates, compute_run, diff_run, rows_to_commit
 
-FILE_KARYAWAN = 'db_karyawan.csv'
-FILE_GAJI = 'db_gaji.csv'
-
-def init_csv():
-    """Memastikan file CSV tersedia dengan header yang benar"""
-    if not os.path.exists(FILE_KARYAWAN):
-        pd.DataFrame(columns=[
-            "Nama Lengkap", "No KTP", "Posisi", "Kontak", "Tanggal Masuk", "Alamat"
-        ]).to_csv(FILE_KARYAWAN, index=False)
-        
-    if not os.path.exists(FILE_GAJI):
-        pd.DataFrame(columns=[
-            "Periode", "Tipe", "Tgl Input", "Jatuh Tempo", "Nama Karyawan", 
-            "Gaji Pokok", "Tunjangan", "Komisi", "Total Gross", 
-            "Potongan", "Iuran", "Tabungan HR", "Total Deduction", "THP (Total)"
-        ]).to_csv(FILE_GAJI, index=False)
-
-def load_data_karyawan():
-    """Load data karyawan dari CSV"""
-    if os.path.exists(FILE_KARYAWAN):
-        try:
-            df = pd.read_csv(FILE_KARYAWAN)
-            return df.to_dict('records')
-        except:
-            return []
-    return []
-
-def load_data_gaji():
-    """Load data gaji dari CSV"""
-    if os.path.exists(FILE_GAJI):
-        try:
-            df = pd.read_csv(FILE_GAJI)
-            return df.to_dict('records')
-        except:
-            return []
-    return []
-
-def save_to_csv(data, filename):
-    """Simpan list dictionary ke CSV (Menulis Permanen)"""
-    df = pd.DataFrame(data)
-    df.to_csv(filename, index=False)
-
-init_csv()
-
-st.session_state['data_karyawan'] = load_data_karyawan()
-st.session_state['data_gaji'] = load_data_gaji()
+store = get_payroll_store().refresh()
 
 st.markdown("""
 <style>
-div[data-testid="stTabs"] { width: 100%; }
-div[data-testid="stTabs"] > div > div { display: flex; }
-button[data-testid="stTab"] { flex: 1; justify-content: center; font-weight: 600; }
 div.block-container { padding-top: 1rem; }
 .metric-card { background-color: #f0f2f6; padding: 15px; border-radius: 10px; margin-bottom: 10px;}
 </style>
 """, unsafe_allow_html=True)
 
-tabs = st.tabs(["Employee", "Salary", "Tabungan Hari Raya"])
+TAB_LABELS = ["Employee", "Salary", "Tabungan Hari Raya", "Payroll Run"]
+active_tab = tab_bar(TAB_LABELS, "human_tab")
 
-with tabs[0]:
+def employee_tab():
     with st.form("form_karyawan", clear_on_submit=True):
         st.write("**Tambah Karyawan Baru**")
         col1, col2 = st.columns(2)
@@ -89,12 +43,7 @@ with tabs[0]:
                     "Tanggal Masuk": str(tgl_masuk), 
                     "Alamat": alamat
                 }
-              
-              
-                st.session_state['data_karyawan'].append(karyawan_baru)
-                
-                
-                save_to_csv(st.session_state['data_karyawan'], FILE_KARYAWAN)
+                store.add_karyawan(karyawan_baru)
                 
                 st.success(f"Berhasil menambahkan karyawan: {nama}")
                 st.rerun() 
@@ -102,21 +51,19 @@ with tabs[0]:
                 st.error("Mohon lengkapi Nama, No KTP, dan Posisi!")
 
     st.markdown("---")
-    st.subheader(f"Daftar Karyawan ({len(st.session_state['data_karyawan'])})")
+    st.subheader(f"Daftar Karyawan ({len(store.karyawan)})")
     
-    if len(st.session_state['data_karyawan']) > 0:
-        df_karyawan = pd.DataFrame(st.session_state['data_karyawan'])
-        st.dataframe(df_karyawan, use_container_width=True)
+    if len(store.karyawan) > 0:
+        st.dataframe(store.karyawan, use_container_width=True)
     else:
         st.info("Belum ada data karyawan.")
 
 
-with tabs[1]:
-    if len(st.session_state['data_karyawan']) == 0:
+def salary_tab():
+    if len(store.karyawan) == 0:
         st.warning("Belum ada data karyawan. Silakan input data di Tab 'Employee' terlebih dahulu.")
     else:
-        df_karyawan = pd.DataFrame(st.session_state['data_karyawan'])
-        list_nama_karyawan = df_karyawan['Nama Lengkap'].tolist()
+        list_nama_karyawan = store.karyawan['Nama Lengkap'].tolist()
 
         with st.form("form_salary", clear_on_submit=True):
             st.write("### Informasi Periode & Pembayaran")
@@ -186,77 +133,116 @@ with tabs[1]:
                     "THP (Total)": grand_total
                 }
                 
-              
-                st.session_state['data_gaji'].append(data_gaji_baru)
-                
-                
-                save_to_csv(st.session_state['data_gaji'], FILE_GAJI)
+                store.add_gaji(data_gaji_baru)
                 
                 st.success(f"Data Gaji {nama_karyawan} berhasil disimpan!")
                 st.metric(label="Total Take Home Pay (THP)", value=f"Rp {grand_total:,.0f}")
                 st.rerun()
 
         st.subheader("Riwayat Penggajian")
-        if len(st.session_state['data_gaji']) > 0:
-            df_gaji = pd.DataFrame(st.session_state['data_gaji'])
+        if len(store.gaji) > 0:
+            df_gaji = store.gaji
             st.dataframe(df_gaji, use_container_width=True)
             
             csv_gaji = df_gaji.to_csv(index=False).encode('utf-8')
             st.download_button("Download Data Gaji", csv_gaji, "payroll_data.csv", "text/csv")
 
-with tabs[2]:
+def tabungan_hari_raya_tab():
    
-    if len(st.session_state['data_gaji']) > 0:
-        # Load Data Gaji
-        df = pd.DataFrame(st.session_state['data_gaji'])
-        
-        # 2. PROSES GROUPING & SUM
-        # Mengelompokkan berdasarkan Nama, lalu menjumlahkan kolom 'Tabungan HR'
-        # Hasilnya adalah tabel ringkasan
-        df_thr = df.groupby('Nama Karyawan')[['Tabungan HR']].sum().reset_index()
+    if len(store.thr_balance) > 0:
+        # Saldo THR per karyawan sudah dihitung oleh store setiap ada input gaji
+        df_thr = store.thr_summary()
         
-        # Urutkan dari yang terbanyak
-        df_thr = df_thr.sort_values(by='Tabungan HR', ascending=False)
-        
-        # 3. TAMPILKAN RINGKASAN TOTAL
         st.subheader("Rekapitulasi Total Tabungan")
-        
-        # Buat kolom baru format Rupiah (String) agar enak dilihat di tabel
-        df_thr['Total Terkumpul'] = df_thr['Tabungan HR'].apply(lambda x: f"Rp {x:,.0f}")
-        
-        # Tampilkan tabel (Hanya Nama & Total)
         st.dataframe(
-            df_thr[['Nama Karyawan', 'Total Terkumpul']], 
+            df_thr.rename(columns={'Tabungan HR': 'Total Terkumpul'}), 
+            column_config={'Total Terkumpul': st.column_config.NumberColumn('Total Terkumpul', format="Rp %,.0f")},
             use_container_width=True,
             hide_index=True
         )
         
-        # 4. FITUR DETAIL (Melihat rincian per orang)
+        # FITUR DETAIL (Melihat rincian per orang)
         st.divider()
         st.subheader("Rincian Detail per Karyawan")
         
         col_detail1, col_detail2 = st.columns([1, 2])
         
         with col_detail1:
-            # Dropdown pilih nama
-            pilih_nama_thr = st.selectbox("Pilih Karyawan:", df_thr['Nama Karyawan'].unique())
-            
-            # Hitung total individu
-            total_individu = df_thr[df_thr['Nama Karyawan'] == pilih_nama_thr]['Tabungan HR'].values[0]
+            pilih_nama_thr = st.selectbox("Pilih Karyawan:", df_thr['Nama Karyawan'])
+            total_individu = store.thr_balance.get(pilih_nama_thr, 0)
             st.metric(label=f"Total Tabungan {pilih_nama_thr}", value=f"Rp {total_individu:,.0f}")
             
         with col_detail2:
             st.write(f"**Riwayat Setoran THR - {pilih_nama_thr}**")
-            
-            # Filter DataFrame utama untuk hanya menampilkan karyawan yang dipilih
-            # dan hanya kolom yang relevan
-            df_detail = df[df['Nama Karyawan'] == pilih_nama_thr][['Periode', 'Tgl Input', 'Tabungan HR']]
-            
-            # Format rupiah di tabel detail juga
-            df_detail['Tabungan HR'] = df_detail['Tabungan HR'].apply(lambda x: f"Rp {x:,.0f}")
-            
-            st.dataframe(df_detail, use_container_width=True, hide_index=True)
+            df_detail = store.gaji_karyawan(pilih_nama_thr)[['Periode', 'Tgl Input', 'Tabungan HR']]
+            st.dataframe(
+                df_detail,
+                column_config={'Tabungan HR': st.column_config.NumberColumn('Tabungan HR', format="Rp %,.0f")},
+                use_container_width=True,
+                hide_index=True
+            )
             
     else:
         st.info("Belum ada data gaji yang diinput. Data THR akan otomatis muncul di sini setelah Anda menginput gaji dengan potongan 'Tabungan Hari Raya'.")
-    
\ No newline at end of file
+    
+
+
+def payroll_run_tab():
+    if len(store.karyawan) == 0:
+        st.warning("Belum ada data karyawan. Silakan input data di Tab 'Employee' terlebih dahulu.")
+    else:
+        st.write("### Template Gaji per Karyawan")
+        templates = st.data_editor(
+            load_templates(store.karyawan),
+            disabled=["Nama Karyawan"],
+            column_config={c: st.column_config.NumberColumn(c, min_value=0, step=10000, format="%d") for c in ["Gaji Pokok", "Tunjangan", "Komisi", "Potongan", "Iuran", "Tabungan HR"]},
+            hide_index=True,
+            use_container_width=True,
+            key="template_editor"
+        )
+        if st.button("Simpan Template"):
+            save_templates(templates)
+            st.success("Template gaji berhasil disimpan!")
+
+        st.markdown("---")
+        st.write("### Jalankan Payroll")
+        col_r1, col_r2, col_r3, col_r4 = st.columns(4)
+        with col_r1:
+            run_type = st.selectbox("Payment Type", ["Monthly", "Non-Monthly", "Yearly"], key="run_type")
+        with col_r2:
+            run_bulan = st.selectbox("Bulan", [
+                "January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December"
+            ], index=date.today().month - 1, key="run_bulan")
+        with col_r3:
+            run_tahun = st.number_input("Tahun", value=date.today().year, step=1, format="%d", key="run_tahun")
+        with col_r4:
+            run_jatuh_tempo = st.date_input("Tanggal Jatuh Tempo", value=date.today(), key="run_jatuh_tempo")
+
+        run = compute_run(templates, f"{run_bulan} {run_tahun}", run_type, date.today(), run_jatuh_tempo)
+        diff = diff_run(run, store.gaji)
+        to_commit = rows_to_commit(run, diff)
+
+        st.write("**Review Perubahan**")
+        st.dataframe(
+            diff.style.format({c: "Rp {:,.0f}" for c in ["Total Gross", "Total Deduction", "THP (Total)", "THP Sebelumnya", "Selisih"]}),
+            use_container_width=True,
+            hide_index=True
+        )
+        c_m1, c_m2 = st.columns(2)
+        c_m1.metric("Karyawan Diproses", len(to_commit))
+        c_m2.metric("Total THP", f"Rp {to_commit['THP (Total)'].sum():,.0f}")
+
+        if st.button("Commit Payroll Run", type="primary", disabled=to_commit.empty, use_container_width=True):
+            store.add_gaji(to_commit)
+            st.success(f"Payroll {run_bulan} {run_tahun} untuk {len(to_commit)} karyawan berhasil disimpan!")
+            st.rerun()
+
+
+TAB_VIEWS = dict(zip(TAB_LABELS, [
+    employee_tab,
+    salary_tab,
+    tabungan_hari_raya_tab,
+    payroll_run_tab,
+]))
+run_tab("Human Capital", TAB_VIEWS, active_tab)
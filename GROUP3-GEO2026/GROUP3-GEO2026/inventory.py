@@ -1,49 +1,42 @@
 import streamlit as st
+from page_tabs import tab_bar, run_tab
 from pathlib import Path
 import pandas as pd
 from datetime import date
+from item_master import get_item_master
+from stock_count import load_sessions, normalize_counts, compute_variance, post_adjustments
+from stock_ledger import load_on_hand, load_ledger, rebuild_on_hand, take_snapshot, stock_as_of
 
 st.markdown("""
 <style>
-div[data-testid="stTabs"] {
-    width: 100%;
-}
-
-div[data-testid="stTabs"] > div > div {
-    display: flex;
-}
-
-button[data-testid="stTab"] {
-    flex: 1;
-    justify-content: center;
-    font-size: 16px;
-    font-weight: 600;
-}
-
 div.block-container {
     padding-top: 1rem;
 }
 </style>
 """, unsafe_allow_html=True)
 
-tabs = st.tabs([
+TAB_LABELS = [
     "Item",
-    "Inventory Taking Order"
-])
+    "Inventory Taking Order",
+    "Stock"
+]
+active_tab = tab_bar(TAB_LABELS, "inventory_tab")
 
-with tabs[0]:
-    BASE_DIR = Path(__file__).resolve().parent.parent
-    FILE_PATH = BASE_DIR / "Item.csv"
-    
-    data = pd.read_csv(FILE_PATH)
-    st.write(data)
+def item_tab():
+    items = get_item_master()
+
+    cari_item = st.text_input("Cari Item (nama diawali...)", key="item_search")
+    if cari_item:
+        st.dataframe(items.suggest(cari_item, limit=50), use_container_width=True, hide_index=True)
+    else:
+        st.dataframe(items.df, use_container_width=True, hide_index=True)
 
 
     st.subheader("Add New Item Data")
 
     with st.form("add_item", clear_on_submit=True):
         name = st.text_input("Item Name")
-        number = st.text_input("Item Code")
+        number = st.text_input("Item Code", placeholder="Kosongkan untuk kode otomatis")
         type = st.text_input("Item Type")
         unit = st.text_input("Unit")
         qty = st.number_input("Qty", step=1)
@@ -54,20 +47,14 @@ with tabs[0]:
         if name.strip() == "":
             st.error("Nama Item Wajib diisi!")
         else:
-            new_row = pd.DataFrame([[
-                name,
-                number,
-                type,
-                unit,
-                qty
-            ]], columns=data.columns)  
-
-            data = pd.concat([data, new_row], ignore_index=True)
-            data.to_csv(FILE_PATH, index=False)
-
-            st.rerun()
-
-with tabs[1]:
+            try:
+                items.add(name, number, type, unit, qty)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.rerun()
+
+def inventory_taking_order_tab():
     BASE_DIR = Path(__file__).resolve().parent.parent
     FILE_PATH = BASE_DIR / "Inventory.csv"
     
@@ -100,3 +87,87 @@ with tabs[1]:
             data.to_csv(FILE_PATH, index=False)
 
             st.rerun()
+
+    st.divider()
+    st.subheader("Input Hasil Hitung (Stock Count)")
+
+    sessions = load_sessions()
+    if sessions.empty:
+        st.info("Belum ada sesi Inventory Taking.")
+    else:
+        pilih_sesi = st.selectbox(
+            "Sesi", sessions["Session_ID"],
+            format_func=lambda s: f"{s} | " + " | ".join(sessions.set_index("Session_ID").loc[s, ["Date", "Warehouse", "PIC"]].astype(str)),
+            key="count_session"
+        )
+        sesi = sessions.set_index("Session_ID").loc[pilih_sesi]
+        count_warehouse = str(sesi["Warehouse"])
+
+        count_mode = st.radio("Cara Input", ["Upload File", "Isi Tabel"], horizontal=True, key="count_mode")
+        counts = None
+        if count_mode == "Upload File":
+            count_file = st.file_uploader("File hasil hitung (kolom Item / Item Code, Counted_Qty)", type=["csv", "xlsx", "xls"], key="count_file")
+            if count_file is not None:
+                try:
+                    raw = pd.read_excel(count_file) if count_file.name.lower().endswith((".xlsx", ".xls")) else pd.read_csv(count_file)
+                    counts = normalize_counts(raw, get_item_master())
+                except Exception as e:
+                    st.error(f"Error membaca file: {e}")
+        else:
+            on_hand_wh = load_on_hand()
+            on_hand_wh = on_hand_wh[on_hand_wh["Warehouse"] == count_warehouse]
+            edited_counts = st.data_editor(
+                pd.DataFrame({"Item": on_hand_wh["Item"], "Counted_Qty": on_hand_wh["Qty"]}),
+                num_rows="dynamic",
+                hide_index=True,
+                use_container_width=True,
+                key=f"count_editor_{pilih_sesi}"
+            )
+            counts = normalize_counts(edited_counts)
+
+        if counts is not None and not counts.empty:
+            variance = compute_variance(counts, count_warehouse)
+            c_v1, c_v2, c_v3 = st.columns(3)
+            c_v1.metric("Item Dihitung", len(variance))
+            c_v2.metric("Item Selisih", int((variance["Variance"] != 0).sum()))
+            c_v3.metric("Total Selisih Qty", f"{variance['Variance'].sum():,.0f}")
+            st.dataframe(variance[variance["Variance"] != 0], use_container_width=True, hide_index=True)
+
+            if str(sesi.get("Status", "")) == "Posted":
+                st.info("Sesi ini sudah diposting.")
+            elif st.button("Posting Penyesuaian Stok", type="primary", key="post_count"):
+                n_adj = post_adjustments(pilih_sesi, variance, sesi["Date"])
+                st.success(f"{n_adj} penyesuaian stok berhasil diposting.")
+                st.rerun()
+
+def stock_tab():
+    st.subheader("Stock On Hand")
+
+    col_s1, col_s2 = st.columns([3, 1])
+    with col_s1:
+        st.dataframe(load_on_hand(), use_container_width=True, hide_index=True)
+    with col_s2:
+        if st.button("Rebuild dari Ledger", use_container_width=True):
+            rebuild_on_hand()
+            st.success("Saldo stok dihitung ulang dari ledger.")
+            st.rerun()
+        if st.button("Ambil Snapshot", use_container_width=True):
+            take_snapshot()
+            st.success("Snapshot stok tersimpan.")
+
+    st.divider()
+    st.subheader("Stok per Tanggal")
+    as_of = st.date_input("Per Tanggal", date.today(), key="stock_as_of")
+    st.dataframe(stock_as_of(as_of), use_container_width=True, hide_index=True)
+
+    st.divider()
+    st.subheader("Riwayat Pergerakan Stok")
+    st.dataframe(load_ledger().iloc[::-1], use_container_width=True, hide_index=True)
+
+
+TAB_VIEWS = dict(zip(TAB_LABELS, [
+    item_tab,
+    inventory_taking_order_tab,
+    stock_tab,
+]))
+run_tab("Inventory", TAB_VIEWS, active_tab)
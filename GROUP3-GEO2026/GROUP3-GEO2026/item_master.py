@@ -0,0 +1,95 @@
+import re
+import bisect
+import pandas as pd
+import streamlit as st
+from pathlib import Path
+
+# ---------- Item master ----------
+# Item.csv dimuat sekali per proses. Item Code dijamin unik (item lama tanpa
+# kode diberi kode ITM-xxxx), dan ada index nama ter-normalisasi untuk lookup
+# serta pencarian prefix (type-ahead) tanpa membaca ulang file.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ITEM_FILE = BASE_DIR / "Item.csv"
+ITEM_COLS = ["Item Name", "Item Code", "Item Type", "Qty", "Unit"]
+
+
+def normalize_name(name):
+    return re.sub(r"\s+", " ", re.sub(r"[^0-9a-z ]", " ", str(name).lower())).strip()
+
+
+class ItemMaster:
+    def __init__(self):
+        self.df = pd.read_csv(ITEM_FILE, dtype={"Item Code": str}).reindex(columns=ITEM_COLS) if ITEM_FILE.exists() else pd.DataFrame(columns=ITEM_COLS)
+        self.df["Item Code"] = self.df["Item Code"].fillna("").astype(str).str.strip()
+        if self._assign_missing_codes():
+            self.save()
+        self._build_index()
+
+    def _assign_missing_codes(self):
+        blank = (self.df["Item Code"] == "") | self.df["Item Code"].duplicated()
+        if not blank.any():
+            return False
+        start = self._max_code_number() + 1
+        self.df.loc[blank, "Item Code"] = [f"ITM-{n:04d}" for n in range(start, start + blank.sum())]
+        return True
+
+    def _max_code_number(self):
+        nums = pd.to_numeric(self.df["Item Code"].str.extract(r"^ITM-(\d+)$")[0], errors="coerce")
+        return int(nums.max()) if nums.notna().any() else 0
+
+    def _build_index(self):
+        self.by_code = dict(zip(self.df["Item Code"], self.df.index))
+        self.by_name = {}
+        for code, name in zip(self.df["Item Code"], self.df["Item Name"]):
+            self.by_name.setdefault(normalize_name(name), code)
+        self.sorted_names = sorted(self.by_name)
+
+    def save(self):
+        self.df[ITEM_COLS].to_csv(ITEM_FILE, index=False)
+
+    # ----- lookup -----
+
+    def get(self, code):
+        idx = self.by_code.get(code)
+        return None if idx is None else self.df.loc[idx]
+
+    def code_for_name(self, name):
+        return self.by_name.get(normalize_name(name))
+
+    def suggest(self, prefix, limit=10):
+        """Item yang nama ter-normalisasinya diawali prefix, terurut alfabet."""
+        key = normalize_name(prefix)
+        start = bisect.bisect_left(self.sorted_names, key)
+        codes = []
+        for name in self.sorted_names[start:]:
+            if not name.startswith(key) or len(codes) >= limit:
+                break
+            codes.append(self.by_name[name])
+        return self.df.loc[[self.by_code[c] for c in codes], ITEM_COLS]
+
+    def names(self):
+        return self.df["Item Name"].tolist()
+
+    # ----- update -----
+
+    def add(self, name, code="", item_type="", unit="", qty=0):
+        code = str(code).strip() or f"ITM-{self._max_code_number() + 1:04d}"
+        if code in self.by_code:
+            raise ValueError(f"Item Code '{code}' sudah dipakai.")
+        if self.code_for_name(name) is not None:
+            raise ValueError(f"Item '{name}' sudah ada.")
+        row = pd.DataFrame([{"Item Name": name.strip(), "Item Code": code, "Item Type": item_type, "Qty": qty, "Unit": unit}])
+        self.df = pd.concat([self.df, row], ignore_index=True)
+        self.save()
+        idx = self.df.index[-1]
+        self.by_code[code] = idx
+        key = normalize_name(name)
+        self.by_name[key] = code
+        bisect.insort(self.sorted_names, key)
+        return code
+
+
+@st.cache_resource
+def get_item_master():
+    return ItemMaster()
@@ -0,0 +1,103 @@
+import time
+import pandas as pd
+from datetime import date
+
+from sales_data import DATA_DIR, FILES as SALES_FILES
+from finance_data import ACCOUNTS, FILES as FINANCE_FILES
+from ar_ledger import OPEN_FILE as AR_OPEN_FILE
+from ap_ledger import SUMMARY_FILE as AP_SUMMARY_FILE
+from stock_ledger import ON_HAND_FILE
+from item_master import ITEM_FILE
+from profiling import timed
+
+# ---------- Home KPI summary ----------
+# KPI dihitung dari file yang sudah ter-materialisasi (AR open invoices, AP
+# summary, stock on-hand, kas) lalu disimpan di data/KPISummary.csv. Home hanya
+# membaca tabel kecil ini; hitung ulang bila sumber berubah (mtime lebih baru
+# dari Signature), bulan berganti, atau umur ringkasan melewati KPI_TTL.
+
+KPI_FILE = DATA_DIR / "KPISummary.csv"
+KPI_COLS = ["Metric", "Key", "Value", "Updated_At", "Signature"]
+KPI_TTL = 15 * 60
+LOW_STOCK_QTY = 10
+LOW_STOCK_LIST = 10
+
+SOURCES = [SALES_FILES["si"], AR_OPEN_FILE, AP_SUMMARY_FILE, FINANCE_FILES["payment"], FINANCE_FILES["deposit"], ON_HAND_FILE, ITEM_FILE]
+
+
+def sources_signature():
+    return max((p.stat().st_mtime for p in SOURCES if p.exists()), default=0.0)
+
+
+def _read(path, usecols):
+    if not path.exists():
+        return pd.DataFrame(columns=usecols)
+    return pd.read_csv(path, usecols=lambda c: c in usecols).reindex(columns=usecols)
+
+
+def _num(s):
+    return pd.to_numeric(s, errors="coerce").fillna(0)
+
+
+@timed("transform")
+def compute_kpis(today=None):
+    today = pd.Timestamp(today or date.today())
+    month = today.strftime("%Y-%m")
+    rows = []
+
+    si = _read(SALES_FILES["si"], ["Date", "Total_Bill"])
+    in_month = pd.to_datetime(si["Date"], errors="coerce").dt.strftime("%Y-%m") == month
+    rows.append(("Penjualan Bulan Ini", month, _num(si.loc[in_month, "Total_Bill"]).sum()))
+
+    ar = _read(AR_OPEN_FILE, ["Outstanding"])
+    rows.append(("Piutang (AR)", "", _num(ar["Outstanding"]).sum()))
+
+    ap = _read(AP_SUMMARY_FILE, ["Sisa"])
+    rows.append(("Hutang (AP)", "", _num(ap["Sisa"]).sum()))
+
+    dep = _read(FINANCE_FILES["deposit"], ["Account", "Amount"])
+    pay = _read(FINANCE_FILES["payment"], ["Account", "Amount"])
+    cash = _num(dep["Amount"]).groupby(dep["Account"]).sum().sub(_num(pay["Amount"]).groupby(pay["Account"]).sum(), fill_value=0)
+    cash = cash.reindex(ACCOUNTS + [a for a in cash.index if a not in ACCOUNTS], fill_value=0)
+    rows += [("Kas", acc, val) for acc, val in cash.items()]
+
+    # StockOnHand.csv tidak menyimpan saldo 0; item master jadi daftar acuan
+    # supaya item habis / belum pernah bergerak ikut terhitung menipis.
+    stock = _read(ON_HAND_FILE, ["Item", "Qty"])
+    stock = _num(stock["Qty"]).groupby(stock["Item"].astype(str).str.strip()).sum()
+    items = _read(ITEM_FILE, ["Item Name"])["Item Name"].dropna().astype(str).str.strip()
+    stock = stock.reindex(stock.index.union(pd.Index(items.unique())), fill_value=0)
+    low = stock[stock <= LOW_STOCK_QTY].sort_values()
+    rows.append(("Stok Menipis", "", float(len(low))))
+    rows += [("Stok Menipis Item", item, qty) for item, qty in low.head(LOW_STOCK_LIST).items()]
+
+    df = pd.DataFrame(rows, columns=["Metric", "Key", "Value"])
+    df["Updated_At"] = time.time()
+    df["Signature"] = sources_signature()
+    return df[KPI_COLS]
+
+
+def refresh_kpis():
+    df = compute_kpis()
+    df.to_csv(KPI_FILE, index=False)
+    return df
+
+
+def load_kpis():
+    """Ringkasan KPI; dihitung ulang hanya bila basi."""
+    if not KPI_FILE.exists():
+        return refresh_kpis()
+    df = pd.read_csv(KPI_FILE, keep_default_na=False)
+    if df.empty:
+        return refresh_kpis()
+    stale = (
+        time.time() - float(df["Updated_At"].iloc[0]) > KPI_TTL
+        or sources_signature() > float(df["Signature"].iloc[0])
+        or df.loc[df["Metric"] == "Penjualan Bulan Ini", "Key"].ne(date.today().strftime("%Y-%m")).any()
+    )
+    return refresh_kpis() if stale else df
+
+
+def kpi_value(df, metric, key=""):
+    hit = df[(df["Metric"] == metric) & (df["Key"].astype(str) == key)]
+    return float(hit["Value"].iloc[0]) if len(hit) else 0.0
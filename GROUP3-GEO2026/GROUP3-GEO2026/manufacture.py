@@ -1,56 +1,288 @@
 import streamlit as st
+from page_tabs import tab_bar, run_tab
+from datetime import date
+from bom import COMPONENT_TYPES, SERVICE_CATEGORIES, load_bom, save_bom, get_bom_explosion, total_requirements
+from work_orders import load_work_orders, add_work_orders, open_work_orders
+from item_master import get_item_master
+from stock_ledger import load_on_hand
+from mrp import run_mrp
+from production_slips import (
+    load_material_slips, load_fg_slips, outstanding_requirements, produced_by_wo,
+    post_material_issue, post_finished_goods
+)
+from scheduler import STAGES, DEFAULT_ROUTING, load_routing, save_routing, load_workstations, save_workstations, get_scheduler
 
 
 st.markdown("""
 <style>
-div[data-testid="stTabs"] {
-    width: 100%;
-}
-
-div[data-testid="stTabs"] > div > div {
-    display: flex;
-}
-
-button[data-testid="stTab"] {
-    flex: 1;
-    justify-content: center;
-    font-size: 16px;
-    font-weight: 600;
-}
-            
 div.block-container {
     padding-top: 1rem;
 }
 </style>
 """, unsafe_allow_html=True)
 
-tabs = st.tabs([
+TAB_LABELS = [
     "Work Order",
     "Material Slip",
     "Process Stages",
     "Finished Goods Slip",
-])
+    "MRP",
+]
+active_tab = tab_bar(TAB_LABELS, "manufacture_tab")
+explosion = get_bom_explosion()
 
-with tabs[0]:
+def work_order_tab():
     st.subheader("Work Order")
-    st.write("Work Order content here")
 
-    
+    with st.expander("Bill of Materials (BOM)"):
+        st.caption("Komponen bertipe **Item** diambil dari Item.csv, **Jasa** dari kategori purchasing, **Sub-assembly** adalah produk lain yang punya BOM sendiri.")
+        item_names = get_item_master().names()
+        edited_bom = st.data_editor(
+            load_bom(),
+            num_rows="dynamic",
+            column_config={
+                "Component_Type": st.column_config.SelectboxColumn("Component_Type", options=COMPONENT_TYPES),
+                "Category": st.column_config.SelectboxColumn("Category", options=[""] + SERVICE_CATEGORIES),
+                "Qty_Per": st.column_config.NumberColumn("Qty_Per", min_value=0.0),
+            },
+            hide_index=True,
+            use_container_width=True,
+            key="bom_editor"
+        )
+        if st.button("Simpan BOM"):
+            save_bom(edited_bom)
+            st.success("BOM berhasil disimpan!")
+            st.rerun()
+        unknown = edited_bom[(edited_bom["Component_Type"] == "Item") & ~edited_bom["Component"].isin(item_names)]
+        if not unknown.empty:
+            st.warning("Komponen tidak ada di Item.csv: " + ", ".join(unknown["Component"].astype(str).unique()))
 
+    products = sorted(explosion.children)
 
+    col_w1, col_w2 = st.columns([1, 2])
+    with col_w1:
+        st.info("Buat Work Order")
+        with st.form("form_wo", clear_on_submit=True):
+            wo_product = st.selectbox("Produk", products)
+            wo_qty = st.number_input("Qty", min_value=1, value=1)
+            wo_due = st.date_input("Tanggal Selesai", date.today())
+            if st.form_submit_button("Simpan Work Order"):
+                if wo_product:
+                    new_wo = add_work_orders([wo_product], [wo_qty], [str(wo_due)])
+                    st.success(f"Work Order {new_wo['WO_ID'].iloc[0]} berhasil dibuat!")
+                    st.rerun()
+                else:
+                    st.error("Belum ada produk dengan BOM.")
 
-    
+    with col_w2:
+        st.write("### Daftar Work Order")
+        df_wo = load_work_orders()
+        event_wo = st.dataframe(
+            df_wo, use_container_width=True, hide_index=True,
+            on_select="rerun", selection_mode="multi-row", key="wo_table"
+        )
 
+    st.divider()
+    st.write("### Kebutuhan Material")
+    selected_wo = df_wo.iloc[event_wo.selection.rows] if event_wo.selection.rows else open_work_orders(df_wo)
+    if selected_wo.empty:
+        st.info("Tidak ada Work Order terbuka.")
+    else:
+        try:
+            requirements = explosion.explode(selected_wo)
+        except ValueError as e:
+            st.error(str(e))
+        else:
+            totals = total_requirements(requirements)
+            on_hand = load_on_hand().groupby("Item")["Qty"].sum()
+            totals["On_Hand"] = totals["Component"].map(on_hand).fillna(0).where(totals["Component_Type"] != "Jasa")
+            totals["Kurang"] = (totals["Required_Qty"] - totals["On_Hand"]).clip(lower=0)
+            st.caption(f"{len(selected_wo)} Work Order")
+            st.dataframe(totals, use_container_width=True, hide_index=True)
+            with st.expander("Rincian per Work Order"):
+                st.dataframe(requirements, use_container_width=True, hide_index=True)
 
-with tabs[1]:
+def material_slip_tab():
     st.subheader("Material Slip")
-    st.write("Material Slip content here")
 
-with tabs[2]:
+    open_wo = open_work_orders()
+    slip_wo_ids = st.multiselect("Work Order", open_wo["WO_ID"].tolist(), key="ms_wo")
+    if slip_wo_ids:
+        try:
+            plan = outstanding_requirements(open_wo[open_wo["WO_ID"].isin(slip_wo_ids)], explosion)
+        except ValueError as e:
+            st.error(str(e))
+        else:
+            plan = plan[(plan["Component_Type"] != "Jasa") & (plan["Remaining"] > 0)]
+            if plan.empty:
+                st.info("Semua material untuk WO ini sudah dikeluarkan.")
+            else:
+                plan = plan.assign(
+                    On_Hand=plan["Component"].map(load_on_hand().groupby("Item")["Qty"].sum()).fillna(0),
+                    Qty=plan["Remaining"],
+                )
+                edited_plan = st.data_editor(
+                    plan[["WO_ID", "Product", "Component", "Unit", "Required_Qty", "Issued", "Remaining", "On_Hand", "Qty"]],
+                    disabled=["WO_ID", "Product", "Component", "Unit", "Required_Qty", "Issued", "Remaining", "On_Hand"],
+                    column_config={"Qty": st.column_config.NumberColumn("Qty Keluar", min_value=0.0)},
+                    hide_index=True, use_container_width=True, key="ms_editor"
+                )
+                ms_date = st.date_input("Tanggal Slip", date.today(), key="ms_date")
+                short = edited_plan.groupby("Component")["Qty"].sum() > edited_plan.groupby("Component")["On_Hand"].first()
+                if short.any():
+                    st.warning("Stok kurang untuk: " + ", ".join(short[short].index))
+                if st.button("Posting Material Slip"):
+                    new_ms = post_material_issue(edited_plan, ms_date)
+                    st.success(f"{new_ms['Slip_ID'].nunique()} Material Slip diposting ({len(new_ms)} baris).")
+                    st.rerun()
+
+    with st.expander("Riwayat Material Slip"):
+        st.dataframe(load_material_slips(), use_container_width=True, hide_index=True)
+
+def process_stages_tab():
     st.subheader("Process Stages")
-    st.write("Process Stages content here")
 
-with tabs[3]:
+    col_r1, col_r2 = st.columns(2)
+    with col_r1:
+        with st.expander("Routing per Produk"):
+            st.caption("Produk tanpa routing memakai default: " + " -> ".join(s for s, _, _ in DEFAULT_ROUTING))
+            edited_routing = st.data_editor(
+                load_routing(), num_rows="dynamic", hide_index=True, use_container_width=True,
+                column_config={"Stage": st.column_config.SelectboxColumn("Stage", options=STAGES)},
+                key="routing_editor"
+            )
+            if st.button("Simpan Routing"):
+                save_routing(edited_routing)
+                st.rerun()
+    with col_r2:
+        with st.expander("Workstation"):
+            st.caption("Operator diambil dari data karyawan sesuai Posisi (mis. Penjahit untuk Sewing).")
+            edited_ws = st.data_editor(
+                load_workstations(), num_rows="dynamic", hide_index=True, use_container_width=True,
+                column_config={"Stage": st.column_config.SelectboxColumn("Stage", options=STAGES)},
+                key="workstation_editor"
+            )
+            if st.button("Simpan Workstation"):
+                save_workstations(edited_ws)
+                st.rerun()
+
+    scheduler = get_scheduler()
+    # update + table dalam satu lock supaya tabel cocok dengan jadwal rerun ini
+    with scheduler.lock:
+        n_resched = scheduler.update(open_work_orders())
+        n_scheduled = len(scheduler.entries)
+        schedule = scheduler.table()
+    cap_cols = st.columns(len(STAGES))
+    for col, stage in zip(cap_cols, STAGES):
+        col.metric(stage, f"{len(scheduler.lanes.get(stage, []))} lane")
+    st.caption(f"{n_scheduled} Work Order terjadwal, {n_resched} dijadwalkan ulang pada rerun ini.")
+
+    if schedule.empty:
+        st.info("Tidak ada Work Order terbuka.")
+    else:
+        no_cap = schedule[schedule["Workstation"] == "Tidak ada kapasitas"]
+        if not no_cap.empty:
+            st.warning("Tahap tanpa operator/workstation: " + ", ".join(no_cap["Stage"].unique()))
+        late = schedule.groupby("WO_ID")["Terlambat"].any()
+        if late.any():
+            st.error(f"{late.sum()} Work Order diperkirakan terlambat: " + ", ".join(late[late].index))
+        stage_filter = st.multiselect("Filter Stage", STAGES, default=STAGES)
+        st.dataframe(schedule[schedule["Stage"].isin(stage_filter)], use_container_width=True, hide_index=True)
+        with st.expander("Utilisasi per Lane"):
+            st.dataframe(scheduler.utilization(), use_container_width=True, hide_index=True)
+
+def finished_goods_slip_tab():
     st.subheader("Finished Goods Slip")
-    st.write("Finished Goods Slip content here")
+    st.caption("Komponen yang belum dikeluarkan lewat Material Slip akan di-backflush otomatis sesuai BOM.")
+
+    fg_wo = open_work_orders()[["WO_ID", "Product", "Qty", "Due_Date", "Status"]]
+    if fg_wo.empty:
+        st.info("Tidak ada Work Order terbuka.")
+    else:
+        fg_wo = fg_wo.assign(Produced=fg_wo["WO_ID"].map(produced_by_wo()).fillna(0))
+        fg_wo = fg_wo.assign(Sisa=(fg_wo["Qty"] - fg_wo["Produced"]).clip(lower=0), Selesai=0.0)
+        edited_fg = st.data_editor(
+            fg_wo,
+            disabled=["WO_ID", "Product", "Qty", "Due_Date", "Status", "Produced", "Sisa"],
+            column_config={"Selesai": st.column_config.NumberColumn("Selesai", min_value=0.0)},
+            hide_index=True, use_container_width=True, key="fg_editor"
+        )
+        fg_date = st.date_input("Tanggal Slip", date.today(), key="fg_date")
+        if st.button("Posting Finished Goods Slip"):
+            reports = edited_fg[["WO_ID", "Selesai"]].rename(columns={"Selesai": "Qty"})
+            try:
+                new_fg, backflush = post_finished_goods(reports, explosion, fg_date)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                if new_fg.empty:
+                    st.warning("Isi kolom Selesai terlebih dahulu.")
+                else:
+                    st.success(f"{len(new_fg)} Finished Goods Slip diposting, {len(backflush)} komponen di-backflush.")
+                    st.rerun()
+
+    with st.expander("Riwayat Finished Goods Slip"):
+        st.dataframe(load_fg_slips(), use_container_width=True, hide_index=True)
+
+
+def mrp_tab():
+    st.subheader("Material Requirements Planning")
+    st.caption("Demand = max(forecast, sisa Sales Order) per bulan, di-netting terhadap stok, WO terbuka dan PO Pending.")
+
+    with st.form("form_mrp"):
+        col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+        mrp_horizon = col_m1.number_input("Horizon (bulan)", min_value=1, max_value=24, value=6)
+        mrp_wo_lead = col_m2.number_input("Lead time produksi (bulan)", min_value=0, max_value=6, value=0)
+        mrp_po_lead = col_m3.number_input("Lead time pembelian (bulan)", min_value=0, max_value=6, value=0)
+        mrp_forecast = col_m4.checkbox("Pakai forecast", value=True)
+        run_mrp_btn = st.form_submit_button("Jalankan MRP")
+
+    if run_mrp_btn:
+        try:
+            with st.spinner("Menghitung MRP..."):
+                st.session_state["mrp_result"] = run_mrp(
+                    horizon=int(mrp_horizon), use_forecast=mrp_forecast,
+                    wo_lead_periods=int(mrp_wo_lead), po_lead_periods=int(mrp_po_lead)
+                )
+        except ValueError as e:
+            st.error(str(e))
+
+    mrp_result = st.session_state.get("mrp_result")
+    if mrp_result:
+        sug_wo = mrp_result["work_orders"]
+        sug_po = mrp_result["purchases"]
+
+        st.write("### Saran Work Order")
+        if sug_wo.empty:
+            st.info("Tidak ada kebutuhan produksi baru.")
+        else:
+            st.dataframe(sug_wo, use_container_width=True, hide_index=True)
+            if st.button("Buat Work Order dari Saran"):
+                new_wo = add_work_orders(sug_wo["Product"].tolist(), sug_wo["Qty"].tolist(), sug_wo["Due_Date"].tolist())
+                del st.session_state["mrp_result"]
+                st.success(f"{len(new_wo)} Work Order dibuat ({new_wo['WO_ID'].iloc[0]} s/d {new_wo['WO_ID'].iloc[-1]}).")
+                st.rerun()
+
+        st.write("### Saran Purchase Order")
+        if sug_po.empty:
+            st.info("Tidak ada kebutuhan pembelian.")
+        else:
+            if sug_po["Unit_Mismatch"].any():
+                st.warning(f"{int(sug_po['Unit_Mismatch'].sum())} saran PO tanpa harga: riwayat harga hanya ada dalam satuan lain (lihat Price_Unit).")
+            st.dataframe(sug_po, use_container_width=True, hide_index=True)
+            st.download_button("Download Saran PO", sug_po.to_csv(index=False).encode("utf-8"), "saran_po.csv", "text/csv")
+
+        with st.expander("Detail per Produk"):
+            st.dataframe(mrp_result["product_grid"], use_container_width=True, hide_index=True)
+        with st.expander("Detail per Komponen"):
+            st.dataframe(mrp_result["component_grid"], use_container_width=True, hide_index=True)
+
 
+TAB_VIEWS = dict(zip(TAB_LABELS, [
+    work_order_tab,
+    material_slip_tab,
+    process_stages_tab,
+    finished_goods_slip_tab,
+    mrp_tab,
+]))
+run_tab("Manufacture", TAB_VIEWS, active_tab)
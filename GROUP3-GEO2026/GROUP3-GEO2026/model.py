@@ -1,62 +1,77 @@
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.impute import SimpleImputer
-from sklearn.model_selection import train_test_split
+from functools import lru_cache
 from pathlib import Path
 
-# ---------- Load & train model ONCE ----------
+from profiling import timed
+
+# ---------- Revenue model ----------
+# Dilatih sekali per proses saat prediksi pertama (bukan saat import),
+# jadi halaman lain tidak ikut membaca GEO_data.xlsx atau memuat sklearn.
 BASE_DIR = Path(__file__).resolve().parent.parent
 FILE_PATH = BASE_DIR / "GEO_data.xlsx"
-df = pd.read_excel(FILE_PATH)
 
-# Clean numeric columns
-for col in ["QTY", "HARGA", "JUMLAH"]:
-    df[col] = pd.to_numeric(df[col], errors="coerce")
 
-df = df[df["JUMLAH"].notna() & (df["JUMLAH"] > 0)]
-df = df[df["QTY"].notna() & (df["QTY"] > 0)]
-df = df.reset_index(drop=True)
+@lru_cache(maxsize=1)
+@timed("model")
+def load_model():
+    from sklearn.linear_model import LinearRegression
+    from sklearn.impute import SimpleImputer
+
+    df = pd.read_excel(FILE_PATH)
+
+    # Clean numeric columns
+    for col in ["QTY", "HARGA", "JUMLAH"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
 
-# Encode SATUAN
-df = pd.get_dummies(df, columns=["SATUAN"], drop_first=True)
+    df = df[df["JUMLAH"].notna() & (df["JUMLAH"] > 0)]
+    df = df[df["QTY"].notna() & (df["QTY"] > 0)]
+    df = df.reset_index(drop=True)
 
-# Impute HARGA
-price_imputer = SimpleImputer(strategy="median")
-df["HARGA"] = price_imputer.fit_transform(df[["HARGA"]])
+    # Encode SATUAN
+    df = pd.get_dummies(df, columns=["SATUAN"], drop_first=True)
 
-# Log features
-df["log_QTY"] = np.log(df["QTY"])
-df["log_HARGA"] = np.log(df["HARGA"])
-df["log_JUMLAH"] = np.log(df["JUMLAH"])
+    # Impute HARGA
+    price_imputer = SimpleImputer(strategy="median")
+    df["HARGA"] = price_imputer.fit_transform(df[["HARGA"]])
 
-# Feature list
-satuan_columns = [c for c in df.columns if c.startswith("SATUAN_")]
-features = ["log_QTY", "log_HARGA"] + satuan_columns
+    # Log features
+    df["log_QTY"] = np.log(df["QTY"])
+    df["log_HARGA"] = np.log(df["HARGA"])
+    df["log_JUMLAH"] = np.log(df["JUMLAH"])
 
-X = df[features]
-y = df["log_JUMLAH"]
+    # Feature list
+    satuan_columns = [c for c in df.columns if c.startswith("SATUAN_")]
+    features = ["log_QTY", "log_HARGA"] + satuan_columns
 
-# Train model
-model = LinearRegression()
-model.fit(X, y)
+    X = df[features]
+    y = df["log_JUMLAH"]
 
-# Store medians for inference
-log_qty_median = np.log(df["QTY"].median())
-log_harga_median = np.log(df["HARGA"].median())
+    # Train model
+    model = LinearRegression()
+    model.fit(X, y)
+
+    # Store medians for inference
+    return {
+        "model": model,
+        "satuan_columns": satuan_columns,
+        "log_qty_median": np.log(df["QTY"].median()),
+        "log_harga_median": np.log(df["HARGA"].median()),
+    }
 
 # ---------- Prediction function ----------
 
 def predict_jumlah(qty=None, harga=None, satuan="pcs"):
-    log_qty = np.log(qty) if qty is not None else log_qty_median
-    log_harga = np.log(harga) if harga is not None else log_harga_median
+    state = load_model()
+    log_qty = np.log(qty) if qty is not None else state["log_qty_median"]
+    log_harga = np.log(harga) if harga is not None else state["log_harga_median"]
 
     input_dict = {
         "log_QTY": log_qty,
         "log_HARGA": log_harga,
     }
 
-    for col in satuan_columns:
+    for col in state["satuan_columns"]:
         input_dict[col] = 0
 
     if satuan != "pcs":
@@ -66,5 +81,5 @@ def predict_jumlah(qty=None, harga=None, satuan="pcs"):
 
     input_df = pd.DataFrame([input_dict])
 
-    log_pred = model.predict(input_df)[0]
+    log_pred = state["model"].predict(input_df)[0]
     return float(np.exp(log_pred))
@@ -0,0 +1,246 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from datetime import date
+
+from purchasing_data import BASE_DIR, COL_TGL, COL_SUP, COL_ITM, COL_QTY, COL_STS, po_files, load_data
+from price_index import normalize_item, normalize_unit, parse_qty, get_price_index
+from sales_data import FILES, COLUMNS, load_data as load_sales
+from delivery_lines import remaining_lines
+from stock_ledger import load_on_hand
+from work_orders import open_work_orders
+from bom import get_bom_explosion
+from production_slips import produced_by_wo, outstanding_requirements
+
+# ---------- MRP (Material Requirements Planning) ----------
+# Semua hitungan dilakukan sebagai array item x periode (bulan):
+#   gross     = max(forecast, sisa SO)     -> forecast di-"consume" oleh order
+#   projected = on_hand + cumsum(receipts - gross)
+#   planned   = kenaikan running-max dari kekurangan (lot-for-lot)
+# WO terbuka dihitung sebesar sisa yang belum selesai / belum dikeluarkan materialnya.
+# Produk ber-BOM menjadi saran Work Order, kebutuhan komponennya di-explode
+# lalu di-netting lagi terhadap stok + PO Pending menjadi saran PO.
+
+GEO_FILE = BASE_DIR / "GEO_data.xlsx"
+FORECAST_QUARTERS = 12
+
+
+def month_index(dates, start):
+    """Nomor periode (bulan) relatif terhadap start; NaT -> 0."""
+    dates = pd.to_datetime(pd.Series(dates), errors="coerce")
+    idx = (dates.dt.year - start.year) * 12 + (dates.dt.month - start.month)
+    return idx.fillna(0).astype(int).clip(lower=0).to_numpy()
+
+
+def to_matrix(keys, periods, qty, index, horizon):
+    """Jumlahkan qty ke matrix (len(index) x horizon); periode >= horizon dibuang."""
+    mat = np.zeros((len(index), horizon))
+    rows = index.get_indexer(pd.Series(keys))
+    periods = np.asarray(periods)
+    ok = (rows >= 0) & (periods < horizon)
+    np.add.at(mat, (rows[ok], periods[ok]), np.asarray(qty, dtype=float)[ok])
+    return mat
+
+
+def net_requirements(gross, on_hand, receipts):
+    """
+    Netting lot-for-lot untuk semua item sekaligus.
+    gross, receipts: item x periode; on_hand: per item.
+    Kembalikan (planned receipt per periode, projected on hand sebelum planned).
+    """
+    projected = on_hand[:, None] + np.cumsum(receipts - gross, axis=1)
+    shortage = np.maximum.accumulate(np.maximum(-projected, 0), axis=1)
+    planned = np.diff(shortage, axis=1, prepend=0)
+    return planned, projected
+
+
+def shift_back(mat, periods):
+    """Offset lead time: planned receipt di periode t dirilis di t - periods (minimal 0)."""
+    if periods <= 0:
+        return mat
+    periods = min(periods, mat.shape[1] - 1)
+    out = np.zeros_like(mat)
+    out[:, 0] = mat[:, :periods + 1].sum(axis=1)
+    out[:, 1:mat.shape[1] - periods] = mat[:, periods + 1:]
+    return out
+
+
+def _geo_signature():
+    return GEO_FILE.stat().st_mtime if GEO_FILE.exists() else None
+
+
+@st.cache_data
+def _forecast_quarters(quarters, signature):
+    from forecast import run_forecast
+    return run_forecast(pd.read_excel(GEO_FILE), quarters)["future_df"]
+
+
+def forecast_monthly(start, horizon):
+    """Forecast total qty (GEO_data.xlsx) dibagi rata per bulan di setiap kuartal."""
+    if not GEO_FILE.exists():
+        return np.zeros(horizon)
+    future = _forecast_quarters(FORECAST_QUARTERS, _geo_signature())
+    months = future["TANGGAL PEMESANAN"].repeat(3).reset_index(drop=True)
+    months = months + pd.to_timedelta(np.tile([0, 31, 62], len(future)), unit="D")
+    qty = future["Forecasted QTY"].repeat(3).to_numpy() / 3
+    out = np.zeros(horizon)
+    p = month_index(months, start)
+    ok = (months >= start).to_numpy() & (p < horizon)
+    np.add.at(out, p[ok], qty[ok])
+    return out
+
+
+def product_mix(df_so):
+    """Porsi qty per produk dari seluruh Sales Order (untuk memecah forecast total)."""
+    qty = pd.to_numeric(df_so["Qty"], errors="coerce").fillna(0)
+    mix = qty.groupby(df_so["Item"].astype(str).str.strip()).sum()
+    mix = mix[mix > 0]
+    return mix / mix.sum() if mix.sum() else mix
+
+
+def pending_po_receipts(po_lead_days=14):
+    """PO berstatus Pending (yang punya tanggal) sebagai scheduled receipt."""
+    frames = []
+    for category, file_name in po_files.items():
+        df = load_data(BASE_DIR / file_name)
+        df = df[(df[COL_STS] == "Pending") & df[COL_ITM].astype(str).str.strip().ne("")]
+        df = df.assign(Kategori=category)
+        frames.append(df[[COL_TGL, COL_SUP, COL_ITM, COL_QTY, "Kategori"]])
+    df = pd.concat(frames, ignore_index=True)
+    df["Arrival"] = pd.to_datetime(df[COL_TGL], errors="coerce") + pd.Timedelta(days=po_lead_days)
+    df = df.dropna(subset=["Arrival"])
+    df["item_key"] = df[COL_ITM].map(normalize_item)
+    df["Qty_Num"] = df[COL_QTY].map(lambda q: parse_qty(q)[0])
+    return df
+
+
+def run_mrp(horizon=6, use_forecast=True, wo_lead_periods=0, po_lead_periods=0, po_lead_days=14, start=None):
+    """
+    Satu run MRP. Kembalikan dict:
+      periods        : daftar bulan
+      work_orders    : saran WO (Product, Period, Release, Due_Date, Qty)
+      purchases      : saran PO (Component, Unit, Component_Type, Category, Period, Order_Date, Qty, Supplier, Unit_Price)
+      product_grid   : gross / projected / planned per produk per bulan
+      component_grid : gross / projected / planned per komponen per bulan
+    """
+    start = pd.Timestamp(start or date.today()).to_period("M").to_timestamp()
+    periods = pd.period_range(start, periods=horizon, freq="M")
+    explosion = get_bom_explosion()
+
+    # ----- level produk -----
+    df_so = load_sales("so")
+    df_dol = load_sales("dol") if FILES["dol"].exists() else pd.DataFrame(columns=COLUMNS["dol"])
+    lines = remaining_lines(df_so, df_dol)
+    lines = lines[(lines["Remaining"] > 0) & ~lines["Status"].isin(["Delivered", "Cancelled"])]
+    lines = lines.assign(Item=lines["Item"].astype(str).str.strip())
+
+    mix = product_mix(df_so) if use_forecast else pd.Series(dtype=float)
+    wo = open_work_orders()
+    products = pd.Index(sorted(set(lines["Item"]) | set(mix.index) | set(wo["Product"].astype(str))))
+
+    so_demand = to_matrix(lines["Item"], month_index(lines["Date"], start), lines["Remaining"], products, horizon)
+    fc_demand = np.zeros_like(so_demand)
+    if len(mix):
+        fc_demand = np.outer(mix.reindex(products).fillna(0).to_numpy(), forecast_monthly(start, horizon))
+    gross = np.maximum(so_demand, fc_demand)
+
+    stock = load_on_hand().assign(Qty=lambda d: pd.to_numeric(d["Qty"], errors="coerce").fillna(0))
+    stock = stock.groupby(stock["Item"].astype(str).str.strip())["Qty"].sum()
+    to_produce = (wo["Qty"] - wo["WO_ID"].map(produced_by_wo()).fillna(0)).clip(lower=0)
+    wo_receipts = to_matrix(wo["Product"].astype(str), month_index(wo["Due_Date"], start), to_produce, products, horizon)
+    planned, projected = net_requirements(gross, stock.reindex(products).fillna(0).to_numpy(), wo_receipts)
+
+    has_bom = products.isin(list(explosion.children))
+    wo_release = shift_back(planned, wo_lead_periods)
+
+    # ----- level komponen -----
+    # kebutuhan = planned WO (di-explode) + sisa material WO terbuka yang belum
+    # dikeluarkan, plus produk tanpa BOM yang dibeli jadi
+    demand_long = _long(products[has_bom], wo_release[has_bom])
+    exploded = demand_long.merge(explosion.flat_table(demand_long["Product"]), on="Product")
+    exploded["Qty"] = exploded["Qty"] * exploded["Qty_Per"]
+    open_req = outstanding_requirements(wo, explosion)
+    open_req = open_req.join(wo.set_index("WO_ID")["Due_Date"], on="WO_ID")
+    open_long = pd.DataFrame({
+        "Period": month_index(open_req["Due_Date"], start), "Qty": open_req["Remaining"].to_numpy(),
+        "Component": open_req["Component"].to_numpy(), "Unit": open_req["Unit"].to_numpy(),
+        "Component_Type": open_req["Component_Type"].to_numpy(), "Category": open_req["Category"].to_numpy(),
+    })
+
+    bought = _long(products[~has_bom], planned[~has_bom]).rename(columns={"Product": "Component"})
+    bought = bought.assign(Unit="", Component_Type="Item", Category="")
+    comp_long = pd.concat([exploded.drop(columns=["Product", "Qty_Per"]), open_long, bought], ignore_index=True)
+    comp_long["item_key"] = comp_long["Component"].map(normalize_item)
+
+    comps = comp_long.drop_duplicates("item_key").set_index("item_key")[["Component", "Unit", "Component_Type", "Category"]]
+    comps = comps.sort_values("Component")
+    comp_index = comps.index
+
+    comp_gross = to_matrix(comp_long["item_key"], comp_long["Period"], comp_long["Qty"], comp_index, horizon)
+    po = pending_po_receipts(po_lead_days)
+    comp_receipts = to_matrix(po["item_key"], month_index(po["Arrival"], start), po["Qty_Num"], comp_index, horizon)
+    stock_by_key = stock.groupby(stock.index.map(normalize_item)).sum()
+    comp_on_hand = np.where(comps["Component_Type"].to_numpy() == "Jasa", 0, stock_by_key.reindex(comp_index).fillna(0).to_numpy())
+    comp_planned, comp_projected = net_requirements(comp_gross, comp_on_hand, comp_receipts)
+    po_release = shift_back(comp_planned, po_lead_periods)
+
+    # ----- hasil -----
+    sug_wo = _long(products[has_bom], planned[has_bom])
+    sug_wo["Due_Date"] = periods[sug_wo["Period"]].end_time.strftime("%Y-%m-%d")
+    sug_wo["Release"] = periods[(sug_wo["Period"] - wo_lead_periods).clip(lower=0)].astype(str)
+    sug_wo["Qty"] = np.ceil(sug_wo["Qty"]).astype(int)
+    sug_wo["Period"] = periods[sug_wo["Period"]].astype(str)
+
+    sug_po = _long(comp_index, po_release).rename(columns={"Product": "item_key"})
+    sug_po = sug_po.join(comps, on="item_key")
+    sug_po["Order_Date"] = periods[sug_po["Period"]].start_time.strftime("%Y-%m-%d")
+    sug_po["Period"] = periods[sug_po["Period"]].astype(str)
+    sug_po = sug_po.join(cheapest_supplier(sug_po["item_key"], sug_po["Unit"]))
+
+    return {
+        "periods": periods,
+        "work_orders": sug_wo[["Product", "Period", "Release", "Due_Date", "Qty"]],
+        "purchases": sug_po[["Component", "Unit", "Component_Type", "Category", "Period", "Order_Date", "Qty", "Supplier", "Unit_Price", "Price_Unit", "Unit_Mismatch"]],
+        "product_grid": _grid(products, periods, Gross=gross, Receipts=wo_receipts, Projected=projected, Planned=planned),
+        "component_grid": _grid(comps["Component"], periods, Gross=comp_gross, Receipts=comp_receipts, Projected=comp_projected, Planned=comp_planned),
+    }
+
+
+def cheapest_supplier(item_keys, units):
+    """
+    Supplier termurah per baris dari price index, dicocokkan dengan (item, satuan).
+    Tanpa satuan komponen, harga satuan apa pun dipakai. Bila harga hanya ada
+    dalam satuan lain, Supplier / Unit_Price dikosongkan dan Unit_Mismatch = True
+    (Price_Unit berisi satuan yang tersedia).
+    """
+    stats = get_price_index().stats.sort_values("min")
+    by_unit = stats.drop_duplicates(["item_key", "unit"]).set_index(["item_key", "unit"])
+    by_item = stats.drop_duplicates("item_key").set_index("item_key")
+    other_units = stats.groupby("item_key")["unit"].unique().map(", ".join)
+
+    units = units.fillna("").astype(str).str.strip()
+    has_unit = (units != "").to_numpy()
+    exact = by_unit.reindex(pd.MultiIndex.from_arrays([item_keys, units.map(normalize_unit)]))
+    loose = by_item.reindex(item_keys)
+    out = pd.DataFrame(index=item_keys.index)
+    for col, src in [("Supplier", COL_SUP), ("Unit_Price", "min"), ("Price_Unit", "unit")]:
+        out[col] = np.where(has_unit, exact[src].to_numpy(), loose[src].to_numpy())
+    out["Unit_Mismatch"] = has_unit & exact["min"].isna().to_numpy() & loose["min"].notna().to_numpy()
+    out.loc[out["Unit_Mismatch"], "Price_Unit"] = item_keys[out["Unit_Mismatch"]].map(other_units)
+    return out
+
+
+def _long(index, mat):
+    """Matrix item x periode -> baris (Product, Period, Qty) untuk sel > 0."""
+    rows, cols = np.nonzero(mat > 1e-9)
+    return pd.DataFrame({"Product": np.asarray(index)[rows], "Period": cols, "Qty": mat[rows, cols]})
+
+
+def _grid(index, periods, **mats):
+    """Tabel lebar: satu baris per item per ukuran, kolom = bulan."""
+    frames = [
+        pd.DataFrame(mat.round(2), columns=periods.astype(str)).assign(Item=np.asarray(index), Measure=name)
+        for name, mat in mats.items()
+    ]
+    grid = pd.concat(frames, ignore_index=True)
+    return grid.set_index(["Item", "Measure"]).sort_index().reset_index()
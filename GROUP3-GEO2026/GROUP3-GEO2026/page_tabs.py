@@ -0,0 +1,48 @@
+import functools
+import streamlit as st
+
+from profiling import rerun as profile_rerun
+
+# ---------- Tab bar yang hanya merender tab aktif ----------
+# st.tabs selalu menjalankan isi semua tab. Di sini tab dipilih lewat
+# segmented control; halaman memanggil fungsi tab aktif saja lewat run_tab,
+# yang menjadikannya st.fragment (interaksi di dalamnya hanya me-rerun tab itu).
+# Rerun fragment tidak lewat app.py, jadi run_tab membuka record profiling
+# sendiri bertanda halaman + tab; saat render penuh record halaman yang dipakai.
+# Gaya tab lama (lebar penuh, tombol rata, tebal) dipasang di sini untuk
+# segmented control di dalam container bar tab saja.
+
+TAB_BAR_CSS = """
+<style>
+.st-key-{key}_bar div[data-testid="stButtonGroup"] {{ width: 100%; }}
+.st-key-{key}_bar div[data-testid="stButtonGroup"] > div {{ display: flex; width: 100%; }}
+.st-key-{key}_bar button {{ flex: 1; justify-content: center; font-size: 16px; font-weight: 600; }}
+</style>
+"""
+
+
+def tab_bar(labels, key):
+    """Tampilkan pilihan tab, kembalikan label tab yang aktif."""
+    last_key = f"_{key}_last"
+    last = st.session_state.get(last_key, labels[0])
+    st.markdown(TAB_BAR_CSS.format(key=key), unsafe_allow_html=True)
+    with st.container(key=f"{key}_bar"):
+        active = st.segmented_control(
+            "Menu", labels, default=last if last in labels else labels[0],
+            key=key, label_visibility="collapsed"
+        )
+    active = active or last
+    st.session_state[last_key] = active
+    return active
+
+
+def run_tab(page, views, active):
+    """Jalankan fungsi tab aktif dari views ({label: fungsi}) sebagai fragment."""
+    view = views[active]
+
+    @functools.wraps(view)
+    def profiled():
+        with profile_rerun(page, tab=active):
+            view()
+
+    st.fragment(profiled)()
@@ -0,0 +1,60 @@
+import pandas as pd
+
+from payroll_store import DATA_ROOT, GAJI_COLS
+
+# ---------- Payroll run ----------
+# Template gaji per karyawan (db_template_gaji.csv) diterapkan ke semua
+# karyawan aktif untuk satu periode dalam satu perhitungan DataFrame.
+
+FILE_TEMPLATE = DATA_ROOT / "db_template_gaji.csv"
+TEMPLATE_AMOUNTS = ["Gaji Pokok", "Tunjangan", "Komisi", "Potongan", "Iuran", "Tabungan HR"]
+TEMPLATE_COLS = ["Nama Karyawan"] + TEMPLATE_AMOUNTS + ["Aktif"]
+
+
+def load_templates(karyawan):
+    """Template untuk setiap karyawan; karyawan tanpa template mendapat baris nol."""
+    if FILE_TEMPLATE.exists():
+        tpl = pd.read_csv(FILE_TEMPLATE).reindex(columns=TEMPLATE_COLS)
+    else:
+        tpl = pd.DataFrame(columns=TEMPLATE_COLS)
+    tpl = pd.DataFrame({"Nama Karyawan": karyawan["Nama Lengkap"].drop_duplicates()}).merge(tpl, on="Nama Karyawan", how="left")
+    tpl[TEMPLATE_AMOUNTS] = tpl[TEMPLATE_AMOUNTS].apply(pd.to_numeric, errors="coerce").fillna(0).astype("int64")
+    tpl["Aktif"] = ~tpl["Aktif"].astype(str).str.strip().str.lower().isin(["false", "0", "no", "tidak"])
+    return tpl[TEMPLATE_COLS]
+
+
+def save_templates(tpl):
+    tpl[TEMPLATE_COLS].to_csv(FILE_TEMPLATE, index=False)
+
+
+def compute_run(templates, periode, tipe, tgl_input, jatuh_tempo):
+    """Baris gaji untuk semua karyawan aktif, dihitung sekaligus."""
+    run = templates[templates["Aktif"]].copy()
+    run["Total Gross"] = run["Gaji Pokok"] + run["Tunjangan"] + run["Komisi"]
+    run["Total Deduction"] = run["Potongan"] + run["Iuran"] + run["Tabungan HR"]
+    run["THP (Total)"] = run["Total Gross"] - run["Total Deduction"]
+    run["Periode"] = periode
+    run["Tipe"] = tipe
+    run["Tgl Input"] = str(tgl_input)
+    run["Jatuh Tempo"] = str(jatuh_tempo)
+    return run[GAJI_COLS].reset_index(drop=True)
+
+
+def diff_run(run, gaji):
+    """
+    Bandingkan hasil run dengan data yang sudah ada: tandai karyawan yang sudah
+    digaji di periode & tipe yang sama, dan selisih THP terhadap gaji terakhir.
+    """
+    same_period = gaji[(gaji["Periode"] == run["Periode"].iloc[0]) & (gaji["Tipe"] == run["Tipe"].iloc[0])] if len(run) else gaji.iloc[0:0]
+    already = set(same_period["Nama Karyawan"])
+    last_thp = gaji.groupby("Nama Karyawan")["THP (Total)"].last()
+
+    diff = run[["Nama Karyawan", "Total Gross", "Total Deduction", "THP (Total)"]].copy()
+    diff["THP Sebelumnya"] = diff["Nama Karyawan"].map(last_thp).fillna(0).astype("int64")
+    diff["Selisih"] = diff["THP (Total)"] - diff["THP Sebelumnya"]
+    diff["Keterangan"] = diff["Nama Karyawan"].isin(already).map({True: "Sudah ada di periode ini (dilewati)", False: "Baru"})
+    return diff
+
+
+def rows_to_commit(run, diff):
+    return run[(diff["Keterangan"] == "Baru").to_numpy()]
@@ -0,0 +1,114 @@
+import pandas as pd
+import streamlit as st
+from pathlib import Path
+
+from profiling import timed, counted_write
+
+# ---------- Payroll data store ----------
+# Data karyawan & gaji disimpan di folder aplikasi (bukan cwd proses).
+# Insert hanya menambah baris di akhir file; frame di memori dipakai ulang
+# antar rerun dan ikut di-update saat insert.
+
+DATA_ROOT = Path(__file__).resolve().parent
+FILE_KARYAWAN = DATA_ROOT / "db_karyawan.csv"
+FILE_GAJI = DATA_ROOT / "db_gaji.csv"
+
+KARYAWAN_COLS = ["Nama Lengkap", "No KTP", "Posisi", "Kontak", "Tanggal Masuk", "Alamat"]
+GAJI_COLS = [
+    "Periode", "Tipe", "Tgl Input", "Jatuh Tempo", "Nama Karyawan",
+    "Gaji Pokok", "Tunjangan", "Komisi", "Total Gross",
+    "Potongan", "Iuran", "Tabungan HR", "Total Deduction", "THP (Total)"
+]
+GAJI_NUMERIC = ["Gaji Pokok", "Tunjangan", "Komisi", "Total Gross", "Potongan", "Iuran", "Tabungan HR", "Total Deduction", "THP (Total)"]
+KARYAWAN_DTYPES = {"No KTP": str, "Kontak": str}
+
+
+def _typed_gaji(df):
+    df = df.reindex(columns=GAJI_COLS)
+    df[GAJI_NUMERIC] = df[GAJI_NUMERIC].apply(pd.to_numeric, errors="coerce").fillna(0).astype("int64")
+    return df
+
+
+class PayrollStore:
+    def __init__(self):
+        self.init_csv()
+        self.mtimes = {}
+        self.karyawan = self._read(FILE_KARYAWAN, KARYAWAN_COLS, dtype=KARYAWAN_DTYPES)
+        self.gaji = _typed_gaji(self._read(FILE_GAJI, GAJI_COLS))
+        self._index_gaji()
+
+    @staticmethod
+    def init_csv():
+        """Memastikan file CSV tersedia dengan header yang benar"""
+        if not FILE_KARYAWAN.exists():
+            pd.DataFrame(columns=KARYAWAN_COLS).to_csv(FILE_KARYAWAN, index=False)
+        if not FILE_GAJI.exists():
+            pd.DataFrame(columns=GAJI_COLS).to_csv(FILE_GAJI, index=False)
+
+    @timed("load")
+    def _read(self, path, cols, dtype=None):
+        try:
+            df = pd.read_csv(path, dtype=dtype)
+        except Exception:
+            df = pd.DataFrame(columns=cols)
+        self.mtimes[path] = path.stat().st_mtime
+        return df.reindex(columns=cols)
+
+    def _append(self, path, df_new, cols):
+        text = df_new[cols].to_csv(header=False, index=False).encode("utf-8")
+        with counted_write(path, append=True), open(path, "rb+") as f:
+            f.seek(0, 2)
+            if f.tell() > 0:
+                f.seek(-1, 2)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.seek(0, 2)
+            f.write(text)
+        self.mtimes[path] = path.stat().st_mtime
+
+    def refresh(self):
+        """Baca ulang file yang diubah di luar aplikasi."""
+        if self.mtimes.get(FILE_KARYAWAN) != FILE_KARYAWAN.stat().st_mtime:
+            self.karyawan = self._read(FILE_KARYAWAN, KARYAWAN_COLS, dtype=KARYAWAN_DTYPES)
+        if self.mtimes.get(FILE_GAJI) != FILE_GAJI.stat().st_mtime:
+            self.gaji = _typed_gaji(self._read(FILE_GAJI, GAJI_COLS))
+            self._index_gaji()
+        return self
+
+    def _index_gaji(self):
+        """Saldo THR per karyawan + posisi baris gaji per karyawan."""
+        self.thr_balance = self.gaji.groupby("Nama Karyawan")["Tabungan HR"].sum().to_dict()
+        self.gaji_rows = {name: list(idx) for name, idx in self.gaji.groupby("Nama Karyawan").indices.items()}
+
+    def _index_new_gaji(self, df_new, offset):
+        for pos, (name, thr) in enumerate(zip(df_new["Nama Karyawan"], df_new["Tabungan HR"]), start=offset):
+            self.thr_balance[name] = self.thr_balance.get(name, 0) + int(thr)
+            self.gaji_rows.setdefault(name, []).append(pos)
+
+    def thr_summary(self):
+        return pd.DataFrame(
+            sorted(self.thr_balance.items(), key=lambda kv: -kv[1]),
+            columns=["Nama Karyawan", "Tabungan HR"]
+        )
+
+    def gaji_karyawan(self, name):
+        return self.gaji.iloc[self.gaji_rows.get(name, [])]
+
+    def add_karyawan(self, record):
+        df_new = pd.DataFrame([record], columns=KARYAWAN_COLS)
+        self._append(FILE_KARYAWAN, df_new, KARYAWAN_COLS)
+        self.karyawan = pd.concat([self.karyawan, df_new], ignore_index=True)
+
+    def add_gaji(self, records):
+        """records: dict atau list of dict / DataFrame baris gaji baru."""
+        df_new = _typed_gaji(pd.DataFrame([records] if isinstance(records, dict) else records))
+        self._append(FILE_GAJI, df_new, GAJI_COLS)
+        offset = len(self.gaji)
+        self.gaji = pd.concat([self.gaji, df_new], ignore_index=True)
+        self._index_new_gaji(df_new, offset)
+        return df_new
+
+
+@st.cache_resource
+def get_payroll_store():
+    return PayrollStore()
@@ -0,0 +1,130 @@
+import re
+import streamlit as st
+from collections import defaultdict
+
+from purchasing_data import po_files, po_path, load_data, COL_SUP, COL_ITM, COL_KET, COL_STS
+
+# ---------- Trigram search index over all PO files ----------
+# Satu dokumen = satu baris PO, dikunci dengan (kategori, index baris di file).
+# Index di-update per baris saat PO ditambah / diterima, dan di-rebuild per
+# kategori kalau file berubah dari luar (dicek lewat mtime).
+
+FIELD_WEIGHTS = {COL_ITM: 3.0, COL_SUP: 2.0, COL_KET: 1.0}
+TOKEN_RE = re.compile(r"[0-9a-z]+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(str(text).lower()) if text is not None else []
+
+
+def trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class POSearchIndex:
+    def __init__(self):
+        self.docs = {}
+        self.grams = defaultdict(dict)
+        self.tokens = defaultdict(set)
+        self.mtimes = {}
+
+    # ----- maintenance -----
+
+    def build(self):
+        for category in po_files:
+            self.reindex_category(category)
+        return self
+
+    def reindex_category(self, category):
+        for key in [k for k in self.docs if k[0] == category]:
+            self.remove_row(*key)
+        path = po_path(category)
+        df = load_data(path)
+        for idx, row in zip(df.index, df[[COL_SUP, COL_ITM, COL_KET, COL_STS]].itertuples(index=False)):
+            self.add_row(category, idx, {COL_SUP: row[0], COL_ITM: row[1], COL_KET: row[2], COL_STS: row[3]})
+        self.mtimes[category] = path.stat().st_mtime if path.exists() else None
+
+    def add_row(self, category, idx, row):
+        key = (category, idx)
+        if key in self.docs:
+            self.remove_row(*key)
+        fields = {f: "" if row.get(f) is None or row.get(f) != row.get(f) else str(row.get(f)) for f in FIELD_WEIGHTS}
+        self.docs[key] = {"fields": fields, "status": row.get(COL_STS, "Pending")}
+        for field, weight in FIELD_WEIGHTS.items():
+            for tok in tokenize(fields[field]):
+                self.tokens[tok].add(key)
+                for g in trigrams(tok):
+                    postings = self.grams[g]
+                    postings[key] = max(postings.get(key, 0), weight)
+
+    def remove_row(self, category, idx):
+        key = (category, idx)
+        doc = self.docs.pop(key, None)
+        if doc is None:
+            return
+        for text in doc["fields"].values():
+            for tok in tokenize(text):
+                self.tokens[tok].discard(key)
+                for g in trigrams(tok):
+                    self.grams[g].pop(key, None)
+
+    def set_status(self, category, idx, status):
+        doc = self.docs.get((category, idx))
+        if doc is not None:
+            doc["status"] = status
+
+    def mark_synced(self, category):
+        """Catat mtime file setelah aplikasi sendiri yang menulis file tersebut."""
+        path = po_path(category)
+        self.mtimes[category] = path.stat().st_mtime if path.exists() else None
+
+    def refresh(self):
+        """Rebuild kategori yang file-nya diubah di luar aplikasi."""
+        for category in po_files:
+            path = po_path(category)
+            mtime = path.stat().st_mtime if path.exists() else None
+            if self.mtimes.get(category) != mtime:
+                self.reindex_category(category)
+
+    # ----- query -----
+
+    def search(self, query, categories=None, status=None, limit=50):
+        """Kembalikan list (kategori, index, skor) terurut dari skor tertinggi."""
+        q_tokens = tokenize(query)
+        if not q_tokens:
+            return []
+        scores = defaultdict(float)
+        matched = defaultdict(int)
+        for tok in q_tokens:
+            grams = trigrams(tok)
+            hits = defaultdict(lambda: [0, 0.0])
+            for g in grams:
+                for key, weight in self.grams.get(g, {}).items():
+                    hits[key][0] += 1
+                    hits[key][1] += weight
+            for key, (n_hit, weight_sum) in hits.items():
+                coverage = n_hit / len(grams)
+                if coverage < 0.6:
+                    continue
+                bonus = 1.0 if key in self.tokens.get(tok, ()) else 0.0
+                scores[key] += coverage * (weight_sum / n_hit) + bonus
+                matched[key] += 1
+
+        results = []
+        for key, score in scores.items():
+            if matched[key] < len(q_tokens):
+                continue
+            doc = self.docs[key]
+            if categories is not None and key[0] not in categories:
+                continue
+            if status is not None and doc["status"] != status:
+                continue
+            results.append((key[0], key[1], round(score, 3)))
+        results.sort(key=lambda r: -r[2])
+        return results[:limit]
+
+
+@st.cache_resource
+def get_po_index():
+    return POSearchIndex().build()
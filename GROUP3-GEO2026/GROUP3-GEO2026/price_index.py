@@ -0,0 +1,113 @@
+import re
+import pandas as pd
+import streamlit as st
+
+from purchasing_data import (
+    BASE_DIR, INVOICE_FILE, COL_TGL, COL_SUP, COL_ITM, COL_QTY, COL_HRG,
+    po_files, load_data, parse_rupiah
+)
+
+# ---------- Price-history index ----------
+# Semua harga dari file PO + purchase_invoice.csv dikumpulkan sekali, dikunci
+# dengan (nama item ter-normalisasi, satuan). Statistik per supplier
+# (min / median / terakhir) dihitung saat build, jadi query cukup lookup.
+
+UNIT_ALIASES = {
+    "m": "meter", "mtr": "meter", "meter": "meter",
+    "pc": "pcs", "pcs": "pcs", "buah": "pcs", "biji": "pcs",
+    "roll": "roll", "rol": "roll",
+    "titik": "titik", "set": "set", "pack": "pack", "pak": "pack",
+    "lusin": "lusin", "gross": "gross", "kg": "kg", "yard": "yard", "yd": "yard",
+}
+QTY_RE = re.compile(r"^\s*([0-9]+(?:[.,][0-9]+)?)?\s*(.*)$")
+
+
+def normalize_item(name):
+    return re.sub(r"\s+", " ", re.sub(r"[^0-9a-z ]", " ", str(name).lower())).strip()
+
+
+def normalize_unit(unit):
+    unit = str(unit).lower().strip()
+    return UNIT_ALIASES.get(unit, unit or "pcs")
+
+
+def parse_qty(text):
+    """'1 roll' -> (1.0, 'roll'); angka saja dianggap pcs."""
+    if pd.isna(text):
+        return 1.0, "pcs"
+    num, unit = QTY_RE.match(str(text)).groups()
+    qty = float(num.replace(",", ".")) if num else 1.0
+    return (qty if qty > 0 else 1.0), normalize_unit(unit)
+
+
+def price_sources_signature():
+    paths = [BASE_DIR / f for f in po_files.values()] + [INVOICE_FILE]
+    return tuple((p.name, p.stat().st_mtime if p.exists() else None) for p in paths)
+
+
+def _load_observations():
+    frames = []
+    for category, file_name in po_files.items():
+        df = load_data(BASE_DIR / file_name)
+        df["Kategori"] = category
+        frames.append(df)
+    if INVOICE_FILE.exists():
+        df_inv = pd.read_csv(INVOICE_FILE)
+        if not df_inv.empty:
+            df_inv[COL_HRG] = df_inv[COL_HRG].apply(parse_rupiah)
+            df_inv["Kategori"] = "Invoice"
+            frames.append(df_inv[[COL_TGL, COL_SUP, COL_ITM, COL_QTY, COL_HRG, "Kategori"]])
+
+    obs = pd.concat(frames, ignore_index=True)
+    obs = obs[obs[COL_ITM].notna() & (obs[COL_ITM].astype(str).str.strip() != "") & (obs[COL_HRG] > 0)].copy()
+    parsed = obs[COL_QTY].map(parse_qty)
+    obs["unit"] = parsed.str[1]
+    obs["item_key"] = obs[COL_ITM].map(normalize_item)
+    # Harga di file PO maupun purchase_invoice.csv sudah per unit (Subtotal = Qty x Harga)
+    obs["unit_price"] = obs[COL_HRG]
+    obs["date"] = pd.to_datetime(obs[COL_TGL], errors="coerce")
+    return obs[["item_key", "unit", COL_ITM, COL_SUP, "Kategori", "date", "unit_price"]].sort_values("date", na_position="first")
+
+
+class PriceIndex:
+    def __init__(self, obs):
+        self.groups = {key: grp.reset_index(drop=True) for key, grp in obs.groupby(["item_key", "unit"])}
+        latest = obs.groupby(["item_key", "unit", COL_SUP]).tail(1).set_index(["item_key", "unit", COL_SUP])
+        stats = obs.groupby(["item_key", "unit", COL_SUP])["unit_price"].agg(["min", "median", "count"])
+        stats["latest"] = latest["unit_price"]
+        stats["latest_date"] = latest["date"]
+        self.stats = stats.reset_index()
+        self.items = sorted(self.groups)
+
+    def supplier_stats(self, item, unit):
+        key = (normalize_item(item), normalize_unit(unit))
+        return self.stats[(self.stats["item_key"] == key[0]) & (self.stats["unit"] == key[1])].sort_values("min")
+
+    def best_price(self, item, unit, since=None):
+        """Ranking supplier termurah untuk satu item/satuan, opsional sejak tanggal tertentu."""
+        key = (normalize_item(item), normalize_unit(unit))
+        if since is None:
+            return self.supplier_stats(*key)
+        grp = self.groups.get(key)
+        if grp is None:
+            return self.stats.iloc[0:0]
+        grp = grp[grp["date"] >= pd.Timestamp(since)]
+        if grp.empty:
+            return self.stats.iloc[0:0]
+        out = grp.groupby(COL_SUP)["unit_price"].agg(["min", "median", "count"])
+        last = grp.groupby(COL_SUP).tail(1).set_index(COL_SUP)
+        out["latest"] = last["unit_price"]
+        out["latest_date"] = last["date"]
+        out = out.reset_index()
+        out.insert(0, "unit", key[1])
+        out.insert(0, "item_key", key[0])
+        return out.sort_values("min")
+
+
+@st.cache_resource(max_entries=1)
+def _build_price_index(signature):
+    return PriceIndex(_load_observations())
+
+
+def get_price_index():
+    return _build_price_index(price_sources_signature())
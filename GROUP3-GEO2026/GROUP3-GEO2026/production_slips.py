@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+from datetime import date
+from pathlib import Path
+
+from csv_txn import CsvTransaction
+from stock_ledger import DEFAULT_WAREHOUSE, LEDGER_COLS, post_movements
+from work_orders import WO_FILE, WO_COLS, load_work_orders
+
+# ---------- Material Slip & Finished Goods Slip ----------
+# MaterialSlip.csv      : pengeluaran komponen ke WO (Kind = Issue) dan
+#                         konsumsi otomatis saat barang jadi dilaporkan (Kind = Backflush).
+# FinishedGoodsSlip.csv : barang jadi yang selesai per WO.
+# Banyak slip diposting sebagai satu batch: baris slip, stock ledger, saldo
+# on-hand dan status WO ditulis dalam satu CsvTransaction.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+MATERIAL_SLIP_FILE = BASE_DIR / "MaterialSlip.csv"
+FG_SLIP_FILE = BASE_DIR / "FinishedGoodsSlip.csv"
+MATERIAL_SLIP_COLS = ["Slip_ID", "Date", "WO_ID", "Component", "Qty", "Kind"]
+FG_SLIP_COLS = ["Slip_ID", "Date", "WO_ID", "Product", "Qty"]
+REQ_KEY = ["WO_ID", "Component"]
+
+
+def _read(path, cols):
+    if not path.exists():
+        return pd.DataFrame(columns=cols)
+    df = pd.read_csv(path).reindex(columns=cols)
+    df["Qty"] = pd.to_numeric(df["Qty"], errors="coerce").fillna(0)
+    return df
+
+
+def load_material_slips():
+    return _read(MATERIAL_SLIP_FILE, MATERIAL_SLIP_COLS)
+
+
+def load_fg_slips():
+    return _read(FG_SLIP_FILE, FG_SLIP_COLS)
+
+
+def _next_ids(df, prefix, n):
+    nums = pd.to_numeric(df["Slip_ID"].astype(str).str.extract(rf"^{prefix}-(\d+)$")[0], errors="coerce")
+    start = int(nums.max()) + 1 if nums.notna().any() else 1
+    return [f"{prefix}-{i:04d}" for i in range(start, start + n)]
+
+
+def produced_by_wo(fg_slips=None):
+    fg_slips = load_fg_slips() if fg_slips is None else fg_slips
+    return fg_slips.groupby("WO_ID")["Qty"].sum()
+
+
+def outstanding_requirements(work_orders, explosion, slips=None):
+    """
+    Kebutuhan komponen per WO dibanding yang sudah dikeluarkan (Issue + Backflush).
+    Jasa tidak punya stok, jadi Issued selalu 0.
+    """
+    slips = load_material_slips() if slips is None else slips
+    req = explosion.explode(work_orders)
+    req = req.groupby(["WO_ID", "Product", "Component", "Unit", "Component_Type", "Category"], as_index=False)["Required_Qty"].sum()
+    issued = slips.groupby(REQ_KEY)["Qty"].sum().rename("Issued")
+    req = req.join(issued, on=REQ_KEY)
+    req["Issued"] = req["Issued"].fillna(0)
+    req["Remaining"] = (req["Required_Qty"] - req["Issued"]).clip(lower=0)
+    return req
+
+
+def _wo_status_update(df_wo, wo_ids, status_by_wo):
+    df_wo = df_wo.copy()
+    hit = df_wo["WO_ID"].isin(wo_ids)
+    df_wo.loc[hit, "Status"] = df_wo.loc[hit, "WO_ID"].map(status_by_wo).fillna(df_wo.loc[hit, "Status"])
+    return df_wo
+
+
+def post_material_issue(lines, slip_date=None):
+    """
+    lines: WO_ID, Component, Qty (qty > 0 dikeluarkan dari gudang).
+    Satu Slip_ID per WO; WO yang masih Planned/Released menjadi In Progress.
+    """
+    lines = lines[pd.to_numeric(lines["Qty"], errors="coerce").fillna(0) > 0]
+    if lines.empty:
+        return pd.DataFrame(columns=MATERIAL_SLIP_COLS)
+    slip_date = str(slip_date or date.today())
+    slips = load_material_slips()
+    wo_ids = pd.unique(lines["WO_ID"])
+    slip_ids = dict(zip(wo_ids, _next_ids(slips, "MS", len(wo_ids))))
+
+    new = pd.DataFrame({
+        "Slip_ID": lines["WO_ID"].map(slip_ids).to_numpy(), "Date": slip_date,
+        "WO_ID": lines["WO_ID"].to_numpy(), "Component": lines["Component"].to_numpy(),
+        "Qty": lines["Qty"].to_numpy(dtype=float), "Kind": "Issue",
+    }, columns=MATERIAL_SLIP_COLS)
+    moves = pd.DataFrame({
+        "Date": slip_date, "Item": new["Component"], "Warehouse": DEFAULT_WAREHOUSE,
+        "Qty": -new["Qty"], "Source": "Material Slip", "Ref": new["Slip_ID"],
+    }, columns=LEDGER_COLS)
+
+    df_wo = load_work_orders()
+    started = df_wo.loc[df_wo["WO_ID"].isin(wo_ids) & df_wo["Status"].isin(["Planned", "Released"]), "WO_ID"]
+    df_wo = _wo_status_update(df_wo, started, {w: "In Progress" for w in started})
+
+    with CsvTransaction() as tx:
+        tx.append(MATERIAL_SLIP_FILE, new)
+        post_movements(moves, tx)
+        tx.replace(WO_FILE, df_wo[WO_COLS])
+    return new
+
+
+def post_finished_goods(reports, explosion, slip_date=None):
+    """
+    reports: WO_ID, Qty (jumlah selesai sekarang). Barang jadi masuk gudang,
+    komponen di-backflush sebesar kebutuhan kumulatif dikurangi yang sudah
+    dikeluarkan, status WO jadi Completed bila total selesai >= qty WO.
+    Kembalikan (slip barang jadi, baris backflush).
+    """
+    reports = reports[pd.to_numeric(reports["Qty"], errors="coerce").fillna(0) > 0]
+    if reports.empty:
+        return pd.DataFrame(columns=FG_SLIP_COLS), pd.DataFrame(columns=MATERIAL_SLIP_COLS)
+    slip_date = str(slip_date or date.today())
+    df_wo = load_work_orders()
+    fg_slips = load_fg_slips()
+
+    done = reports.groupby("WO_ID", sort=False)["Qty"].sum()
+    wo = df_wo.set_index("WO_ID").loc[done.index]
+    slip_ids = pd.Series(_next_ids(fg_slips, "FG", len(done)), index=done.index)
+    new_fg = pd.DataFrame({
+        "Slip_ID": slip_ids.to_numpy(), "Date": slip_date, "WO_ID": done.index,
+        "Product": wo["Product"].to_numpy(), "Qty": done.to_numpy(dtype=float),
+    }, columns=FG_SLIP_COLS)
+
+    # backflush: kebutuhan untuk total selesai (sebelum + sekarang) - yang sudah keluar
+    produced = produced_by_wo(fg_slips).reindex(done.index).fillna(0) + done
+    basis = pd.DataFrame({"WO_ID": done.index, "Product": wo["Product"].to_numpy(), "Qty": produced.to_numpy()})
+    req = outstanding_requirements(basis, explosion)
+    req = req[(req["Component_Type"] != "Jasa") & (req["Remaining"] > 0)]
+    backflush = pd.DataFrame({
+        "Slip_ID": req["WO_ID"].map(slip_ids).to_numpy(), "Date": slip_date,
+        "WO_ID": req["WO_ID"].to_numpy(), "Component": req["Component"].to_numpy(),
+        "Qty": req["Remaining"].to_numpy(), "Kind": "Backflush",
+    }, columns=MATERIAL_SLIP_COLS)
+
+    moves = pd.concat([
+        pd.DataFrame({"Date": slip_date, "Item": new_fg["Product"], "Warehouse": DEFAULT_WAREHOUSE,
+                      "Qty": new_fg["Qty"], "Source": "Finished Goods Slip", "Ref": new_fg["Slip_ID"]}),
+        pd.DataFrame({"Date": slip_date, "Item": backflush["Component"], "Warehouse": DEFAULT_WAREHOUSE,
+                      "Qty": -backflush["Qty"], "Source": "Backflush", "Ref": backflush["Slip_ID"]}),
+    ], ignore_index=True)[LEDGER_COLS]
+
+    status = pd.Series(np.where(produced.to_numpy() >= wo["Qty"].to_numpy(), "Completed", "In Progress"), index=done.index)
+    df_wo = _wo_status_update(df_wo, done.index, status)
+
+    with CsvTransaction() as tx:
+        tx.append(FG_SLIP_FILE, new_fg)
+        if not backflush.empty:
+            tx.append(MATERIAL_SLIP_FILE, backflush)
+        post_movements(moves, tx)
+        tx.replace(WO_FILE, df_wo[WO_COLS])
+    return new_fg, backflush
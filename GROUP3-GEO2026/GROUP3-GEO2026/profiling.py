@@ -0,0 +1,248 @@
+import os
+import json
+import time
+import functools
+import logging
+import threading
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+import pandas as pd
+
+# ---------- Opt-in profiling per rerun ----------
+# Mati secara default; aktif bila env APP_PROFILE=1 atau dinyalakan dari
+# halaman Diagnostics. Tiap rerun halaman (dan tiap rerun fragment tab, lihat
+# page_tabs.run_tab) ditulis sebagai satu baris JSON ke
+# data/diagnostics/profile.log (rolling): durasi total, waktu per section
+# (load / transform / save / forecast / model, sisanya = render), jumlah dan
+# byte baca/tulis file (pandas + tulisan mentah lewat counted_write), serta
+# jumlah rerun & sesi yang bersamaan.
+# Saat mati, section() dan @timed hanya satu pengecekan flag.
+
+LOG_DIR = Path(__file__).resolve().parent / "data" / "diagnostics"
+LOG_FILE = LOG_DIR / "profile.log"
+LOG_MAX_BYTES = 2 * 2**20
+LOG_BACKUPS = 4
+SESSION_WINDOW = 5 * 60
+PERCENTILES = [0.5, 0.9, 0.95, 0.99]
+IO_KEYS = ["reads", "read_bytes", "writes", "write_bytes"]
+
+_state = {"enabled": os.environ.get("APP_PROFILE") == "1", "patched": False, "logger": None}
+_local = threading.local()
+_lock = threading.Lock()
+_running = {}
+_seen = {}
+
+
+def is_enabled():
+    return _state["enabled"]
+
+
+def set_enabled(flag):
+    """Nyalakan / matikan profiling untuk seluruh proses (semua sesi)."""
+    _state["enabled"] = bool(flag)
+    if flag:
+        _patch_io()
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx else ""
+    except ImportError:
+        return ""
+
+
+def _logger():
+    if _state["logger"] is None:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        logger = logging.getLogger("app.profile")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        _state["logger"] = logger
+    return _state["logger"]
+
+
+@contextmanager
+def rerun(page, tab=None):
+    """
+    Bungkus satu rerun halaman (app.py sekitar pg.run()) atau satu rerun
+    fragment tab. Bila sudah ada record berjalan (tab dirender di dalam rerun
+    halaman), tidak dicatat lagi.
+    """
+    if not _state["enabled"] or getattr(_local, "record", None) is not None:
+        yield
+        return
+    _patch_io()
+    sid, now = _session_id(), time.time()
+    rec = {"ts": now, "session": sid, "page": page, "tab": tab, "sections": {}, "_active": set(), "_outer": 0.0, **dict.fromkeys(IO_KEYS, 0)}
+    with _lock:
+        _running[threading.get_ident()] = sid
+        _seen[sid] = now
+        for s in [s for s, t in _seen.items() if now - t > SESSION_WINDOW]:
+            del _seen[s]
+        rec["concurrent"] = len(_running)
+        rec["sessions"] = len(_seen)
+    _local.record = rec
+    t0 = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException as e:
+        # RerunException / StopException milik Streamlit juga lewat sini
+        status = type(e).__name__
+        raise
+    finally:
+        total = time.perf_counter() - t0
+        _local.record = None
+        with _lock:
+            _running.pop(threading.get_ident(), None)
+        rec["status"] = status
+        rec["total_ms"] = total * 1000
+        rec["sections"]["render"] = max(total - rec.pop("_outer"), 0.0) * 1000
+        del rec["_active"]
+        _logger().info(json.dumps(rec))
+
+
+@contextmanager
+def section(name):
+    """Catat waktu blok ke section `name` pada rerun yang sedang berjalan."""
+    rec = getattr(_local, "record", None) if _state["enabled"] else None
+    if rec is None or name in rec["_active"]:
+        # section bersarang dengan nama sama tidak dihitung dua kali
+        yield
+        return
+    rec["_active"].add(name)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - t0
+        rec["_active"].discard(name)
+        rec["sections"][name] = rec["sections"].get(name, 0.0) + elapsed * 1000
+        if not rec["_active"]:
+            rec["_outer"] += elapsed
+
+
+def timed(name):
+    """Decorator: seluruh pemanggilan fungsi masuk ke section `name`."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if not _state["enabled"]:
+                return fn(*args, **kwargs)
+            with section(name):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
+# ---------- Hitung baca/tulis file ----------
+# read_csv/read_excel dan to_csv/to_excel dibungkus sekali (saat profiling
+# pertama kali aktif). Byte tulis = selisih ukuran file, jadi mode="a" benar.
+# Tulisan mentah (open / write_text, mis. CsvTransaction) memakai
+# counted_write / count_read secara eksplisit.
+
+def _path_of(args, kwargs, keyword):
+    target = args[0] if args else kwargs.get(keyword)
+    return target if isinstance(target, (str, os.PathLike)) else None
+
+
+def _size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _count(kind, nbytes):
+    rec = getattr(_local, "record", None)
+    if rec is not None:
+        rec[kind + "s"] += 1
+        rec[kind + "_bytes"] += nbytes
+
+
+def count_read(path):
+    if _state["enabled"]:
+        _count("read", _size(path))
+
+
+@contextmanager
+def counted_write(path, append=False):
+    """Hitung satu tulisan mentah ke path (byte = ukuran akhir, atau selisih bila append)."""
+    if not _state["enabled"] or getattr(_local, "record", None) is None:
+        yield
+        return
+    before = _size(path) if append else 0
+    try:
+        yield
+    finally:
+        _count("write", max(_size(path) - before, 0))
+
+
+def _wrap_reader(fn, keyword):
+    @functools.wraps(fn)
+    def inner(*args, **kwargs):
+        path = _path_of(args, kwargs, keyword) if _state["enabled"] else None
+        if path is not None:
+            _count("read", _size(path))
+        return fn(*args, **kwargs)
+    return inner
+
+
+def _wrap_writer(fn, keyword):
+    @functools.wraps(fn)
+    def inner(self, *args, **kwargs):
+        path = _path_of(args, kwargs, keyword) if _state["enabled"] else None
+        if path is None:
+            return fn(self, *args, **kwargs)
+        before = _size(path)
+        result = fn(self, *args, **kwargs)
+        after = _size(path)
+        _count("write", after - before if str(kwargs.get("mode", "w")).startswith("a") else after)
+        return result
+    return inner
+
+
+def _patch_io():
+    with _lock:
+        if _state["patched"]:
+            return
+        pd.read_csv = _wrap_reader(pd.read_csv, "filepath_or_buffer")
+        pd.read_excel = _wrap_reader(pd.read_excel, "io")
+        pd.DataFrame.to_csv = _wrap_writer(pd.DataFrame.to_csv, "path_or_buf")
+        pd.DataFrame.to_excel = _wrap_writer(pd.DataFrame.to_excel, "excel_writer")
+        _state["patched"] = True
+
+
+# ---------- Membaca log untuk halaman Diagnostics ----------
+
+def load_log(since=None):
+    """Semua rerun di log (termasuk file rolling lama) sebagai DataFrame datar; ts dalam UTC."""
+    paths = [LOG_FILE.with_name(f"{LOG_FILE.name}.{i}") for i in range(LOG_BACKUPS, 0, -1)] + [LOG_FILE]
+    rows = []
+    for path in paths:
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                rows += [json.loads(line) for line in f if line.strip()]
+    if not rows:
+        return pd.DataFrame()
+    df = pd.json_normalize(rows)
+    df.columns = [c.replace("sections.", "ms_") for c in df.columns]
+    df["ts"] = pd.to_datetime(df["ts"], unit="s", utc=True)
+    if since is not None:
+        df = df[df["ts"] >= since]
+    return df.sort_values("ts").reset_index(drop=True)
+
+
+def percentiles(df, col, by="page"):
+    """Tabel count + p50/p90/p95/p99 kolom `col` per grup."""
+    grp = df.groupby(by)[col]
+    table = grp.quantile(PERCENTILES).unstack()
+    table.columns = [f"p{int(q * 100)}" for q in PERCENTILES]
+    return pd.concat([grp.count().rename("n"), table], axis=1)
@@ -1,19 +1,23 @@
 import streamlit as st
+from page_tabs import tab_bar, run_tab
 import pandas as pd
-from pathlib import Path
 from datetime import date
-import numpy as np
+from purchasing_data import (
+    BASE_DIR, INVOICE_FILE, HISTORY_FILE,
+    COL_TGL, COL_SUP, COL_ITM, COL_QTY, COL_HRG, COL_KET, COL_STS, COL_ALM, STANDARD_COLS,
+    po_files, sup_files, parse_rupiah, load_data, get_next_invoice_count, update_invoice_log
+)
+from po_search import get_po_index
+from ap_ledger import AGING_BUCKETS, load_summary, add_invoices, apply_payment, aging_report
+from price_index import get_price_index, parse_qty
+from item_master import get_item_master
+from stock_ledger import movements, post_movements
+from supplier_master import COL_ID, supplier_options, suppliers_in_category, add_supplier, remove_supplier
 
 st.set_page_config(layout="wide")
 
 st.markdown("""
 <style>
-button[data-testid="stTab"] {
-    flex: 1;
-    justify-content: center;
-    font-size: 16px;
-    font-weight: 600;
-}
 div.block-container { padding-top: 1rem; }
 .invoice-box {
     border: 2px solid #333;
@@ -30,106 +34,13 @@ div.block-container { padding-top: 1rem; }
 </style>
 """, unsafe_allow_html=True)
 
-COL_TGL = "TANGGAL PEMBELIAN"
-COL_SUP = "NAMA SUPPLIER & PENYEDIA JASA"
-COL_ITM = "Item"
-COL_QTY = "Qty"
-COL_HRG = "Harga"
-COL_KET = "KETERANGAN"
-COL_STS = "Status"
-COL_ALM = "ALAMAT" 
-STANDARD_COLS = [COL_TGL, COL_SUP, COL_ITM, COL_QTY, COL_HRG, COL_KET, COL_STS]
-
-def parse_rupiah(text):
-    if pd.isna(text) or text == "" or text is None:
-        return 0
-    if isinstance(text, (int, float)):
-        return int(text) if not pd.isna(text) else 0
-    try:
-        cleaned = str(text).replace("Rp", "").replace("rp", "").replace(".", "").replace(",", "").strip()
-        return int(cleaned) if cleaned else 0
-    except ValueError:
-        return 0
-
-def load_data(file_path):
-    if Path(file_path).exists():
-        df = pd.read_csv(file_path)
-        df.columns = df.columns.str.strip()
-        mapping = {
-            'tanggal': COL_TGL, 'tanggal pembelian': COL_TGL,
-            'supplier': COL_SUP, 'nama supplier & penyedia jasa': COL_SUP,
-            'item': COL_ITM, 'qty': COL_QTY, 'harga': COL_HRG,
-            'keterangan': COL_KET, 'ket': COL_KET, 'status': COL_STS
-        }
-        new_column_names = []
-        for col in df.columns:
-            cleaned_col = col.lower().strip()
-            if cleaned_col in mapping:
-                new_column_names.append(mapping[cleaned_col])
-            else:
-                new_column_names.append(col)
-        df.columns = new_column_names
-        df = df.loc[:, ~df.columns.duplicated()]
-        for col in STANDARD_COLS:
-            if col not in df.columns:
-                df[col] = 0 if col == COL_HRG else ("Pending" if col == COL_STS else "")
-        df = df[STANDARD_COLS].copy()
-        if COL_HRG in df.columns:
-            df[COL_HRG] = df[COL_HRG].apply(parse_rupiah)
-            df[COL_HRG] = pd.to_numeric(df[COL_HRG], errors="coerce").fillna(0).astype(int)
-        return df
-    return pd.DataFrame(columns=STANDARD_COLS)
-
-def get_next_invoice_count():
-    log_file = BASE_DIR / "invoice_log.txt"
-    today_str = date.today().strftime("%Y%m%d")
-    if not log_file.exists():
-        return today_str, 1
-    with open(log_file, "r") as f:
-        try:
-            content = f.read().split("|")
-            if len(content) == 2:
-                last_date, last_count = content[0], int(content[1])
-                if last_date == today_str:
-                    return today_str, last_count + 1
-        except:
-            pass
-        return today_str, 1
-
-def update_invoice_log(today_str, count):
-    log_file = BASE_DIR / "invoice_log.txt"
-    with open(log_file, "w") as f:
-        f.write(f"{today_str}|{count}")
-
-po_files = {
-    "Bahan Baku Utama (Kain)": "DATA SUPPLIER KAIN.csv",
-    "Bahan Pendukung": "DATA SUPPLIER KAIN - Bahan Baku Pendukung PO.csv",
-    "Jasa Bordir": "DATA SUPPLIER KAIN - Jasa Bordir PO.csv",
-    "Jasa Printing": "DATA SUPPLIER KAIN - Jasa Printing PO.csv",
-    "Jasa DTF Sablon": "DATA SUPPLIER KAIN - Jasa DTF Sablon PO.csv",
-    "Jasa Sublim": "DATA SUPPLIER KAIN - Jasa Sublim PO.csv",
-    "Jasa Distribusi": "DATA SUPPLIER KAIN - Jasa Distribusi PO.csv",
-    "ATK": "DATA SUPPLIER KAIN - ATK PO.csv"
-}
-
-sup_files = {
-    "Bahan Baku Utama (Kain)": "Supplier Utama.csv",
-    "Bahan Pendukung": "Supplier Pendukung.csv",
-    "Jasa Bordir": "Jasa Bordir.csv",
-    "Jasa Printing": "Jasa Printing.csv",
-    "Jasa DTF Sablon": "Jasa DTF Sablon.csv",
-    "Jasa Sublim": "Jasa Sublim.csv",
-    "Jasa Distribusi": "Jasa Distribusi.csv",
-    "ATK": "ATK.csv"
-}
+po_index = get_po_index()
+po_index.refresh()
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-INVOICE_FILE = BASE_DIR / "purchase_invoice.csv"
-HISTORY_FILE = BASE_DIR / "payment_history.csv"
+TAB_LABELS = ["Purchase Order", "Receive Item", "Purchase Invoice", "Payment History", "Supplier", "Perbandingan Harga"]
+active_tab = tab_bar(TAB_LABELS, "purchasing_tab")
 
-tabs = st.tabs(["Purchase Order", "Receive Item", "Purchase Invoice", "Payment History", "Supplier"])
-
-with tabs[0]:
+def purchase_order_tab():
     po_menu = st.selectbox("Kategori PO", list(po_files.keys()), key="sb_po")
     path_po = BASE_DIR / po_files[po_menu]
     df_po = load_data(path_po)
@@ -141,21 +52,14 @@ with tabs[0]:
         use_container_width=True
     )
     
-    path_sup_for_po = BASE_DIR / sup_files[po_menu]
-    list_supplier = []
-    if path_sup_for_po.exists():
-        df_temp_sup = pd.read_csv(path_sup_for_po)
-        if not df_temp_sup.empty:
-            df_temp_sup.columns = df_temp_sup.columns.str.strip()
-            col_name_check = COL_SUP if COL_SUP in df_temp_sup.columns else df_temp_sup.columns[0]
-            list_supplier = df_temp_sup[col_name_check].dropna().unique().tolist()
+    list_supplier = supplier_options(po_menu)
 
     st.divider()
     with st.form("form_po", clear_on_submit=True):
         col1, col2 = st.columns(2)
         tanggal = col1.date_input(COL_TGL, date.today())
         supplier = col1.selectbox(COL_SUP, ["Pilih Supplier"] + list_supplier)
-        item = col2.text_input(COL_ITM)
+        item = col2.selectbox(COL_ITM, get_item_master().names(), index=None, accept_new_options=True, placeholder="Ketik nama item...")
         qty = col2.text_input(COL_QTY)
         harga_text = st.text_input(f"{COL_HRG} (Rp)", placeholder="Contoh: 150000")
         ket = st.text_area(COL_KET)
@@ -166,19 +70,32 @@ with tabs[0]:
                 new_row = [tanggal.strftime("%Y-%m-%d"), supplier, item, qty, harga, ket, "Pending"]
                 new_data = pd.DataFrame([new_row], columns=STANDARD_COLS)
                 pd.concat([df_po, new_data], ignore_index=True).to_csv(path_po, index=False)
+                po_index.add_row(po_menu, len(df_po), dict(zip(STANDARD_COLS, new_row)))
+                po_index.mark_synced(po_menu)
                 st.rerun()
 
-with tabs[1]:
+def receive_item_tab():
     rec_menu = st.selectbox("Kategori Receive Item", list(po_files.keys()), key="sb_receive")
     path_rec = BASE_DIR / po_files[rec_menu]
     df_rec = load_data(path_rec)
 
     st.write("### Daftar Order (Klik baris untuk konfirmasi)")
-    search_rec = st.text_input(f"Cari...", key="search_receive")
-    
-    df_pending = df_rec[df_rec[COL_STS] == "Pending"].copy() if not df_rec.empty else pd.DataFrame()
-    if not df_pending.empty and search_rec:
-        df_pending = df_pending[df_pending.apply(lambda row: row.astype(str).str.contains(search_rec, case=False).any(), axis=1)]
+    col_s1, col_s2 = st.columns([3, 1])
+    search_rec = col_s1.text_input(f"Cari...", key="search_receive")
+    search_all = col_s2.checkbox("Cari di semua kategori", key="search_receive_all")
+
+    if search_rec:
+        categories = None if search_all else [rec_menu]
+        hits = po_index.search(search_rec, categories=categories, status="Pending")
+        frames = {cat: (df_rec if cat == rec_menu else load_data(BASE_DIR / po_files[cat])) for cat in {h[0] for h in hits}}
+        df_pending = pd.DataFrame(
+            [{"Kategori": cat, **frames[cat].loc[idx].to_dict(), "Skor": score} for cat, idx, score in hits if idx in frames[cat].index],
+            columns=["Kategori"] + STANDARD_COLS + ["Skor"]
+        )
+        pending_keys = [(cat, idx) for cat, idx, _ in hits if idx in frames[cat].index]
+    else:
+        df_pending = df_rec[df_rec[COL_STS] == "Pending"].copy() if not df_rec.empty else pd.DataFrame()
+        pending_keys = [(rec_menu, idx) for idx in df_pending.index]
 
     event_rec = st.dataframe(
         df_pending, 
@@ -195,9 +112,17 @@ with tabs[1]:
         idx_in_pending = selected_rows[0]
         item_name = df_pending.iloc[idx_in_pending].get(COL_ITM, "Unknown")
         if st.button(f"Konfirmasi Terima: {item_name}", type="primary"):
-            idx_to_update = df_pending.index[idx_in_pending]
-            df_rec.at[idx_to_update, COL_STS] = "Diterima"
-            df_rec.to_csv(path_rec, index=False)
+            cat_to_update, idx_to_update = pending_keys[idx_in_pending]
+            path_to_update = BASE_DIR / po_files[cat_to_update]
+            df_target = df_rec if cat_to_update == rec_menu else load_data(path_to_update)
+            df_target.at[idx_to_update, COL_STS] = "Diterima"
+            df_target.to_csv(path_to_update, index=False)
+            po_index.set_status(cat_to_update, idx_to_update, "Diterima")
+            po_index.mark_synced(cat_to_update)
+            post_movements(movements(
+                [df_target.at[idx_to_update, COL_ITM]], [parse_qty(df_target.at[idx_to_update, COL_QTY])[0]],
+                "Receive PO", f"{cat_to_update}#{idx_to_update}"
+            ))
             st.rerun()
 
     st.divider()
@@ -214,6 +139,7 @@ with tabs[1]:
                 if not diterima.empty:
                     all_data_diterima.append(diterima)
                     df_cat[df_cat[COL_STS] != "Diterima"].to_csv(p, index=False)
+                    po_index.reindex_category(cat)
         
         if all_data_diterima:
             combined_df = pd.concat(all_data_diterima, ignore_index=True)
@@ -236,6 +162,7 @@ with tabs[1]:
                 pd.concat([existing_inv, final_invoice_df], ignore_index=True).to_csv(INVOICE_FILE, index=False)
             else:
                 final_invoice_df.to_csv(INVOICE_FILE, index=False)
+            add_invoices(final_invoice_df)
             st.success(f"Berhasil Generate {len(invoice_list)} Invoice!")
             st.rerun()
         else:
@@ -248,14 +175,28 @@ with tabs[1]:
     else:
         st.info("Belum ada barang yang diterima di kategori ini.")
 
-with tabs[2]:
+def purchase_invoice_tab():
     st.subheader("Purchase Invoice")
+
+    with st.expander("Laporan Umur Hutang (AP Aging)"):
+        df_aging = aging_report()
+        if df_aging.empty:
+            st.info("Tidak ada hutang supplier yang belum lunas.")
+        else:
+            st.dataframe(
+                df_aging,
+                column_config={c: st.column_config.NumberColumn(c, format="Rp %,.0f") for c in AGING_BUCKETS + ["Total"]},
+                hide_index=True,
+                use_container_width=True
+            )
+
     if INVOICE_FILE.exists():
         df_inv = pd.read_csv(INVOICE_FILE)
         if not df_inv.empty:
             if "Terbayar" not in df_inv.columns:
                 df_inv["Terbayar"] = 0
 
+            ap_summary = load_summary().set_index("No Invoice")
             invoices = df_inv["No Invoice"].unique()
             for inv_id in invoices:
                 inv_data = df_inv[df_inv["No Invoice"] == inv_id].copy()
@@ -272,9 +213,12 @@ with tabs[2]:
                 
                 st.table(inv_data[[COL_ITM, COL_QTY, COL_HRG, "Subtotal"]].style.format({COL_HRG: "Rp {:,.0f}", "Subtotal": "Rp {:,.0f}"}))
                 
-                total_tagihan = inv_data["Subtotal"].sum()
-                terbayar_sebelumnya = inv_data["Terbayar"].iloc[0]
-                sisa_tagihan = total_tagihan - terbayar_sebelumnya
+                if inv_id in ap_summary.index:
+                    total_tagihan, terbayar_sebelumnya, sisa_tagihan = ap_summary.loc[inv_id, ["Total Tagihan", "Terbayar", "Sisa"]]
+                else:
+                    total_tagihan = inv_data["Subtotal"].sum()
+                    terbayar_sebelumnya = inv_data["Terbayar"].iloc[0]
+                    sisa_tagihan = total_tagihan - terbayar_sebelumnya
                 
                 col_f1, col_f2 = st.columns(2)
                 with col_f1:
@@ -305,6 +249,7 @@ with tabs[2]:
                                     pd.concat([pd.read_csv(HISTORY_FILE), history_row], ignore_index=True).to_csv(HISTORY_FILE, index=False)
                                 else:
                                     history_row.to_csv(HISTORY_FILE, index=False)
+                                apply_payment(inv_id, jumlah_bayar)
 
                                 if total_terbayar_baru >= total_tagihan:
                                     df_inv = df_inv[df_inv["No Invoice"] != inv_id]
@@ -322,7 +267,7 @@ with tabs[2]:
     else:
         st.info("Belum ada invoice.")
 
-with tabs[3]:
+def payment_history_tab():
     st.subheader("Payment History")
     if HISTORY_FILE.exists():
         df_history = pd.read_csv(HISTORY_FILE)
@@ -344,39 +289,12 @@ with tabs[3]:
     else:
         st.info("Riwayat pembayaran belum ada.")
 
-with tabs[4]:
+def supplier_tab():
     sup_menu = st.selectbox("Kategori Supplier", list(sup_files.keys()), key="sb_sup")
-    path_sup = BASE_DIR / sup_files[sup_menu]
-
-    if path_sup.exists():
-        data_sup = pd.read_csv(path_sup)
-        data_sup.columns = data_sup.columns.str.strip()
-
-        normalized_cols = {}
-        for col in data_sup.columns:
-            key = col.lower().strip()
-            if "supplier" in key:
-                normalized_cols[col] = COL_SUP
-            elif "alamat" in key:
-                normalized_cols[col] = COL_ALM
-            else:
-                normalized_cols[col] = col
-
-        data_sup.rename(columns=normalized_cols, inplace=True)
-
-        data_sup = data_sup.loc[:, ~data_sup.columns.duplicated()]
-
-    else:
-        data_sup = pd.DataFrame(columns=[COL_SUP, COL_ALM])
-
-    for col in [COL_SUP, COL_ALM]:
-        if col not in data_sup.columns:
-            data_sup[col] = ""
-
-    data_sup = data_sup[[COL_SUP, COL_ALM]].copy()
+    data_sup = suppliers_in_category(sup_menu)
 
     event_sup = st.dataframe(
-        data_sup,
+        data_sup[[COL_ID, COL_SUP, COL_ALM]],
         hide_index=True,
         use_container_width=True,
         selection_mode="single-row",
@@ -391,8 +309,7 @@ with tabs[4]:
         nama_sup = data_sup.iloc[idx][COL_SUP]
 
         if st.button(f"🗑 Hapus Supplier: {nama_sup}", type="primary"):
-            data_sup.drop(index=data_sup.index[idx], inplace=True)
-            data_sup.to_csv(path_sup, index=False)
+            remove_supplier(data_sup.iloc[idx][COL_ID], sup_menu)
             st.success(f"Supplier '{nama_sup}' berhasil dihapus.")
             st.rerun()
 
@@ -404,7 +321,51 @@ with tabs[4]:
 
         if st.form_submit_button("Simpan Supplier"):
             if s_nama:
-                new_sup = pd.DataFrame([[s_nama, s_alamat]], columns=[COL_SUP, COL_ALM])
-                pd.concat([data_sup, new_sup], ignore_index=True).to_csv(path_sup, index=False)
+                add_supplier(s_nama, s_alamat, sup_menu)
                 st.success("Supplier berhasil ditambahkan.")
-                st.rerun()
\ No newline at end of file
+                st.rerun()
+
+def perbandingan_harga_tab():
+    st.subheader("Perbandingan Harga Supplier")
+    price_idx = get_price_index()
+
+    if not price_idx.items:
+        st.info("Belum ada data harga.")
+    else:
+        col_p1, col_p2, col_p3 = st.columns([2, 1, 1])
+        pilih_item = col_p1.selectbox(
+            "Item (Satuan)", price_idx.items,
+            format_func=lambda k: f"{k[0].title()} (per {k[1]})", key="sb_price_item"
+        )
+        periode = col_p2.selectbox("Periode", ["Semua", "3 Bulan", "6 Bulan", "12 Bulan"], key="sb_price_period")
+        months = {"3 Bulan": 3, "6 Bulan": 6, "12 Bulan": 12}.get(periode)
+        since = pd.Timestamp(date.today()) - pd.DateOffset(months=months) if months else None
+
+        df_best = price_idx.best_price(pilih_item[0], pilih_item[1], since=since)
+        if df_best.empty:
+            st.info("Tidak ada harga tercatat pada periode ini.")
+        else:
+            termurah = df_best.iloc[0]
+            col_p3.metric(f"Termurah: {termurah[COL_SUP]}", f"Rp {termurah['min']:,.0f}")
+            st.dataframe(
+                df_best[[COL_SUP, "min", "median", "latest", "latest_date", "count"]].rename(columns={
+                    "min": "Harga Min", "median": "Median", "latest": "Harga Terakhir",
+                    "latest_date": "Tanggal Terakhir", "count": "Jumlah Transaksi"
+                }),
+                column_config={
+                    c: st.column_config.NumberColumn(c, format="Rp %,.0f") for c in ["Harga Min", "Median", "Harga Terakhir"]
+                },
+                hide_index=True,
+                use_container_width=True
+            )
+
+
+TAB_VIEWS = dict(zip(TAB_LABELS, [
+    purchase_order_tab,
+    receive_item_tab,
+    purchase_invoice_tab,
+    payment_history_tab,
+    supplier_tab,
+    perbandingan_harga_tab,
+]))
+run_tab("Purchasing", TAB_VIEWS, active_tab)
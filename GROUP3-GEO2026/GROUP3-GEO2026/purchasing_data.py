@@ -0,0 +1,116 @@
+import pandas as pd
+from pathlib import Path
+from datetime import date
+
+from profiling import timed, section, count_read, counted_write
+
+# ---------- Shared purchasing constants & file helpers ----------
+# Dipakai oleh purchasing.py dan modul lain yang perlu membaca file PO/Supplier.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+INVOICE_FILE = BASE_DIR / "purchase_invoice.csv"
+HISTORY_FILE = BASE_DIR / "payment_history.csv"
+
+COL_TGL = "TANGGAL PEMBELIAN"
+COL_SUP = "NAMA SUPPLIER & PENYEDIA JASA"
+COL_ITM = "Item"
+COL_QTY = "Qty"
+COL_HRG = "Harga"
+COL_KET = "KETERANGAN"
+COL_STS = "Status"
+COL_ALM = "ALAMAT"
+STANDARD_COLS = [COL_TGL, COL_SUP, COL_ITM, COL_QTY, COL_HRG, COL_KET, COL_STS]
+
+po_files = {
+    "Bahan Baku Utama (Kain)": "DATA SUPPLIER KAIN.csv",
+    "Bahan Pendukung": "DATA SUPPLIER KAIN - Bahan Baku Pendukung PO.csv",
+    "Jasa Bordir": "DATA SUPPLIER KAIN - Jasa Bordir PO.csv",
+    "Jasa Printing": "DATA SUPPLIER KAIN - Jasa Printing PO.csv",
+    "Jasa DTF Sablon": "DATA SUPPLIER KAIN - Jasa DTF Sablon PO.csv",
+    "Jasa Sublim": "DATA SUPPLIER KAIN - Jasa Sublim PO.csv",
+    "Jasa Distribusi": "DATA SUPPLIER KAIN - Jasa Distribusi PO.csv",
+    "ATK": "DATA SUPPLIER KAIN - ATK PO.csv"
+}
+
+sup_files = {
+    "Bahan Baku Utama (Kain)": "Supplier Utama.csv",
+    "Bahan Pendukung": "Supplier Pendukung.csv",
+    "Jasa Bordir": "Jasa Bordir.csv",
+    "Jasa Printing": "Jasa Printing.csv",
+    "Jasa DTF Sablon": "Jasa DTF Sablon.csv",
+    "Jasa Sublim": "Jasa Sublim.csv",
+    "Jasa Distribusi": "Jasa Distribusi.csv",
+    "ATK": "ATK.csv"
+}
+
+
+def parse_rupiah(text):
+    if pd.isna(text) or text == "" or text is None:
+        return 0
+    if isinstance(text, (int, float)):
+        return int(text) if not pd.isna(text) else 0
+    try:
+        cleaned = str(text).replace("Rp", "").replace("rp", "").replace(".", "").replace(",", "").strip()
+        return int(cleaned) if cleaned else 0
+    except ValueError:
+        return 0
+
+
+@timed("load")
+def load_data(file_path):
+    if Path(file_path).exists():
+        df = pd.read_csv(file_path)
+        df.columns = df.columns.str.strip()
+        mapping = {
+            'tanggal': COL_TGL, 'tanggal pembelian': COL_TGL,
+            'supplier': COL_SUP, 'nama supplier & penyedia jasa': COL_SUP,
+            'item': COL_ITM, 'qty': COL_QTY, 'harga': COL_HRG,
+            'keterangan': COL_KET, 'ket': COL_KET, 'status': COL_STS
+        }
+        new_column_names = []
+        for col in df.columns:
+            cleaned_col = col.lower().strip()
+            if cleaned_col in mapping:
+                new_column_names.append(mapping[cleaned_col])
+            else:
+                new_column_names.append(col)
+        df.columns = new_column_names
+        df = df.loc[:, ~df.columns.duplicated()]
+        for col in STANDARD_COLS:
+            if col not in df.columns:
+                df[col] = 0 if col == COL_HRG else ("Pending" if col == COL_STS else "")
+        df = df[STANDARD_COLS].copy()
+        if COL_HRG in df.columns:
+            with section("transform"):
+                df[COL_HRG] = df[COL_HRG].apply(parse_rupiah)
+                df[COL_HRG] = pd.to_numeric(df[COL_HRG], errors="coerce").fillna(0).astype(int)
+        return df
+    return pd.DataFrame(columns=STANDARD_COLS)
+
+
+def po_path(category):
+    return BASE_DIR / po_files[category]
+
+
+def get_next_invoice_count():
+    log_file = BASE_DIR / "invoice_log.txt"
+    today_str = date.today().strftime("%Y%m%d")
+    if not log_file.exists():
+        return today_str, 1
+    count_read(log_file)
+    with open(log_file, "r") as f:
+        try:
+            content = f.read().split("|")
+            if len(content) == 2:
+                last_date, last_count = content[0], int(content[1])
+                if last_date == today_str:
+                    return today_str, last_count + 1
+        except:
+            pass
+        return today_str, 1
+
+
+def update_invoice_log(today_str, count):
+    log_file = BASE_DIR / "invoice_log.txt"
+    with counted_write(log_file), open(log_file, "w") as f:
+        f.write(f"{today_str}|{count}")
@@ -1,75 +1,44 @@
 import streamlit as st
-from pathlib import Path
+from page_tabs import tab_bar, run_tab
 import pandas as pd
 import datetime
-import os
+from sales_data import init_csv, load_data, save_data, format_rp
+from doc_index import get_doc_graph
+from ar_ledger import AGING_BUCKETS, get_ar_ledger
+from delivery_lines import backfill_do_lines, remaining_lines, create_delivery_orders, do_values, delivered_vs_ordered
+from item_master import get_item_master
+from stock_ledger import movements, post_movements
+from sales_batch import batch_delivery_orders, batch_sales_invoices
+from sales_import import read_import_file, prepare_import
 
 
 
 st.markdown("""
 <style>
-div[data-testid="stTabs"] { width: 100%; }
-div[data-testid="stTabs"] > div > div { display: flex; }
-button[data-testid="stTab"] { flex: 1; justify-content: center; font-weight: 600; }
 div.block-container { padding-top: 1rem; }
 .metric-card { background-color: #f0f2f6; padding: 15px; border-radius: 10px; margin-bottom: 10px;}
 </style>
 """, unsafe_allow_html=True)
 
 
-BASE_DIR = Path(__file__).resolve().parent
-DATA_DIR = BASE_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
-
-FILES = {
-    "customer": DATA_DIR / "Customer.csv",
-    "so": DATA_DIR / "SalesOrder.csv",
-    "do": DATA_DIR / "DeliveryOrder.csv",
-    "si": DATA_DIR / "SalesInvoice.csv",
-    "sr": DATA_DIR / "SalesReceipt.csv"
-}
-
-
-def init_csv():
-
-    if not FILES["customer"].exists():
-        pd.DataFrame(columns=["Nama Customer", "Contact Info"]).to_csv(FILES["customer"], index=False)
-    
-    if not FILES["so"].exists():
-        pd.DataFrame(columns=["Order_ID", "Date", "Customer", "Item", "Qty", "Price", "Total", "Status"]).to_csv(FILES["so"], index=False)
-    if not FILES["do"].exists():
-        pd.DataFrame(columns=["DO_ID", "Order_ID", "Date", "Customer", "Items_Summary", "Status"]).to_csv(FILES["do"], index=False)
-    if not FILES["si"].exists():
-        pd.DataFrame(columns=["Invoice_ID", "DO_ID", "Date", "Customer", "Total_Bill", "Paid_Amount", "Status"]).to_csv(FILES["si"], index=False)
-    if not FILES["sr"].exists():
-        pd.DataFrame(columns=["Receipt_ID", "Invoice_ID", "Date", "Customer", "Payment_Method", "Amount_Paid", "Notes"]).to_csv(FILES["sr"], index=False)
-
 init_csv()
+backfill_do_lines()
+doc_graph = get_doc_graph()
+doc_graph.refresh()
+ar_ledger = get_ar_ledger().refresh()
 
-
-def load_data(key):
-    df = pd.read_csv(FILES[key])
-
-    if key == "customer" and "Balance" in df.columns:
-        df = df.drop(columns=["Balance"])
-    return df
-
-def save_data(key, df):
-    df.to_csv(FILES[key], index=False)
-
-def format_rp(val):
-    return f"Rp {val:,.0f}".replace(',', '.')
-
-tabs = st.tabs([
+TAB_LABELS = [
     "Sales Order (SO)", 
     "Delivery Order (DO)", 
     "Sales Invoice (SI)", 
     "Sales Receipt (SR)", 
-    "Customer"
-])
+    "Customer",
+    "Piutang (AR)"
+]
+active_tab = tab_bar(TAB_LABELS, "sales_tab")
 
 
-with tabs[0]:
+def sales_order_tab():
     st.subheader("Sales Order")
     
     col1, col2 = st.columns([1, 2])
@@ -86,7 +55,7 @@ with tabs[0]:
         with st.form("add_item_so", clear_on_submit=True):
             selected_cust = st.selectbox("Pilih Customer", cust_list)
             so_date = st.date_input("Tanggal Order", datetime.date.today())
-            item_name = st.text_input("Nama Barang")
+            item_name = st.selectbox("Nama Barang", get_item_master().names(), index=None, accept_new_options=True, placeholder="Ketik nama barang...")
             qty = st.number_input("Qty", min_value=1, value=1)
             price = st.number_input("Harga Satuan", min_value=0.0, step=1000.0)
             
@@ -136,6 +105,8 @@ with tabs[0]:
                 
                 df_so = pd.concat([df_so, pd.DataFrame(new_rows)], ignore_index=True)
                 save_data("so", df_so)
+                doc_graph.add(new_id, "so", None, so_date, selected_cust, "Pending", grand_total)
+                doc_graph.mark_synced()
                 
                 st.session_state.cart = [] 
                 st.success(f"Sales Order {new_id} berhasil dibuat!")
@@ -143,6 +114,35 @@ with tabs[0]:
         else:
             st.info("Keranjang masih kosong.")
 
+    with st.expander("Import Sales Order dari File (CSV/Excel)"):
+        st.caption("Kolom wajib: `Customer`, `Item`, `Qty`, `Price`. Kolom `Date` opsional. Satu Order_ID dibuat per Customer + Tanggal.")
+        # key ikut counter: setelah disimpan, uploader kosong lagi dan file yang sama tidak tersimpan dua kali
+        import_key = f"so_import_file_{st.session_state.get('so_import_n', 0)}"
+        import_file = st.file_uploader("Upload File Order", type=["csv", "xlsx", "xls"], key=import_key)
+        if import_file is not None:
+            try:
+                df_import = read_import_file(import_file)
+                new_rows, import_errors = prepare_import(df_import, customers["Nama Customer"].tolist(), load_data("so"))
+            except Exception as e:
+                st.error(f"Error membaca file: {e}")
+            else:
+                c_ok, c_err, c_ord = st.columns(3)
+                c_ok.metric("Baris Valid", len(new_rows))
+                c_err.metric("Baris Error", len(import_errors))
+                c_ord.metric("Sales Order Baru", new_rows["Order_ID"].nunique())
+                if not import_errors.empty:
+                    st.dataframe(import_errors, use_container_width=True)
+                if not new_rows.empty and st.button("Simpan Semua Order", key="so_import_save"):
+                    df_so = pd.concat([load_data("so"), new_rows], ignore_index=True)
+                    save_data("so", df_so)
+                    for order_id, order in new_rows.groupby("Order_ID"):
+                        head = order.iloc[0]
+                        doc_graph.add(order_id, "so", None, head["Date"], head["Customer"], "Pending", order["Total"].sum())
+                    doc_graph.mark_synced()
+                    st.session_state["so_import_n"] = st.session_state.get("so_import_n", 0) + 1
+                    st.success(f"{new_rows['Order_ID'].nunique()} Sales Order berhasil diimport!")
+                    st.rerun()
+
     st.divider()
     st.write("### Riwayat Sales Order")
     df_so_display = load_data("so")
@@ -151,12 +151,13 @@ with tabs[0]:
         st.dataframe(grouped_so.style.format({"Total": "Rp {:,.0f}"}), use_container_width=True)
 
 
-with tabs[1]:
+def delivery_order_tab():
     st.subheader("Delivery Order")
     
     df_so = load_data("so")
+    df_dol = load_data("dol")
   
-    pending_so = df_so[df_so["Status"] == "Pending"]["Order_ID"].unique()
+    pending_so = sorted(doc_graph.ids_with_status("so", "Pending") + doc_graph.ids_with_status("so", "Partial"))
     
     col1, col2 = st.columns([1, 2])
     
@@ -167,55 +168,75 @@ with tabs[1]:
         
         if selected_so_id:
      
-            items_to_ship = df_so[df_so["Order_ID"] == selected_so_id]
+            items_to_ship = remaining_lines(df_so, df_dol, [selected_so_id])
             cust_name = items_to_ship["Customer"].iloc[0]
             st.write(f"**Customer:** {cust_name}")
-            
-
-            items_summary = ", ".join([f"{row['Item']} ({row['Qty']})" for _, row in items_to_ship.iterrows()])
-            
-            if st.button("Buat Surat Jalan (Delivery Order)"):
-                df_do = load_data("do")
-                new_do_id = f"DO-{len(df_do) + 1:03d}"
-                
-                new_row = pd.DataFrame([{
-                    "DO_ID": new_do_id,
-                    "Order_ID": selected_so_id,
-                    "Date": do_date,
-                    "Customer": cust_name,
-                    "Items_Summary": items_summary,
-                    "Status": "Shipped"
-                }])
-                
-                df_do = pd.concat([df_do, new_row], ignore_index=True)
-                save_data("do", df_do)
-                
-                df_so.loc[df_so["Order_ID"] == selected_so_id, "Status"] = "Delivered"
-                save_data("so", df_so)
-                
-                st.success(f"Delivery Order {new_do_id} berhasil dibuat!")
-                st.rerun()
 
     with col2:
         st.write("### Detail Barang yang akan dikirim")
         if selected_so_id:
-            st.dataframe(items_to_ship[["Item", "Qty"]], use_container_width=True)
+            edited_ship = st.data_editor(
+                items_to_ship[["Line_No", "Item", "Ordered", "Delivered", "Remaining"]].assign(Kirim=items_to_ship["Remaining"]),
+                disabled=["Line_No", "Item", "Ordered", "Delivered", "Remaining"],
+                column_config={"Kirim": st.column_config.NumberColumn("Qty Kirim", min_value=0, step=1)},
+                hide_index=True,
+                use_container_width=True,
+                key=f"ship_{selected_so_id}"
+            )
         else:
             st.write("Tidak ada order yang dipilih.")
+
+    with col1:
+        if selected_so_id and st.button("Buat Surat Jalan (Delivery Order)"):
+            ship_qty = edited_ship.assign(Order_ID=selected_so_id).set_index(["Order_ID", "Line_No"])["Kirim"]
+            df_do, df_so, df_dol, new_do, new_lines = create_delivery_orders(df_so, load_data("do"), df_dol, [selected_so_id], do_date, ship_qty)
+            if new_do.empty:
+                st.error("Qty kirim masih kosong.")
+            else:
+                save_data("dol", df_dol)
+                save_data("do", df_do)
+                save_data("so", df_so)
+                new_do_id = new_do["DO_ID"].iloc[0]
+                post_movements(movements(new_lines["Item"], -new_lines["Qty"].to_numpy(), "Delivery Order", new_do_id, do_date))
+                doc_graph.add(new_do_id, "do", selected_so_id, do_date, cust_name, "Shipped", do_values(df_so, df_dol).get(new_do_id, 0))
+                doc_graph.set_status(selected_so_id, df_so.loc[df_so["Order_ID"] == selected_so_id, "Status"].iloc[0])
+                doc_graph.mark_synced()
+
+                st.success(f"Delivery Order {new_do_id} berhasil dibuat!")
+                st.rerun()
+
+    with st.expander("Batch Delivery Order"):
+        batch_so_ids = st.multiselect("Pilih Sales Order (Pending)", pending_so, key="batch_so_ids")
+        if st.button("Buat Semua Surat Jalan", key="batch_do_btn", disabled=not batch_so_ids):
+            df_do, df_so, df_dol, new_do = batch_delivery_orders(df_so, load_data("do"), df_dol, batch_so_ids, do_date)
+            save_data("dol", df_dol)
+            save_data("do", df_do)
+            save_data("so", df_so)
+            new_lines = df_dol[df_dol["DO_ID"].isin(new_do["DO_ID"])]
+            values = do_values(df_so, new_lines)
+            moves = movements(new_lines["Item"], -new_lines["Qty"].to_numpy(), "Delivery Order", "", do_date)
+            moves["Ref"] = new_lines["DO_ID"].to_numpy()
+            post_movements(moves)
+            for do_id, so_id, cust in new_do[["DO_ID", "Order_ID", "Customer"]].itertuples(index=False):
+                doc_graph.add(do_id, "do", so_id, do_date, cust, "Shipped", values.get(do_id, 0))
+                doc_graph.set_status(so_id, "Delivered")
+            doc_graph.mark_synced()
+            st.success(f"{len(new_do)} Delivery Order berhasil dibuat!")
+            st.rerun()
             
     st.divider()
     st.write("### Daftar Surat Jalan (History)")
     st.dataframe(load_data("do"), use_container_width=True)
 
-with tabs[2]:
+    st.write("### Terkirim vs Dipesan")
+    st.dataframe(delivered_vs_ordered(df_so, df_dol), use_container_width=True, hide_index=True)
+
+def sales_invoice_tab():
     st.subheader("Sales Invoice")
     
     df_do = load_data("do")
-    df_so = load_data("so")
-    
     df_si = load_data("si")
-    invoiced_do_ids = df_si["DO_ID"].unique()
-    uninvoiced_dos = df_do[~df_do["DO_ID"].isin(invoiced_do_ids)]["DO_ID"].unique()
+    uninvoiced_dos = doc_graph.ids_without_children("do")
     
     col1, col2 = st.columns([1, 2])
     
@@ -226,10 +247,7 @@ with tabs[2]:
         
         if selected_do_id:
             do_data = df_do[df_do["DO_ID"] == selected_do_id].iloc[0]
-            so_id = do_data["Order_ID"]
-            
-            so_items = df_so[df_so["Order_ID"] == so_id]
-            total_bill = so_items["Total"].sum()
+            total_bill = doc_graph.amount(selected_do_id)
             
             st.write(f"**Customer:** {do_data['Customer']}")
             st.metric("Total Tagihan", format_rp(total_bill))
@@ -252,16 +270,34 @@ with tabs[2]:
                 
                 df_do.loc[df_do["DO_ID"] == selected_do_id, "Status"] = "Invoiced"
                 save_data("do", df_do)
+                doc_graph.add(new_inv_id, "si", selected_do_id, inv_date, do_data["Customer"], "Unpaid", total_bill)
+                doc_graph.set_status(selected_do_id, "Invoiced")
+                doc_graph.mark_synced()
+                ar_ledger.post_invoices([{"Invoice_ID": new_inv_id, "Customer": do_data["Customer"], "Date": inv_date, "Total_Bill": total_bill}])
                 
                 st.success(f"Invoice {new_inv_id} berhasil diterbitkan!")
                 st.rerun()
 
+        with st.expander("Batch Invoice"):
+            batch_do_ids = st.multiselect("Pilih Delivery Order", uninvoiced_dos, key="batch_do_ids")
+            if st.button("Generate Semua Invoice", key="batch_si_btn", disabled=not batch_do_ids):
+                df_si, df_do, new_si = batch_sales_invoices(load_data("so"), df_do, df_si, load_data("dol"), batch_do_ids, inv_date)
+                save_data("si", df_si)
+                save_data("do", df_do)
+                for inv_id, do_id, cust, bill in new_si[["Invoice_ID", "DO_ID", "Customer", "Total_Bill"]].itertuples(index=False):
+                    doc_graph.add(inv_id, "si", do_id, inv_date, cust, "Unpaid", bill)
+                    doc_graph.set_status(do_id, "Invoiced")
+                doc_graph.mark_synced()
+                ar_ledger.post_invoices(new_si[["Invoice_ID", "Customer", "Date", "Total_Bill"]].to_dict("records"))
+                st.success(f"{len(new_si)} Invoice berhasil diterbitkan!")
+                st.rerun()
+
     with col2:
         st.write("### Daftar Invoice")
         st.dataframe(load_data("si").style.format({"Total_Bill": "Rp {:,.0f}", "Paid_Amount": "Rp {:,.0f}"}), use_container_width=True)
 
 
-with tabs[3]:
+def sales_receipt_tab():
     st.subheader("Sales Receipt")
     
     df_si = load_data("si")
@@ -310,6 +346,10 @@ with tabs[3]:
                 df_si.loc[df_si["Invoice_ID"] == selected_inv_id, "Paid_Amount"] = new_total_paid
                 df_si.loc[df_si["Invoice_ID"] == selected_inv_id, "Status"] = status
                 save_data("si", df_si)
+                doc_graph.add(new_sr_id, "sr", selected_inv_id, pay_date, inv_data["Customer"], new_receipt["Notes"].iloc[0], pay_nominal)
+                doc_graph.set_status(selected_inv_id, status)
+                doc_graph.mark_synced()
+                ar_ledger.post_receipt(new_sr_id, selected_inv_id, inv_data["Customer"], pay_date, pay_nominal)
                 
                 st.success("Pembayaran berhasil disimpan!")
                 st.rerun()
@@ -319,7 +359,7 @@ with tabs[3]:
         st.dataframe(load_data("sr").style.format({"Amount_Paid": "Rp {:,.0f}"}), use_container_width=True)
 
 
-with tabs[4]:
+def customer_tab():
     st.subheader("Data Customer")
     
     data = load_data("customer")
@@ -343,4 +383,53 @@ with tabs[4]:
             new_row = pd.DataFrame([[cus, number]], columns=data.columns)  
             data = pd.concat([data, new_row], ignore_index=True)
             save_data("customer", data)
-            st.rerun()
\ No newline at end of file
+            st.rerun()
+    st.divider()
+    st.write("### Timeline Order per Customer")
+    timeline_cust = st.selectbox("Pilih Customer", data["Nama Customer"].tolist(), key="timeline_cust")
+    if timeline_cust:
+        df_timeline = doc_graph.timeline(timeline_cust)
+        if df_timeline.empty:
+            st.info("Customer ini belum punya Sales Order.")
+        else:
+            st.dataframe(df_timeline.style.format({"Nilai": "Rp {:,.0f}"}), use_container_width=True, hide_index=True)
+
+
+def piutang_ar_tab():
+    st.subheader("Piutang Customer (AR)")
+
+    st.write("### Umur Piutang")
+    df_ar_aging = ar_ledger.aging()
+    if df_ar_aging.empty:
+        st.info("Tidak ada piutang yang belum lunas.")
+    else:
+        st.dataframe(df_ar_aging.style.format({c: "Rp {:,.0f}" for c in AGING_BUCKETS + ["Total"]}), use_container_width=True, hide_index=True)
+
+    st.divider()
+    st.write("### Customer Statement")
+    col_st1, col_st2 = st.columns([1, 2])
+    with col_st1:
+        statement_cust = st.selectbox("Pilih Customer", sorted(ar_ledger.entries), key="statement_cust")
+        if statement_cust:
+            st.metric("Saldo Piutang", format_rp(ar_ledger.balances.get(statement_cust, 0)))
+        if st.button("Susun Ulang dari Invoice & Receipt", key="ar_rebuild"):
+            ar_ledger.build()
+            st.rerun()
+    with col_st2:
+        if statement_cust:
+            st.dataframe(
+                ar_ledger.statement(statement_cust).style.format({"Debit": "Rp {:,.0f}", "Credit": "Rp {:,.0f}", "Balance": "Rp {:,.0f}"}),
+                use_container_width=True,
+                hide_index=True
+            )
+
+
+TAB_VIEWS = dict(zip(TAB_LABELS, [
+    sales_order_tab,
+    delivery_order_tab,
+    sales_invoice_tab,
+    sales_receipt_tab,
+    customer_tab,
+    piutang_ar_tab,
+]))
+run_tab("Sales", TAB_VIEWS, active_tab)
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from delivery_lines import create_delivery_orders, do_values
+
+# ---------- Batch DO / SI generation ----------
+# Banyak SO / DO diproses sekaligus: baris kirim dan total tagihan dihitung
+# dengan satu groupby, hasilnya ditulis sekali per file.
+
+
+def _next_ids(prefix, existing_count, n):
+    return [f"{prefix}-{i:03d}" for i in range(existing_count + 1, existing_count + n + 1)]
+
+
+def batch_delivery_orders(df_so, df_do, df_dol, so_ids, do_date):
+    """Kirim seluruh sisa qty untuk setiap SO terpilih. Kembalikan (df_do, df_so, df_dol, baris DO baru)."""
+    df_do, df_so, df_dol, new_do, _ = create_delivery_orders(df_so, df_do, df_dol, so_ids, do_date)
+    return df_do, df_so, df_dol, new_do
+
+
+def batch_sales_invoices(df_so, df_do, df_si, df_dol, do_ids, inv_date):
+    """Buat satu invoice per DO terpilih. Kembalikan (df_si baru, df_do baru, baris SI baru)."""
+    dos = df_do[df_do["DO_ID"].isin(do_ids)].drop_duplicates("DO_ID")
+    values = do_values(df_so, df_dol[df_dol["DO_ID"].isin(dos["DO_ID"])])
+
+    new_si = pd.DataFrame({
+        "Invoice_ID": _next_ids("INV", len(df_si), len(dos)),
+        "DO_ID": dos["DO_ID"].to_numpy(),
+        "Date": inv_date,
+        "Customer": dos["Customer"].to_numpy(),
+        "Total_Bill": dos["DO_ID"].map(values).fillna(0).to_numpy(),
+        "Paid_Amount": np.zeros(len(dos)),
+        "Status": "Unpaid",
+    })
+    df_do = df_do.copy()
+    df_do.loc[df_do["DO_ID"].isin(new_si["DO_ID"]), "Status"] = "Invoiced"
+    return pd.concat([df_si, new_si], ignore_index=True), df_do, new_si
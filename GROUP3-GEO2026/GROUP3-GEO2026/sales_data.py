@@ -0,0 +1,54 @@
+import pandas as pd
+from pathlib import Path
+
+from profiling import timed
+
+# ---------- Shared sales file helpers ----------
+# Dipakai oleh sales.py dan modul lain yang membaca SO/DO/SI/SR.
+
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+DATA_DIR.mkdir(exist_ok=True)
+
+FILES = {
+    "customer": DATA_DIR / "Customer.csv",
+    "so": DATA_DIR / "SalesOrder.csv",
+    "do": DATA_DIR / "DeliveryOrder.csv",
+    "si": DATA_DIR / "SalesInvoice.csv",
+    "sr": DATA_DIR / "SalesReceipt.csv",
+    "dol": DATA_DIR / "DeliveryOrderLine.csv"
+}
+
+COLUMNS = {
+    "customer": ["Nama Customer", "Contact Info"],
+    "so": ["Order_ID", "Date", "Customer", "Item", "Qty", "Price", "Total", "Status"],
+    "do": ["DO_ID", "Order_ID", "Date", "Customer", "Items_Summary", "Status"],
+    "si": ["Invoice_ID", "DO_ID", "Date", "Customer", "Total_Bill", "Paid_Amount", "Status"],
+    "sr": ["Receipt_ID", "Invoice_ID", "Date", "Customer", "Payment_Method", "Amount_Paid", "Notes"],
+    "dol": ["DO_ID", "Order_ID", "Line_No", "Item", "Qty"],
+}
+
+
+def init_csv():
+    # DeliveryOrderLine.csv dibuat oleh delivery_lines.backfill_do_lines()
+    for key, cols in COLUMNS.items():
+        if key != "dol" and not FILES[key].exists():
+            pd.DataFrame(columns=cols).to_csv(FILES[key], index=False)
+
+
+@timed("load")
+def load_data(key, usecols=None):
+    df = pd.read_csv(FILES[key], usecols=usecols)
+
+    if key == "customer" and "Balance" in df.columns:
+        df = df.drop(columns=["Balance"])
+    return df
+
+
+@timed("save")
+def save_data(key, df):
+    df.to_csv(FILES[key], index=False)
+
+
+def format_rp(val):
+    return f"Rp {val:,.0f}".replace(',', '.')
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import datetime
+
+# ---------- Bulk Sales Order import ----------
+# File CSV/Excel berisi banyak baris order (banyak customer sekaligus).
+# Validasi dilakukan per kolom (vectorized), lalu setiap kombinasi
+# Customer + Tanggal mendapat satu Order_ID baru.
+
+REQUIRED_COLS = ["Customer", "Item", "Qty", "Price"]
+COLUMN_ALIASES = {
+    "customer": "Customer", "nama customer": "Customer", "pelanggan": "Customer",
+    "item": "Item", "nama barang": "Item", "barang": "Item",
+    "qty": "Qty", "jumlah": "Qty",
+    "price": "Price", "harga": "Price", "harga satuan": "Price",
+    "date": "Date", "tanggal": "Date", "tanggal order": "Date",
+}
+
+
+def read_import_file(uploaded_file):
+    name = getattr(uploaded_file, "name", str(uploaded_file)).lower()
+    if name.endswith((".xlsx", ".xls")):
+        return pd.read_excel(uploaded_file)
+    return pd.read_csv(uploaded_file)
+
+
+def normalize_columns(df):
+    df = df.copy()
+    df.columns = [COLUMN_ALIASES.get(str(c).strip().lower(), str(c).strip()) for c in df.columns]
+    return df.loc[:, ~df.columns.duplicated()]
+
+
+def validate_lines(df_raw, customer_names, default_date=None):
+    """Kembalikan (baris valid, baris error + kolom 'Error')."""
+    df = normalize_columns(df_raw)
+    missing = [c for c in REQUIRED_COLS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Kolom tidak ditemukan: {', '.join(missing)}")
+
+    default_date = default_date or datetime.date.today()
+    if "Date" not in df.columns:
+        df["Date"] = default_date
+
+    customer_key = pd.Series(customer_names, dtype=str).str.strip().str.lower()
+    canonical = dict(zip(customer_key, customer_names))
+    cust = df["Customer"].astype(str).str.strip().str.lower()
+    df["Customer"] = cust.map(canonical)
+    df["Item"] = df["Item"].astype(str).str.strip().where(df["Item"].notna(), "")
+    df["Qty"] = pd.to_numeric(df["Qty"], errors="coerce")
+    df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
+    dates = pd.to_datetime(df["Date"], errors="coerce")
+    df["Date"] = dates.fillna(pd.Timestamp(default_date)).dt.strftime("%Y-%m-%d")
+
+    checks = {
+        "Customer tidak terdaftar": df["Customer"].isna().to_numpy(),
+        "Nama barang kosong": (df["Item"] == "").to_numpy(),
+        "Qty harus bilangan bulat > 0": (df["Qty"].isna() | (df["Qty"] <= 0) | (df["Qty"] % 1 != 0)).to_numpy(),
+        "Harga tidak valid": (df["Price"].isna() | (df["Price"] < 0)).to_numpy(),
+    }
+    error_text = np.full(len(df), "", dtype=object)
+    for message, mask in checks.items():
+        error_text = np.where(mask, np.where(error_text == "", message, error_text + "; " + message), error_text)
+
+    bad = error_text != ""
+    errors = df_raw.loc[bad].copy()
+    errors["Error"] = error_text[bad]
+    valid = df.loc[~bad, ["Date", "Customer", "Item", "Qty", "Price"]].copy()
+    valid["Qty"] = valid["Qty"].astype(int)
+    return valid, errors
+
+
+def allocate_orders(valid, existing_order_ids):
+    """Beri Order_ID per (Customer, Date), melanjutkan penomoran SO yang sudah ada."""
+    start = len(pd.unique(existing_order_ids)) + 1
+    groups = valid.groupby(["Customer", "Date"], sort=False)
+    labels = np.array([f"SO-{n:03d}" for n in range(start, start + groups.ngroups)], dtype=object)
+    order_ids = labels[groups.ngroup().to_numpy()]
+    rows = valid.assign(Order_ID=order_ids, Total=valid["Qty"] * valid["Price"], Status="Pending")
+    return rows[["Order_ID", "Date", "Customer", "Item", "Qty", "Price", "Total", "Status"]].reset_index(drop=True)
+
+
+def prepare_import(df_raw, customer_names, df_so, default_date=None):
+    valid, errors = validate_lines(df_raw, customer_names, default_date)
+    new_rows = allocate_orders(valid, df_so["Order_ID"])
+    return new_rows, errors
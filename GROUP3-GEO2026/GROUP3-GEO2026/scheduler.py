@@ -0,0 +1,231 @@
+import heapq
+import threading
+import numpy as np
+import pandas as pd
+import streamlit as st
+from datetime import date
+from pathlib import Path
+
+# ---------- Process Stages scheduler (finite capacity) ----------
+# Setiap WO melewati tahapan (Routing.csv, default cutting -> sewing ->
+# embroidery -> finishing). Kapasitas satu tahap = jumlah "lane", yaitu
+# pasangan workstation (Workstation.csv) x operator (db_karyawan.csv per Posisi).
+# WO diambil dari priority queue (In Progress dulu, lalu due date), tiap operasi
+# masuk ke lane yang paling cepat kosong (heap per tahap). Waktu dihitung dalam
+# menit kerja sejak awal jadwal.
+# Karena WO dijadwalkan berurutan menurut prioritas, WO di depan tidak terpengaruh
+# WO di belakangnya: saat satu WO berubah, cukup jadwalkan ulang dari posisinya.
+# Satu scheduler dipakai bersama semua sesi (cache_resource), jadi method publik
+# memegang self.lock; versi _private dipanggil dari dalam lock.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ROUTING_FILE = BASE_DIR / "Routing.csv"
+WORKSTATION_FILE = BASE_DIR / "Workstation.csv"
+ROUTING_COLS = ["Product", "Seq", "Stage", "Minutes_Per_Unit", "Setup_Minutes"]
+WORKSTATION_COLS = ["Workstation", "Stage"]
+
+STAGES = ["Cutting", "Sewing", "Embroidery", "Finishing"]
+STAGE_POSITIONS = {
+    "Cutting": ["pemotong", "cutting", "tukang potong"],
+    "Sewing": ["penjahit", "sewing"],
+    "Embroidery": ["pembordir", "bordir", "embroidery"],
+    "Finishing": ["finishing", "qc", "packing"],
+}
+DEFAULT_ROUTING = [("Cutting", 2.0, 30.0), ("Sewing", 15.0, 15.0), ("Embroidery", 5.0, 20.0), ("Finishing", 3.0, 10.0)]
+
+WORK_DAY_MINUTES = 8 * 60
+DAY_START = pd.Timedelta(hours=8)
+WEEKMASK = "1111110"  # Senin - Sabtu
+
+
+def _read(path, cols):
+    if not path.exists():
+        return pd.DataFrame(columns=cols)
+    return pd.read_csv(path).reindex(columns=cols)
+
+
+def load_routing():
+    df = _read(ROUTING_FILE, ROUTING_COLS)
+    df[["Seq", "Minutes_Per_Unit", "Setup_Minutes"]] = df[["Seq", "Minutes_Per_Unit", "Setup_Minutes"]].apply(pd.to_numeric, errors="coerce").fillna(0)
+    return df.dropna(subset=["Product", "Stage"])
+
+
+def save_routing(df):
+    df.reindex(columns=ROUTING_COLS).dropna(subset=["Product", "Stage"]).to_csv(ROUTING_FILE, index=False)
+
+
+def load_workstations():
+    return _read(WORKSTATION_FILE, WORKSTATION_COLS).dropna(subset=["Workstation", "Stage"])
+
+
+def save_workstations(df):
+    df.reindex(columns=WORKSTATION_COLS).dropna(subset=["Workstation", "Stage"]).to_csv(WORKSTATION_FILE, index=False)
+
+
+def routes_by_product(routing):
+    """{product: [(stage, menit/unit, setup), ...]} urut Seq."""
+    routing = routing.sort_values(["Product", "Seq"])
+    return {p: list(zip(g["Stage"], g["Minutes_Per_Unit"], g["Setup_Minutes"])) for p, g in routing.groupby("Product")}
+
+
+def stage_lanes(karyawan, workstations):
+    """
+    {stage: [(workstation, operator), ...]}. Tanpa data workstation untuk suatu
+    tahap, tiap operator dianggap punya workstation sendiri.
+    """
+    posisi = karyawan["Posisi"].astype(str).str.strip().str.lower()
+    lanes = {}
+    for stage in STAGES:
+        operators = karyawan.loc[posisi.isin(STAGE_POSITIONS[stage]), "Nama Lengkap"].astype(str).tolist()
+        ws = workstations.loc[workstations["Stage"] == stage, "Workstation"].astype(str).tolist()
+        if not ws:
+            ws = [f"{stage} {i + 1}" for i in range(len(operators))]
+        n = min(len(ws), len(operators))
+        lanes[stage] = list(zip(ws[:n], operators[:n]))
+    return lanes
+
+
+class StageScheduler:
+    def __init__(self, routes, lanes, start=None):
+        self.routes = routes
+        self.lanes = lanes
+        self.lock = threading.RLock()
+        self.start = pd.Timestamp(start or date.today()).normalize()
+        self.entries = []      # (key, WO_ID, signature) per posisi prioritas
+        self.ops = []          # list operasi per posisi
+        self.checkpoints = []  # status lane sebelum WO di posisi tsb dijadwalkan
+        self.state = self._empty_state()
+
+    def _empty_state(self):
+        return {stage: [(0.0, i) for i in range(len(lanes))] for stage, lanes in self.lanes.items()}
+
+    @staticmethod
+    def _queue(work_orders):
+        """Urutkan WO lewat heap: In Progress dulu, lalu due date terdekat, lalu WO_ID."""
+        heap = []
+        for row in work_orders[["WO_ID", "Product", "Qty", "Due_Date", "Status"]].itertuples(index=False):
+            due = str(row.Due_Date) if pd.notna(row.Due_Date) else "9999-12-31"
+            key = (0 if row.Status == "In Progress" else 1, due, str(row.WO_ID))
+            heapq.heappush(heap, (key, str(row.WO_ID), (str(row.Product), float(row.Qty), due), row))
+        return [heapq.heappop(heap) for _ in range(len(heap))]
+
+    def _schedule_one(self, entry):
+        _, wo_id, (product, qty, due), _ = entry
+        ready = 0.0
+        ops = []
+        for seq, (stage, per_unit, setup) in enumerate(self.routes.get(product, DEFAULT_ROUTING), start=1):
+            heap = self.state.get(stage)
+            if not heap:
+                # tahap tanpa kapasitas: WO berhenti di sini
+                ops.append((wo_id, product, qty, due, seq, stage, -1, np.nan, np.nan))
+                break
+            free, lane = heapq.heappop(heap)
+            begin = max(free, ready)
+            ready = begin + setup + per_unit * qty
+            heapq.heappush(heap, (ready, lane))
+            ops.append((wo_id, product, qty, due, seq, stage, lane, begin, ready))
+        return ops
+
+    def _run_from(self, queue, k):
+        for entry in queue[k:]:
+            self.checkpoints.append({s: list(h) for s, h in self.state.items()})
+            self.entries.append(entry[:3])
+            self.ops.append(self._schedule_one(entry))
+
+    def schedule(self, work_orders):
+        """Jadwal penuh dari nol."""
+        with self.lock:
+            return self._schedule(work_orders)
+
+    def _schedule(self, work_orders):
+        self.entries, self.ops, self.checkpoints = [], [], []
+        self.state = self._empty_state()
+        self._run_from(self._queue(work_orders), 0)
+        return len(self.entries)
+
+    def update(self, work_orders):
+        """
+        Jadwal ulang incremental: cari posisi pertama yang berbeda (WO baru,
+        berubah qty / due date / status, atau dihapus), kembalikan status lane
+        dari checkpoint posisi itu, lalu jadwalkan sisanya. Kembalikan jumlah WO
+        yang dijadwalkan ulang.
+        """
+        with self.lock:
+            return self._update(work_orders)
+
+    def _update(self, work_orders):
+        queue = self._queue(work_orders)
+        k = 0
+        limit = min(len(queue), len(self.entries))
+        while k < limit and queue[k][:3] == self.entries[k]:
+            k += 1
+        if k == len(queue) == len(self.entries):
+            return 0
+        if k < len(self.checkpoints):
+            self.state = self.checkpoints[k]
+        del self.entries[k:], self.ops[k:], self.checkpoints[k:]
+        self._run_from(queue, k)
+        return len(queue) - k
+
+    def to_datetime(self, minutes):
+        """Menit kerja sejak start -> tanggal & jam (hari kerja Senin-Sabtu, 08:00-16:00)."""
+        minutes = np.asarray(minutes, dtype=float)
+        ok = ~np.isnan(minutes)
+        days = np.zeros(len(minutes), dtype=int)
+        days[ok] = minutes[ok] // WORK_DAY_MINUTES
+        day = np.busday_offset(np.datetime64(self.start.date()), days, roll="forward", weekmask=WEEKMASK)
+        out = pd.to_datetime(day) + DAY_START + pd.to_timedelta(np.where(ok, minutes % WORK_DAY_MINUTES, 0), unit="min")
+        return out.where(ok)
+
+    def _raw(self):
+        cols = ["WO_ID", "Product", "Qty", "Due_Date", "Seq", "Stage", "Lane", "Start_Min", "End_Min"]
+        df = pd.DataFrame([op for ops in self.ops for op in ops], columns=cols)
+        lane_info = {(s, i): info for s, lanes in self.lanes.items() for i, info in enumerate(lanes)}
+        info = [lane_info.get(k, ("-", "-")) for k in zip(df["Stage"], df["Lane"])]
+        df["Workstation"] = [w for w, _ in info]
+        df["Operator"] = [o for _, o in info]
+        df.loc[df["Lane"] < 0, "Workstation"] = "Tidak ada kapasitas"
+        return df
+
+    def table(self):
+        with self.lock:
+            return self._table()
+
+    def _table(self):
+        df = self._raw()
+        df["Start"] = self.to_datetime(df["Start_Min"])
+        df["End"] = self.to_datetime(df["End_Min"])
+        due = pd.to_datetime(df["Due_Date"], errors="coerce") + pd.Timedelta(days=1)
+        df["Terlambat"] = df["End"] > due
+        return df[["WO_ID", "Product", "Qty", "Seq", "Stage", "Workstation", "Operator", "Start", "End", "Due_Date", "Terlambat"]]
+
+    def utilization(self):
+        """Menit kerja terpakai per lane dan persentasenya terhadap panjang jadwal."""
+        with self.lock:
+            return self._utilization()
+
+    def _utilization(self):
+        df = self._raw()
+        df = df[df["Lane"] >= 0]
+        busy = (df["End_Min"] - df["Start_Min"]).groupby([df["Stage"], df["Workstation"], df["Operator"]]).sum()
+        util = busy.rename("Menit").reset_index()
+        span = df["End_Min"].max() if len(df) else 0
+        util["Utilisasi %"] = (util["Menit"] / span * 100).round(1) if span else 0.0
+        return util
+
+
+def _signature():
+    from payroll_store import FILE_KARYAWAN
+    return tuple(p.stat().st_mtime if p.exists() else None for p in [ROUTING_FILE, WORKSTATION_FILE, FILE_KARYAWAN])
+
+
+@st.cache_resource(max_entries=1)
+def _get_scheduler(signature, start):
+    from payroll_store import get_payroll_store
+    lanes = stage_lanes(get_payroll_store().karyawan, load_workstations())
+    return StageScheduler(routes_by_product(load_routing()), lanes, start)
+
+
+def get_scheduler():
+    """Satu scheduler per proses; dibuat ulang bila routing, workstation, karyawan atau tanggal berubah."""
+    return _get_scheduler(_signature(), str(date.today()))
@@ -0,0 +1,81 @@
+import pandas as pd
+from pathlib import Path
+
+from stock_ledger import LEDGER_COLS, load_on_hand, post_movements
+
+# ---------- Stock count (inventory taking) ----------
+# Hasil hitung fisik per sesi Inventory Taking disimpan di StockCount.csv.
+# Selisih terhadap saldo sistem dihitung dengan satu merge, lalu penyesuaian
+# diposting ke stock ledger dalam satu batch.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+SESSION_FILE = BASE_DIR / "Inventory.csv"
+COUNT_FILE = BASE_DIR / "StockCount.csv"
+COUNT_COLS = ["Session_ID", "Item", "Warehouse", "Counted_Qty"]
+COUNT_ALIASES = {
+    "item": "Item", "item name": "Item", "nama item": "Item", "nama barang": "Item",
+    "item code": "Item Code", "kode": "Item Code",
+    "counted": "Counted_Qty", "counted_qty": "Counted_Qty", "qty": "Counted_Qty", "jumlah": "Counted_Qty", "hasil hitung": "Counted_Qty",
+}
+
+
+def session_id(row_no):
+    return f"CNT-{row_no + 1:03d}"
+
+
+def load_sessions():
+    df = pd.read_csv(SESSION_FILE)
+    df.insert(0, "Session_ID", [session_id(i) for i in range(len(df))])
+    return df
+
+
+def normalize_counts(df_raw, item_master=None):
+    """Terima kolom Item atau Item Code + Counted_Qty; baris dengan item sama dijumlahkan."""
+    df = df_raw.copy()
+    df.columns = [COUNT_ALIASES.get(str(c).strip().lower(), str(c).strip()) for c in df.columns]
+    if "Item" not in df.columns and "Item Code" in df.columns and item_master is not None:
+        names = item_master.df.set_index("Item Code")["Item Name"]
+        df["Item"] = df["Item Code"].astype(str).str.strip().map(names)
+    if "Item" not in df.columns or "Counted_Qty" not in df.columns:
+        raise ValueError("File harus punya kolom Item (atau Item Code) dan Counted_Qty.")
+    df["Item"] = df["Item"].astype(str).str.strip()
+    df["Counted_Qty"] = pd.to_numeric(df["Counted_Qty"], errors="coerce")
+    df = df[df["Item"].ne("") & df["Item"].ne("nan") & df["Counted_Qty"].notna()]
+    return df.groupby("Item", as_index=False)["Counted_Qty"].sum()
+
+
+def compute_variance(counts, warehouse, on_hand=None):
+    """Satu merge: counted vs system untuk item yang dihitung di gudang tsb."""
+    on_hand = load_on_hand() if on_hand is None else on_hand
+    system = on_hand[on_hand["Warehouse"] == warehouse][["Item", "Qty"]].rename(columns={"Qty": "System_Qty"})
+    var = counts[["Item", "Counted_Qty"]].merge(system, on="Item", how="left")
+    var["System_Qty"] = pd.to_numeric(var["System_Qty"], errors="coerce").fillna(0)
+    var["Variance"] = var["Counted_Qty"] - var["System_Qty"]
+    var.insert(1, "Warehouse", warehouse)
+    return var
+
+
+def save_counts(sid, variance):
+    rows = variance.assign(Session_ID=sid)[COUNT_COLS]
+    if COUNT_FILE.exists():
+        existing = pd.read_csv(COUNT_FILE)
+        rows = pd.concat([existing[existing["Session_ID"] != sid], rows], ignore_index=True)
+    rows.to_csv(COUNT_FILE, index=False)
+
+
+def post_adjustments(sid, variance, count_date):
+    """Posting semua selisih sebagai satu batch pergerakan stok, lalu tandai sesi 'Posted'."""
+    adj = variance[variance["Variance"] != 0]
+    moves = pd.DataFrame({
+        "Date": str(count_date), "Item": adj["Item"].to_numpy(), "Warehouse": adj["Warehouse"].to_numpy(),
+        "Qty": adj["Variance"].to_numpy(), "Source": "Stock Count", "Ref": sid,
+    }, columns=LEDGER_COLS)
+    save_counts(sid, variance)
+    post_movements(moves)
+
+    sessions = pd.read_csv(SESSION_FILE)
+    row_no = int(sid.split("-")[1]) - 1
+    if "Status" in sessions.columns and 0 <= row_no < len(sessions):
+        sessions.loc[sessions.index[row_no], "Status"] = "Posted"
+        sessions.to_csv(SESSION_FILE, index=False)
+    return len(moves)
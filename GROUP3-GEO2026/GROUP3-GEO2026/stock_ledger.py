@@ -0,0 +1,187 @@
+import sys
+import threading
+import pandas as pd
+import streamlit as st
+from datetime import date
+from pathlib import Path
+
+from csv_txn import CsvTransaction
+from profiling import timed
+
+# ---------- Stock ledger ----------
+# StockLedger.csv   : semua pergerakan stok (+ masuk, - keluar), append-only.
+# StockOnHand.csv   : saldo per item & gudang, di-update setiap ada pergerakan.
+# StockSnapshot.csv : saldo per tanggal snapshot, untuk query stok per tanggal.
+#                     Ledger_Rows = jumlah baris ledger saat snapshot; query per
+#                     tanggal hanya membaca baris ledger sesudahnya. Snapshot
+#                     dengan semua saldo 0 ditulis sebagai satu baris penanda
+#                     (Item kosong).
+# Posting membaca saldo lalu menulis saldo baru; _POST_LOCK dipegang dari baca
+# saldo sampai transaksinya commit, supaya dua sesi tidak saling menimpa saldo.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+LEDGER_FILE = BASE_DIR / "StockLedger.csv"
+ON_HAND_FILE = BASE_DIR / "StockOnHand.csv"
+SNAPSHOT_FILE = BASE_DIR / "StockSnapshot.csv"
+
+DEFAULT_WAREHOUSE = "Utama"
+LEDGER_COLS = ["Date", "Item", "Warehouse", "Qty", "Source", "Ref"]
+ON_HAND_COLS = ["Item", "Warehouse", "Qty"]
+SNAPSHOT_COLS = ["Snapshot_Date", "Ledger_Rows", "Item", "Warehouse", "Qty"]
+SNAPSHOT_EVERY_DAYS = 30
+
+_POST_LOCK = threading.RLock()
+
+
+@timed("load")
+def _read(path, cols):
+    if not path.exists():
+        return pd.DataFrame(columns=cols)
+    return pd.read_csv(path).reindex(columns=cols)
+
+
+def _sum_by_key(df):
+    df = df.assign(Qty=pd.to_numeric(df["Qty"], errors="coerce").fillna(0))
+    return df.groupby(["Item", "Warehouse"])["Qty"].sum()
+
+
+def _file_signature(path):
+    return (str(path), path.stat().st_mtime_ns, path.stat().st_size) if path.exists() else (str(path), None, None)
+
+
+@st.cache_data
+def _load_on_hand(signature):
+    return _read(ON_HAND_FILE, ON_HAND_COLS)
+
+
+def load_on_hand():
+    """Saldo on-hand; cache ikut mtime file (rebuild / tulisan proses lain ikut terbaca)."""
+    return _load_on_hand(_file_signature(ON_HAND_FILE))
+
+
+def load_ledger():
+    return _read(LEDGER_FILE, LEDGER_COLS)
+
+
+@timed("load")
+def _ledger_rows(start=0, stop=None, usecols=None):
+    """Baris ledger ke-[start, stop) tanpa mem-parse baris di luar rentang."""
+    if not LEDGER_FILE.exists() or (stop is not None and stop <= start):
+        return pd.DataFrame(columns=usecols or LEDGER_COLS)
+    df = pd.read_csv(
+        LEDGER_FILE, usecols=usecols, skiprows=range(1, start + 1) if start else None,
+        nrows=None if stop is None else stop - start,
+    )
+    return df.reindex(columns=usecols or LEDGER_COLS)
+
+
+def _ledger_rows_at(positions):
+    """Baris ledger pada posisi tertentu saja."""
+    if len(positions) == 0:
+        return pd.DataFrame(columns=LEDGER_COLS)
+    wanted = {int(p) + 1 for p in positions}
+    return pd.read_csv(LEDGER_FILE, skiprows=lambda i: i > 0 and i not in wanted).reindex(columns=LEDGER_COLS)
+
+
+def _on_hand_frame(series):
+    return series[series != 0].rename("Qty").reset_index()[ON_HAND_COLS]
+
+
+@timed("save")
+def _save_on_hand(series):
+    _on_hand_frame(series).to_csv(ON_HAND_FILE, index=False)
+    _load_on_hand.clear()
+
+
+def movements(items, qty, source, ref, move_date=None, warehouse=DEFAULT_WAREHOUSE):
+    """Bangun DataFrame pergerakan dari list item & qty (qty negatif = keluar)."""
+    df = pd.DataFrame({"Item": pd.Series(items, dtype=str).str.strip(), "Qty": qty})
+    df["Date"] = str(move_date or date.today())
+    df["Warehouse"] = warehouse
+    df["Source"] = source
+    df["Ref"] = ref
+    return df[LEDGER_COLS]
+
+
+@timed("save")
+def post_movements(moves, tx=None):
+    """
+    Catat pergerakan ke ledger lalu update saldo on-hand secara incremental.
+    Ledger & saldo ditulis dalam satu transaksi; bila tx diberikan, ikut
+    transaksi pemanggil (di-commit bersama dokumen sumbernya); lock saldo
+    dipegang sampai transaksi itu commit.
+    """
+    moves = moves[LEDGER_COLS]
+    moves = moves[pd.to_numeric(moves["Qty"], errors="coerce").fillna(0) != 0]
+    if moves.empty:
+        return
+    if tx is None:
+        with CsvTransaction() as tx:
+            return post_movements(moves, tx)
+    tx.hold(_POST_LOCK)
+    on_hand = _sum_by_key(load_on_hand()).add(_sum_by_key(moves), fill_value=0)
+    tx.append(LEDGER_FILE, moves)
+    tx.replace(ON_HAND_FILE, _on_hand_frame(on_hand))
+    tx.on_commit(_load_on_hand.clear)
+    # Snapshot sengaja di luar transaksi: hanya optimasi query per tanggal,
+    # gagal / terlewat tidak membuat ledger & saldo tidak konsisten.
+    tx.on_commit(lambda: _maybe_snapshot(on_hand))
+
+
+def rebuild_on_hand():
+    """Hitung ulang saldo on-hand dari seluruh ledger."""
+    with _POST_LOCK:
+        on_hand = _sum_by_key(load_ledger())
+        _save_on_hand(on_hand)
+    return load_on_hand()
+
+
+def take_snapshot(snapshot_date=None, on_hand=None):
+    on_hand = _sum_by_key(load_on_hand()) if on_hand is None else on_hand
+    snap = on_hand[on_hand != 0].rename("Qty").reset_index()
+    if snap.empty:
+        snap = pd.DataFrame([{"Item": "", "Warehouse": "", "Qty": 0}])
+    snap.insert(0, "Snapshot_Date", str(snapshot_date or date.today()))
+    snap.insert(1, "Ledger_Rows", len(_ledger_rows(usecols=["Date"])))
+    snap[SNAPSHOT_COLS].to_csv(SNAPSHOT_FILE, mode="a", header=not SNAPSHOT_FILE.exists(), index=False)
+
+
+def _maybe_snapshot(on_hand):
+    snaps = _read(SNAPSHOT_FILE, SNAPSHOT_COLS)
+    last = pd.to_datetime(snaps["Snapshot_Date"]).max() if not snaps.empty else None
+    if last is None or (pd.Timestamp(date.today()) - last).days >= SNAPSHOT_EVERY_DAYS:
+        take_snapshot(on_hand=on_hand)
+
+
+def stock_as_of(as_of):
+    """
+    Saldo per item & gudang pada akhir tanggal as_of. Mulai dari snapshot
+    terakhir <= as_of, lalu koreksi dengan baris ledger sesudah snapshot
+    (yang bertanggal <= as_of) dan baris sebelum snapshot yang bertanggal > as_of.
+    """
+    as_of = pd.Timestamp(as_of)
+    snaps = _read(SNAPSHOT_FILE, SNAPSHOT_COLS)
+    snaps["Snapshot_Date"] = pd.to_datetime(snaps["Snapshot_Date"])
+    usable = snaps[snaps["Snapshot_Date"] <= as_of]
+    if usable.empty:
+        base = _sum_by_key(pd.DataFrame(columns=LEDGER_COLS))
+        n_rows = 0
+    else:
+        last = usable[usable["Snapshot_Date"] == usable["Snapshot_Date"].max()]
+        n_rows = int(last["Ledger_Rows"].max())
+        last = last[(last["Ledger_Rows"] == n_rows) & last["Item"].notna() & (last["Item"].astype(str) != "")]
+        base = _sum_by_key(last)
+
+    after = _ledger_rows(n_rows)
+    after = after[pd.to_datetime(after["Date"], errors="coerce") <= as_of]
+    # Baris sebelum snapshot yang bertanggal sesudah as_of: cukup baca kolom Date dulu
+    head_dates = pd.to_datetime(_ledger_rows(0, n_rows, usecols=["Date"])["Date"], errors="coerce")
+    before_future = _ledger_rows_at((head_dates > as_of).to_numpy().nonzero()[0])
+    result = base.add(_sum_by_key(after), fill_value=0).sub(_sum_by_key(before_future), fill_value=0)
+    return result[result != 0].rename("Qty").reset_index()
+
+
+if __name__ == "__main__":
+    # python stock_ledger.py rebuild
+    if sys.argv[1:] == ["rebuild"]:
+        print(rebuild_on_hand())
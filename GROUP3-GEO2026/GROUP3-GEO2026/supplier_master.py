@@ -0,0 +1,140 @@
+import re
+import pandas as pd
+import streamlit as st
+
+from purchasing_data import BASE_DIR, COL_SUP, COL_ALM, sup_files
+
+# ---------- Supplier master ----------
+# Satu tabel untuk semua supplier. Kolom "Kategori" berisi daftar kategori
+# (dipisah ";") sehingga supplier yang sama (mis. Bintang Mas) cukup satu baris.
+# Saat pertama kali dipakai, tabel dibentuk dari 8 file supplier lama.
+
+MASTER_FILE = BASE_DIR / "Supplier Master.csv"
+COL_ID = "Supplier_ID"
+COL_KAT = "Kategori"
+MASTER_COLS = [COL_ID, COL_SUP, COL_ALM, COL_KAT]
+
+
+def normalize_name(name):
+    return re.sub(r"\s+", " ", re.sub(r"[^0-9a-z&() ]", " ", str(name).lower())).strip()
+
+
+def split_categories(value):
+    return [c for c in str(value).split(";") if c] if pd.notna(value) else []
+
+
+def _read_legacy_supplier_file(path):
+    df = pd.read_csv(path)
+    df.columns = df.columns.str.strip()
+    rename = {}
+    for col in df.columns:
+        key = col.lower().strip()
+        if "supplier" in key:
+            rename[col] = COL_SUP
+        elif "alamat" in key:
+            rename[col] = COL_ALM
+    df = df.rename(columns=rename)
+    df = df.loc[:, ~df.columns.duplicated()]
+    if COL_SUP not in df.columns and len(df.columns):
+        df = df.rename(columns={df.columns[0]: COL_SUP})
+    for col in [COL_SUP, COL_ALM]:
+        if col not in df.columns:
+            df[col] = ""
+    return df[[COL_SUP, COL_ALM]].dropna(subset=[COL_SUP])
+
+
+def build_master_from_files():
+    rows = {}
+    for category, file_name in sup_files.items():
+        path = BASE_DIR / file_name
+        if not path.exists():
+            continue
+        for name, alamat in _read_legacy_supplier_file(path).itertuples(index=False):
+            key = normalize_name(name)
+            if not key:
+                continue
+            row = rows.setdefault(key, {COL_SUP: str(name).strip(), COL_ALM: "", COL_KAT: []})
+            if pd.notna(alamat) and str(alamat).strip() and not row[COL_ALM]:
+                row[COL_ALM] = str(alamat).strip()
+            if category not in row[COL_KAT]:
+                row[COL_KAT].append(category)
+
+    records = []
+    for i, row in enumerate(rows.values(), start=1):
+        records.append({COL_ID: f"SUP-{i:03d}", COL_SUP: row[COL_SUP], COL_ALM: row[COL_ALM], COL_KAT: ";".join(row[COL_KAT])})
+    return pd.DataFrame(records, columns=MASTER_COLS)
+
+
+@st.cache_data
+def load_supplier_master():
+    if not MASTER_FILE.exists():
+        build_master_from_files().to_csv(MASTER_FILE, index=False)
+    df = pd.read_csv(MASTER_FILE, dtype=str).fillna("")
+    for col in MASTER_COLS:
+        if col not in df.columns:
+            df[col] = ""
+    return df[MASTER_COLS]
+
+
+@st.cache_data
+def supplier_name_index():
+    df = load_supplier_master()
+    return dict(zip(df[COL_SUP].map(normalize_name), df[COL_ID]))
+
+
+@st.cache_data
+def supplier_options(category):
+    df = load_supplier_master()
+    mask = df[COL_KAT].map(lambda v: category in split_categories(v))
+    return df.loc[mask, COL_SUP].tolist()
+
+
+def suppliers_in_category(category):
+    df = load_supplier_master()
+    return df[df[COL_KAT].map(lambda v: category in split_categories(v))].copy()
+
+
+def save_supplier_master(df):
+    df[MASTER_COLS].to_csv(MASTER_FILE, index=False)
+    load_supplier_master.clear()
+    supplier_name_index.clear()
+    supplier_options.clear()
+
+
+def _next_supplier_id(df):
+    nums = pd.to_numeric(df[COL_ID].str.replace("SUP-", "", regex=False), errors="coerce")
+    return f"SUP-{int(nums.max() if nums.notna().any() else 0) + 1:03d}"
+
+
+def add_supplier(name, alamat, category):
+    """Tambah supplier ke kategori. Kalau nama sudah ada, hanya kategori yang ditambahkan."""
+    df = load_supplier_master().copy()
+    sup_id = supplier_name_index().get(normalize_name(name))
+    if sup_id is None:
+        sup_id = _next_supplier_id(df)
+        new_row = pd.DataFrame([[sup_id, name.strip(), alamat, category]], columns=MASTER_COLS)
+        df = pd.concat([df, new_row], ignore_index=True)
+    else:
+        mask = df[COL_ID] == sup_id
+        cats = split_categories(df.loc[mask, COL_KAT].iloc[0])
+        if category not in cats:
+            cats.append(category)
+        df.loc[mask, COL_KAT] = ";".join(cats)
+        if alamat and not df.loc[mask, COL_ALM].iloc[0]:
+            df.loc[mask, COL_ALM] = alamat
+    save_supplier_master(df)
+    return sup_id
+
+
+def remove_supplier(sup_id, category):
+    """Hapus supplier dari kategori; baris master ikut dihapus kalau tidak punya kategori lagi."""
+    df = load_supplier_master().copy()
+    mask = df[COL_ID] == sup_id
+    if not mask.any():
+        return
+    cats = [c for c in split_categories(df.loc[mask, COL_KAT].iloc[0]) if c != category]
+    if cats:
+        df.loc[mask, COL_KAT] = ";".join(cats)
+    else:
+        df = df[~mask]
+    save_supplier_master(df)
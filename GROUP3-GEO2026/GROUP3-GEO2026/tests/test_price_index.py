@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import price_index
+from purchasing_data import COL_TGL, COL_SUP, COL_ITM, COL_QTY, COL_HRG
+
+ROW = {COL_TGL: "2026-01-05", COL_SUP: "PT Kain Jaya", COL_ITM: "Kain Katun", COL_QTY: "5 roll", COL_HRG: "Rp 120.000"}
+
+
+def test_po_and_invoice_give_same_unit_price(tmp_path, monkeypatch):
+    pd.DataFrame([ROW]).to_csv(tmp_path / "po.csv", index=False)
+    pd.DataFrame([{**ROW, "Kategori": "Bahan Baku Utama (Kain)"}]).to_csv(tmp_path / "purchase_invoice.csv", index=False)
+    monkeypatch.setattr(price_index, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(price_index, "INVOICE_FILE", tmp_path / "purchase_invoice.csv")
+    monkeypatch.setattr(price_index, "po_files", {"Bahan Baku Utama (Kain)": "po.csv"})
+
+    obs = price_index._load_observations()
+    po = obs[obs["Kategori"] != "Invoice"]["unit_price"].tolist()
+    inv = obs[obs["Kategori"] == "Invoice"]["unit_price"].tolist()
+    assert po == inv == [120000]
+    assert set(obs["unit"]) == {"roll"}
@@ -0,0 +1,40 @@
+import pandas as pd
+from datetime import date
+from pathlib import Path
+
+# ---------- Work Order ----------
+# WorkOrder.csv: satu baris per Work Order produksi.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+WO_FILE = BASE_DIR / "WorkOrder.csv"
+WO_COLS = ["WO_ID", "Date", "Product", "Qty", "Due_Date", "Status"]
+OPEN_STATUSES = ["Planned", "Released", "In Progress"]
+
+
+def load_work_orders():
+    if not WO_FILE.exists():
+        return pd.DataFrame(columns=WO_COLS)
+    df = pd.read_csv(WO_FILE).reindex(columns=WO_COLS)
+    df["Qty"] = pd.to_numeric(df["Qty"], errors="coerce").fillna(0)
+    return df
+
+
+def save_work_orders(df):
+    df[WO_COLS].to_csv(WO_FILE, index=False)
+
+
+def add_work_orders(products, qtys, due_dates, status="Planned", wo_date=None):
+    """Tambah banyak WO sekaligus; kembalikan baris WO baru."""
+    df = load_work_orders()
+    start = len(df) + 1
+    new = pd.DataFrame({"Product": products, "Qty": qtys, "Due_Date": due_dates})
+    new.insert(0, "WO_ID", [f"WO-{i:04d}" for i in range(start, start + len(new))])
+    new.insert(1, "Date", str(wo_date or date.today()))
+    new["Status"] = status
+    save_work_orders(pd.concat([df, new[WO_COLS]], ignore_index=True))
+    return new[WO_COLS]
+
+
+def open_work_orders(df=None):
+    df = load_work_orders() if df is None else df
+    return df[df["Status"].isin(OPEN_STATUSES)]